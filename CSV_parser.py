@@ -3,15 +3,20 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 import numpy as np
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
 from helper_funcs import *
+from gui_widgets import FilteredListbox, matplotlib_tk
 
 class CSVParserTab(ttk.Frame):
-    def __init__(self, parent, *args, **kwargs):
+    # Memory cap for memoized conversions (see ConversionCache)
+    CONVERT_CACHE_MB = 512
+
+    def __init__(self, parent, *args, registry=None, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
+        # Cross-tab signal registry (converted arrays are published by reference)
+        self.registry = registry if registry is not None else shared_signal_registry()
+
         self._build_vars()
         self._build_ui()
 
@@ -23,8 +28,14 @@ class CSVParserTab(ttk.Frame):
         self.db_raw_ila = {}
         self.db_raw_stp = {}
         # Active raw DB
-        self.db_raw = {}
-        self.db_converted = {}
+        self.db_raw = SignalStore()
+        self.db_converted = SignalStore(budget=shared_memory_budget())
+        self.publish_status_var = tk.StringVar(value="")
+
+        # Memoized convert_db() results keyed on source + conversion parameters
+        self.conv_cache = ConversionCache(self.CONVERT_CACHE_MB * 1024 * 1024)
+        # Cached outputs follow their stored record when it is spilled / faulted in
+        self.db_converted.budget.add_listener(self.conv_cache.refresh_record)
 
         self.csv_kind_var = tk.StringVar(value="unknown")
 
@@ -46,6 +57,10 @@ class CSVParserTab(ttk.Frame):
         self.exp_bits_var = tk.StringVar(value="6")
         self.man_bits_var = tk.StringVar(value="13")
 
+        # Bit-field layout (data type "4"): compiled plan + display name
+        self.bit_layout_plan = None
+        self.bit_layout_var = tk.StringVar(value="(no layout)")
+
         self.data_par_var      = tk.StringVar(value="1")
         self.data_par_mode_var = tk.StringVar(value="serial")
 
@@ -69,6 +84,11 @@ class CSVParserTab(ttk.Frame):
 
         self.convert_name_var = tk.StringVar(value="")
 
+        # Conversion plan: JSON rules + compiled form, see compile_conversion_plan()
+        self.conv_plan_rules = []
+        self.conv_plan = []
+        self.conv_plan_var = tk.StringVar(value="0 rule(s)")
+
         self.combine_mode_var = tk.StringVar(value="ri")
         self.combine_swap_var = tk.BooleanVar(value=False)
 
@@ -137,17 +157,8 @@ class CSVParserTab(ttk.Frame):
             row=1, column=0, sticky="w", padx=5, pady=(5, 0)
         )
 
-        input_frame = ttk.Frame(sec2)
-        input_frame.grid(row=2, column=0, sticky="nsew", padx=5, pady=(0, 5))
-
-        self.signals_listbox = tk.Listbox(input_frame, selectmode="extended", height=8)
-        self.signals_listbox.grid(row=0, column=0, sticky="nsew")
-        scroll = ttk.Scrollbar(input_frame, orient="vertical", command=self.signals_listbox.yview)
-        scroll.grid(row=0, column=1, sticky="ns")
-        self.signals_listbox.config(yscrollcommand=scroll.set)
-
-        input_frame.columnconfigure(0, weight=1)
-        input_frame.rowconfigure(0, weight=1)
+        self.signals_listbox = FilteredListbox(sec2, selectmode="extended", height=8)
+        self.signals_listbox.grid(row=2, column=0, sticky="nsew", padx=5, pady=(0, 5))
 
         settings = ttk.Frame(sec2)
         settings.grid(row=3, column=0, sticky="ew", padx=5, pady=5)
@@ -181,10 +192,22 @@ class CSVParserTab(ttk.Frame):
         ttk.Entry(float_row, width=4, textvariable=self.exp_bits_var).pack(side="left", padx=(19, 0))
         ttk.Entry(float_row, width=4, textvariable=self.man_bits_var).pack(side="left", padx=4)
 
+        asis_row = ttk.Frame(settings)
+        asis_row.grid(row=3, column=0, sticky="w", pady=(1, 5))
+
         self.rb_asis = ttk.Radiobutton(
-            settings, text="As-is", variable=self.data_type_var, value="3"
+            asis_row, text="As-is", variable=self.data_type_var, value="3"
         )
-        self.rb_asis.grid(row=3, column=0, sticky="w", pady=(1, 5))
+        self.rb_asis.pack(side="left")
+
+        self.rb_layout = ttk.Radiobutton(
+            asis_row, text="Bit layout", variable=self.data_type_var, value="4"
+        )
+        self.rb_layout.pack(side="left", padx=(12, 2))
+        ttk.Button(asis_row, text="Load layout…", command=self.load_bit_layout_file).pack(
+            side="left", padx=(4, 0)
+        )
+        ttk.Label(asis_row, textvariable=self.bit_layout_var).pack(side="left", padx=(6, 0))
 
         ttk.Checkbutton(settings, text="Complex data (I/Q)", variable=self.complex_var).grid(
             row=4, column=0, columnspan=2, sticky="w", pady=5
@@ -315,10 +338,16 @@ class CSVParserTab(ttk.Frame):
             text="Even/Odd",
             variable=self.combine_mode_var,
             value="eo",
+        ).pack(side="left", padx=(2, 2))
+        ttk.Radiobutton(
+            combine_row,
+            text="Polyphase",
+            variable=self.combine_mode_var,
+            value="poly",
         ).pack(side="left", padx=(2, 4))
         ttk.Checkbutton(
             combine_row,
-            text="Swap roles (1→2)",
+            text="Swap roles (reverse order)",
             variable=self.combine_swap_var,
         ).pack(side="left", padx=(4, 0))
 
@@ -340,6 +369,18 @@ class CSVParserTab(ttk.Frame):
             side="left", padx=(6, 0)
         )
 
+        ttk.Separator(btn_row, orient="vertical").pack(side="left", fill="y", padx=8)
+
+        ttk.Label(btn_row, text="Plan:").pack(side="left")
+        ttk.Label(btn_row, textvariable=self.conv_plan_var).pack(side="left", padx=(4, 6))
+        ttk.Button(btn_row, text="Add selected", command=self.plan_add_selected).pack(side="left")
+        ttk.Button(btn_row, text="Clear", command=self.plan_clear).pack(side="left", padx=(4, 0))
+        ttk.Button(btn_row, text="Load…", command=self.plan_load).pack(side="left", padx=(4, 0))
+        ttk.Button(btn_row, text="Save…", command=self.plan_save).pack(side="left", padx=(4, 0))
+        ttk.Button(btn_row, text="Convert by plan", command=self.convert_by_plan).pack(
+            side="left", padx=(6, 0)
+        )
+
         ttk.Label(settings, textvariable=self.convert_status_var).grid(
             row=11, column=0, sticky="w", pady=(2, 0)
         )
@@ -366,6 +407,11 @@ class CSVParserTab(ttk.Frame):
 
         self.converted_listbox.bind("<Double-Button-1>", self.show_converted_signal)
 
+        pub_row = ttk.Frame(sec2)
+        pub_row.grid(row=6, column=0, sticky="w", padx=5, pady=(0, 5))
+        ttk.Button(pub_row, text="Send to DSP-MAT-Lab", command=self.publish_converted).pack(side="left")
+        ttk.Label(pub_row, textvariable=self.publish_status_var).pack(side="left", padx=(6, 0))
+
         # Section 3
         sec3 = ttk.LabelFrame(self, text="3. Write converted data to files")
         sec3.pack(fill="x", padx=10, pady=5)
@@ -474,113 +520,7 @@ class CSVParserTab(ttk.Frame):
 
     # --- Section 1 actions ---
 
-    def load_signals_from_stp_csv(self, csv_path: Path, name_filter: str = "") -> dict:
-        name_filter_l = (name_filter or "").strip().lower()
-
-        with open(csv_path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = [ln.rstrip("\n") for ln in f]
-
-        # ---- Locate sections + collect "signals_list" from Groups: ----
-        data_idx = None
-        groups_idx = None
-
-        for i, ln in enumerate(lines):
-            s = ln.strip().lower()
-            if s == "groups:":
-                groups_idx = i
-            if s == "data:":
-                data_idx = i
-                break  # important: stop scanning header sections once Data: starts
-
-        if data_idx is None:
-            raise ValueError("Not a Quartus SignalTap CSV: missing 'Data:' section.")
-        if data_idx + 1 >= len(lines):
-            raise ValueError("STP CSV is missing header row after 'Data:' section.")
-
-        # signals_list: set of signal names defined in Groups section
-        signals_list = set()
-        if groups_idx is not None:
-            # Between "Groups:" and "Data:" there are lines like:
-            #   some_signal_name=...
-            # We only take the left side of '='
-            for ln in lines[groups_idx + 1: data_idx]:
-                if "=" not in ln:
-                    continue
-                left = ln.split("=", 1)[0].strip()
-                if left:
-                    signals_list.add(left)
-
-        # ---- Parse Data header row ----
-        header_all = [t.strip() for t in lines[data_idx + 1].split(",") if t.strip() != ""]
-        if len(header_all) < 2:
-            raise ValueError("STP CSV header is too short.")
-
-        # First column is time; remaining are signal columns
-        sig_names_all = header_all[1:]
-
-        # Apply signals_list filter ONLY if we actually found any signals in Groups:
-        if signals_list:
-            sig_names = [n for n in sig_names_all if n in signals_list]
-        else:
-            sig_names = sig_names_all
-
-        if not sig_names:
-            raise ValueError("No matching STP signals found (after applying signals_list filter).")
-
-        cols = {name: [] for name in sig_names}
-
-        # ---- Parse data rows ----
-        # We need mapping from name -> original column index in the CSV row
-        name_to_col = {name: (1 + sig_names_all.index(name)) for name in sig_names}
-
-        for ln in lines[data_idx + 2:]:
-            if not ln.strip():
-                continue
-            toks = [t.strip() for t in ln.split(",")]
-            if len(toks) < 2:
-                continue
-
-            # For safety: pad rows
-            need = 1 + len(sig_names_all)
-            if len(toks) < need:
-                toks += [""] * (need - len(toks))
-
-            for name, col_idx in name_to_col.items():
-                v = toks[col_idx].strip() if col_idx < len(toks) else ""
-                if v == "":
-                    v = "X"
-                cols[name].append(v)
-
-        def split_on_x(samples):
-            segs, curr = [], []
-            for v in samples:
-                if str(v).strip().upper() == "X":
-                    if curr:
-                        segs.append(curr)
-                        curr = []
-                else:
-                    curr.append(v)
-            if curr:
-                segs.append(curr)
-            return segs
-
-        db = {}
-        for idx, name in enumerate(sig_names):
-            if name_filter_l and name_filter_l not in name.lower():
-                continue
-
-            segs = split_on_x(cols.get(name, []))
-            if not segs:
-                continue
-
-            if len(segs) == 1:
-                db[name] = {"idx": idx, "samples": segs[0]}
-            else:
-                for k, seg in enumerate(segs):
-                    db[f"{name}__seg{k}"] = {"idx": idx, "samples": seg}
-
-        return db
-
+    @profiled("csv.load_stp", items=lambda r, *a, **k: db_sample_count(r))
     def browse_csv(self):
         filename = filedialog.askopenfilename(
             title="Select ILA/STP CSV",
@@ -609,6 +549,7 @@ class CSVParserTab(ttk.Frame):
         self.search_status_var.set(msg)
         messagebox.showinfo("Detect file type", msg)
 
+    @profiled("csv_tab.search")
     def search_signals(self):
         csv_path = Path(self.csv_path_var.get().strip())
         if not csv_path.is_file():
@@ -622,22 +563,23 @@ class CSVParserTab(ttk.Frame):
 
         try:
             if kind == "quartus_stp":
-                db = self.load_signals_from_stp_csv(csv_path, name_filter)
+                db = SignalStore(load_signals_from_stp_csv(csv_path, name_filter))
                 self.db_raw_stp = db
                 self.db_raw_ila = {}
             else:
-                db = load_signals_from_csv(csv_path, name_filter)
+                db = SignalStore(load_signals_from_csv(csv_path, name_filter))
                 self.db_raw_ila = db
                 self.db_raw_stp = {}
         except Exception as e:
-            self.db_raw = {}
-            self.signals_listbox.delete(0, tk.END)
+            self.db_raw = SignalStore()
+            self.signals_listbox.set_items([])
             self.search_status_var.set(f"Error: {e}")
             messagebox.showerror("Error", str(e))
             return
 
         self.db_raw = db
-        self.db_converted = {}
+        self.db_converted.clear()
+        self.conv_cache.clear()
         self.convert_status_var.set("")
         self.write_status_var.set("")
         self.converted_listbox.delete(0, tk.END)
@@ -656,96 +598,113 @@ class CSVParserTab(ttk.Frame):
 
     # --- Section 2 actions ---
 
+    @profiled("csv_tab.signals_listbox")
     def _refresh_signals_listbox(self):
         """Refresh the input signals listbox according to name_display_mode."""
-        # If we haven't loaded anything yet, nothing to do
-        self.signals_listbox.delete(0, tk.END)
-
-        mode = self.name_display_mode.get()
-        for full in self.signals_full_names:
-            if mode == "short":
-                disp = full.split("/")[-1]
-            else:
-                disp = full
-            self.signals_listbox.insert(tk.END, disp)
-
-    def convert_data(self):
-        if not self.db_raw:
-            messagebox.showerror("Error", "No signals loaded. Run Search first.")
-            return
-
-        selection = self.signals_listbox.curselection()
-        if not selection:
-            messagebox.showerror("Error", "Please select at least one signal to convert.")
-            return
+        if self.name_display_mode.get() == "short":
+            display = [full.split("/")[-1] for full in self.signals_full_names]
+        else:
+            display = None
 
-        selected_names = [self.signals_full_names[i] for i in selection]
+        self.signals_listbox.set_items(self.signals_full_names, display)
 
-        # Handle optional valid signal
-        # Optional VALID filter (same logic as convert_data)
-        use_valid = getattr(self, "use_valid_var", None)
-        use_sop = getattr(self, "use_sop_var", None)
-        use_eop = getattr(self, "use_eop_var", None)
+    def _active_filter_names(self):
+        """Return (valid_name, sop_name, eop_name) for the enabled filters ('' if unused)."""
         valid_name, sop_name, eop_name = "", "", ""
-        if use_valid is not None and self.use_valid_var.get():
+        if self.use_valid_var.get():
             valid_name = self.valid_signal_var.get().strip()
-        if use_sop is not None and self.use_sop_var.get():
+        if self.use_sop_var.get():
             sop_name = self.sop_signal_var.get().strip()
-        if use_eop is not None and self.use_eop_var.get():
+        if self.use_eop_var.get():
             eop_name = self.eop_signal_var.get().strip()
+        return valid_name, sop_name, eop_name
 
-        db_selected = {}
+    def _packet_index(self, selected_names):
+        """
+        Check the enabled VALID/SOP/EOP filters against the selected raw signals
+        and compute their packet index once.
+        Returns (filter_key, packets, multi_packets), packets None when no VALID
+        signal is selected, or None after reporting an error.
+        """
+        valid_name, sop_name, eop_name = self._active_filter_names()
+        if not valid_name:
+            return (), None, False
 
-        if use_valid and valid_name:
-            if valid_name not in self.db_raw:
-                messagebox.showerror("Error", f"Valid signal '{valid_name}' not found.")
-                return
+        for role, nm in (("Valid", valid_name), ("SOP", sop_name), ("EOP", eop_name)):
+            if nm and nm not in self.db_raw:
+                messagebox.showerror("Error", f"{role} signal '{nm}' not found.")
+                return None
 
-            valid_samples = self.db_raw[valid_name]["samples"]
+        valid_samples = self.db_raw[valid_name]["samples"]
+        sop_samples = self.db_raw[sop_name]["samples"] if sop_name else []
+        eop_samples = self.db_raw[eop_name]["samples"] if eop_name else []
 
-            sop_samples, eop_samples = [], []
-            if sop_name != "":
-                sop_samples = self.db_raw[sop_name]["samples"]
-            if eop_name != "":
-                eop_samples = self.db_raw[eop_name]["samples"]
+        L_valid = len(valid_samples)
+        for name in selected_names:
+            L_sig = len(self.db_raw[name]["samples"])
+            if L_sig != L_valid:
+                messagebox.showerror(
+                    "Length mismatch",
+                    f"Signal '{name}' has {L_sig} samples but valid signal "
+                    f"'{valid_name}' has {L_valid}.\nThey must be the same length."
+                )
+                return None
 
-            L_valid = len(valid_samples)
+        # Filter samples where valid == 1, optional sop and eop
+        packets = build_packet_index(L_valid, valid_samples, sop_samples, eop_samples)
+        multi_packets = self.packet_output_var.get() == "multi"
+        return (valid_name, sop_name, eop_name, multi_packets), packets, multi_packets
 
-            for name in selected_names:
-                sig_info = self.db_raw[name]
-                sig_samples = sig_info["samples"]
-                L_sig = len(sig_samples)
+    def _filter_selected(self, selected_names):
+        """
+        Apply the optional VALID/SOP/EOP filters to the selected raw signals.
+        The packet/valid index is computed once and shared by every signal.
+        Returns db_selected, or None after reporting an error.
+        """
+        index = self._packet_index(selected_names)
+        if index is None:
+            return None
+        filter_key, packets, multi_packets = index
 
-                if L_sig != L_valid:
-                    messagebox.showerror(
-                        "Length mismatch",
-                        f"Signal '{name}' has {L_sig} samples but valid signal "
-                        f"'{valid_name}' has {L_valid}.\nThey must be the same length."
-                    )
-                    return
+        # cache_key identifies source samples + filter selection for the conversion cache
+        if packets is None:
+            # No valid signal selected -> use all samples
+            return {
+                name: dict(self.db_raw[name], cache_key=(name, self.db_raw.version(name)))
+                for name in selected_names
+            }
 
-                # Filter samples where valid == 1, optional sop and eop
-                multi_packets = (getattr(self, "packet_output_var", None) is not None) and (self.packet_output_var.get() == "multi")
-
-                if multi_packets:
-                    packets = filter_data_packets_list(sig_samples, valid_samples, sop_samples, eop_samples)
-                    for k, pkt in enumerate(packets):
-                        pkt_name = f"{name}__pkt{k}"
-                        db_selected[pkt_name] = {
-                            "idx": sig_info["idx"],
-                            "samples": pkt,
-                        }
-                else:
-                    filtered = filter_data_all_packets(sig_samples, valid_samples, sop_samples, eop_samples)
-                    db_selected[name] = {
+        if not multi_packets:
+            flat_idx = np.concatenate(packets) if packets else np.zeros(0, dtype=np.int64)
+
+        db_selected = {}
+        for name in selected_names:
+            sig_info = self.db_raw[name]
+            sig_samples = sig_info["samples"]
+
+            source_key = (name, self.db_raw.version(name)) + filter_key
+
+            if multi_packets:
+                for k, idx in enumerate(packets):
+                    db_selected[f"{name}__pkt{k}"] = {
                         "idx": sig_info["idx"],
-                        "samples": filtered,
+                        "samples": take_samples(sig_samples, idx),
+                        "cache_key": source_key + (k,),
                     }
+            else:
+                db_selected[name] = {
+                    "idx": sig_info["idx"],
+                    "samples": take_samples(sig_samples, flat_idx),
+                    "cache_key": source_key,
+                }
 
-        else:
-            # No valid signal selected -> use all samples
-            db_selected = {name: self.db_raw[name] for name in selected_names}
+        return db_selected
 
+    def _read_conversion_settings(self):
+        """
+        Read Section 2 type/precision/concatenation settings.
+        Returns (data_type, data_prec, data_complex, data_par, data_par_mode) or None.
+        """
         data_type = self.data_type_var.get()
 
         try:
@@ -760,6 +719,12 @@ class CSVParserTab(ttk.Frame):
                 man_bits = int(self.man_bits_var.get())
                 data_prec = [exp_bits, man_bits]
                 data_complex = ""  # not used
+            elif data_type == "4":  # Bit layout
+                if self.bit_layout_plan is None:
+                    messagebox.showerror("Error", "No bit layout loaded. Use 'Load layout…' first.")
+                    return None
+                data_prec = self.bit_layout_plan
+                data_complex = ""  # per-field / complex pairs come from the layout
             else:  # As-is
                 data_prec = []
                 data_complex = ""
@@ -769,71 +734,279 @@ class CSVParserTab(ttk.Frame):
 
         except ValueError:
             messagebox.showerror("Error", "Precision fields must be integers.")
-            return
+            return None
 
-        try:
-            converted_batch = convert_db(db_selected, data_type, data_prec, data_complex, data_par, data_par_mode)
-
-            # ---- Naming scheme for converted signals ----
-            base_name = (self.convert_name_var.get() or "").strip()
-
-            # Initialize accumulator the first time
-            if not hasattr(self, "db_converted") or self.db_converted is None:
-                self.db_converted = {}
-
-            def _unique_name(name: str) -> str:
-                if name not in self.db_raw and name not in self.db_converted:
-                    return name
-                k = 1
-                while True:
-                    candidate = f"{name}_{k}"
-                    if candidate not in self.db_raw and candidate not in self.db_converted:
-                        return candidate
-                    k += 1
-
-            orig_items = list(converted_batch.items())
-            renamed_batch = {}
-
-            if base_name:
-                if len(orig_items) == 1:
-                    name0 = _unique_name(base_name)
-                    orig, info = orig_items[0]
-                    info = dict(info)
-                    info["source"] = orig
-                    renamed_batch[name0] = info
-                else:
-                    for i, (orig, info) in enumerate(orig_items):
-                        nm = _unique_name(f"{base_name}_{i}")
-                        info = dict(info)
-                        info["source"] = orig
-                        renamed_batch[nm] = info
+        return data_type, data_prec, data_complex, data_par, data_par_mode
+
+    def _merge_converted(self, converted_batch):
+        """
+        Rename a converted batch (Converted name / sig_{i}) and merge it into the DBs.
+        Outputs served from the conversion cache that are already listed (same
+        conversion key, whatever their samples look like after a spill) keep
+        their existing name instead of adding another copy.
+        Returns the number of reused outputs.
+        """
+        # ---- Naming scheme for converted signals ----
+        base_name = (self.convert_name_var.get() or "").strip()
+
+        # Initialize accumulator the first time
+        if not hasattr(self, "db_converted") or self.db_converted is None:
+            self.db_converted = SignalStore(budget=shared_memory_budget())
+
+        listed = {rec.conv_key for rec in self.db_converted.records() if rec.conv_key is not None}
+        fresh = {
+            orig: info for orig, info in converted_batch.items()
+            if info.get("conv_key") is None or info["conv_key"] not in listed
+        }
+        reused = len(converted_batch) - len(fresh)
+        converted_batch = fresh
+
+        def _unique_name(name: str) -> str:
+            if name not in self.db_raw and name not in self.db_converted:
+                return name
+            k = 1
+            while True:
+                candidate = f"{name}_{k}"
+                if candidate not in self.db_raw and candidate not in self.db_converted:
+                    return candidate
+                k += 1
+
+        orig_items = list(converted_batch.items())
+        renamed_batch = {}
+
+        if base_name:
+            if len(orig_items) == 1:
+                name0 = _unique_name(base_name)
+                orig, info = orig_items[0]
+                info = dict(info)
+                info["source"] = orig
+                renamed_batch[name0] = info
             else:
                 for i, (orig, info) in enumerate(orig_items):
-                    nm = _unique_name(f"sig_{i}")
+                    nm = _unique_name(f"{base_name}_{i}")
                     info = dict(info)
                     info["source"] = orig
                     renamed_batch[nm] = info
+        else:
+            for i, (orig, info) in enumerate(orig_items):
+                nm = _unique_name(f"sig_{i}")
+                info = dict(info)
+                info["source"] = orig
+                renamed_batch[nm] = info
+
+        # ---- Merge into accumulated DB (do NOT delete existing) ----
+        # Converted arrays live only in db_converted, under its memory budget
+        self.db_converted.update(renamed_batch)
+        return reused
+
+    @profiled("csv_tab.publish")
+    def publish_converted(self):
+        """Hand the selected (or all) converted signals to the DSP tab by reference."""
+        if not self.db_converted:
+            messagebox.showerror("Error", "No converted data. Run Convert first.")
+            return
 
-            # ---- Merge into accumulated DBs (do NOT delete existing) ----
-            self.db_converted.update(renamed_batch)
-            self.db_raw.update(renamed_batch)
+        selection = self.converted_listbox.curselection()
+        if selection:
+            names = [self.converted_listbox.get(i) for i in selection]
+        else:
+            names = sorted(self.db_converted.keys())
+
+        published = self.registry.publish(
+            {name: self.db_converted.peek(name) for name in names},
+            origin=self,
+            suffix="ila",
+        )
+        renamed = sum(1 for name, stored in published.items() if name != stored)
+        msg = f"Sent {len(published)} signal(s) to DSP-MAT-Lab"
+        if renamed:
+            msg += f" ({renamed} renamed to avoid clashes)"
+        self.publish_status_var.set(msg + ".")
+
+    @profiled("csv_tab.converted_listbox")
+    def _refresh_converted_listbox(self):
+        self.converted_listbox.delete(0, tk.END)
+        names = sorted(self.db_converted.keys())
+        if names:
+            self.converted_listbox.insert(tk.END, *names)
+
+    @profiled("csv_tab.convert")
+    def convert_data(self):
+        if not self.db_raw:
+            messagebox.showerror("Error", "No signals loaded. Run Search first.")
+            return
+
+        selected_names = self.signals_listbox.selected_items()
+        if not selected_names:
+            messagebox.showerror("Error", "Please select at least one signal to convert.")
+            return
+
+        db_selected = self._filter_selected(selected_names)
+        if db_selected is None:
+            return
+
+        settings = self._read_conversion_settings()
+        if settings is None:
+            return
+
+        try:
+            converted_batch = convert_db(db_selected, *settings, cache=self.conv_cache)
+            reused = self._merge_converted(converted_batch)
         except Exception as e:
             messagebox.showerror("Conversion error", str(e))
             return
 
-        if use_valid and valid_name:
+        cached = f", {reused} already converted" if reused else ""
+        valid_name = self._active_filter_names()[0]
+        if valid_name:
             self.convert_status_var.set(
-                f"Converted {len(self.db_converted)} signal(s) using valid='{valid_name}'."
+                f"Converted {len(self.db_converted)} signal(s) using valid='{valid_name}'{cached}."
             )
         else:
             self.convert_status_var.set(
-                f"Converted {len(self.db_converted)} signal(s)."
+                f"Converted {len(self.db_converted)} signal(s){cached}."
             )
 
         # Update converted signals listbox
-        self.converted_listbox.delete(0, tk.END)
-        for sig in sorted(self.db_converted.keys()):
-            self.converted_listbox.insert(tk.END, sig)
+        self._refresh_converted_listbox()
+
+    # --- Conversion plans (per-signal settings, one batch) ---
+
+    def _current_plan_rule(self, name):
+        """Describe the current Section 2 settings as a JSON plan rule for signal 'name'."""
+        settings = self._read_conversion_settings()
+        if settings is None:
+            return None
+        data_type, data_prec, data_complex, data_par, data_par_mode = settings
+
+        type_name = {"1": "fixed", "2": "float", "3": "as-is", "4": "layout"}[data_type]
+        rule = {"name": name, "type": type_name}
+        if data_type == "4":
+            rule["layout"] = data_prec["layout"]
+        elif data_type in ("1", "2"):
+            rule["prec"] = list(data_prec)
+        if data_type == "1":
+            rule["complex"] = data_complex == "y"
+        rule["data_par"] = data_par
+        rule["mode"] = data_par_mode
+        return rule
+
+    def plan_add_selected(self):
+        """Add one rule per selected input signal using the current Section 2 settings."""
+        selected_names = self.signals_listbox.selected_items()
+        if not selected_names:
+            messagebox.showerror("Plan", "Select the input signals this rule applies to.")
+            return
+
+        new_rules = []
+        for name in selected_names:
+            rule = self._current_plan_rule(name)
+            if rule is None:
+                return
+            new_rules.append(rule)
+
+        # Later rules for the same signal replace earlier ones
+        replaced = {r["name"] for r in new_rules}
+        rules = [r for r in self.conv_plan_rules if r.get("name") not in replaced] + new_rules
+        self._set_conversion_plan(rules)
+
+    def _set_conversion_plan(self, rules, base_dir=None):
+        try:
+            compiled = compile_conversion_plan(rules, base_dir=base_dir)
+        except Exception as e:
+            messagebox.showerror("Plan", str(e))
+            return False
+        self._apply_conversion_plan(rules, compiled)
+        return True
+
+    def _apply_conversion_plan(self, rules, compiled):
+        self.conv_plan_rules = rules
+        self.conv_plan = compiled
+        self.conv_plan_var.set(f"{len(rules)} rule(s)")
+
+    def plan_clear(self):
+        self._set_conversion_plan([])
+
+    def plan_load(self):
+        path = filedialog.askopenfilename(
+            title="Load conversion plan",
+            filetypes=[("JSON", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            rules, compiled = load_conversion_plan(path)
+        except Exception as e:
+            messagebox.showerror("Plan", f"Failed to read plan:\n{e}")
+            return
+        self._apply_conversion_plan(rules, compiled)
+
+    def plan_save(self):
+        if not self.conv_plan_rules:
+            messagebox.showinfo("Plan", "Conversion plan is empty.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save conversion plan",
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            save_conversion_plan(self.conv_plan_rules, path)
+        except Exception as e:
+            messagebox.showerror("Plan", str(e))
+
+    @profiled("csv_tab.convert_plan")
+    def convert_by_plan(self):
+        """Convert every selected (or, if none, every loaded) signal with its matching plan rule."""
+        if not self.db_raw:
+            messagebox.showerror("Error", "No signals loaded. Run Search first.")
+            return
+        if not self.conv_plan:
+            messagebox.showerror("Plan", "Conversion plan is empty. Add or load rules first.")
+            return
+
+        candidates = self.signals_listbox.selected_items() or list(self.signals_full_names)
+        assignments = resolve_conversion_plan(self.conv_plan, candidates)
+        if not assignments:
+            messagebox.showwarning("Plan", "No signal matches the conversion plan.")
+            return
+
+        db_selected = self._filter_selected(list(assignments))
+        if db_selected is None:
+            return
+
+        try:
+            converted_batch = convert_batch(db_selected, assignments, cache=self.conv_cache)
+            self._merge_converted(converted_batch)
+        except Exception as e:
+            messagebox.showerror("Conversion error", str(e))
+            return
+
+        self.convert_status_var.set(
+            f"Plan converted {len(assignments)} of {len(candidates)} signal(s) "
+            f"-> {len(converted_batch)} output(s)."
+        )
+        self._refresh_converted_listbox()
+
+    def load_bit_layout_file(self):
+        """Load a bit-field layout JSON and compile it once for Convert."""
+        path = filedialog.askopenfilename(
+            title="Load bit layout",
+            filetypes=[("JSON", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            plan = load_bit_layout(path)
+        except Exception as e:
+            messagebox.showerror("Bit layout", f"Failed to load layout:\n{e}")
+            return
+
+        self.bit_layout_plan = plan
+        self.bit_layout_var.set(f"{plan['name']} ({len(plan['fields'])} fields)")
+        self.data_type_var.set("4")
 
     def show_converted_signal(self, event):
         """Open a window showing the full data array of the double-clicked converted signal."""
@@ -844,6 +1017,8 @@ class CSVParserTab(ttk.Frame):
         sig_name = self.converted_listbox.get(selection[0])
         info = self.db_converted.get(sig_name, {})
         samples = info.get("samples", [])
+        if isinstance(samples, np.ndarray) and samples.dtype.kind == "S":
+            samples = samples.astype(str)
 
         win = tk.Toplevel(self)
         win.title(f"Data for {sig_name}")
@@ -867,21 +1042,19 @@ class CSVParserTab(ttk.Frame):
 
         text.configure(state="disabled")
 
+    @profiled("csv_tab.combine")
     def combine_selected_signals(self):
-        """Combine two input signals into one (Real/Imag or Even/Odd) and store as converted."""
+        """
+        Combine N input signals (or the lanes of one Parallel-mode signal) into one
+        stream (Real/Imag, Even/Odd interleave or polyphase) and store as converted.
+        """
         if not self.db_raw:
             messagebox.showerror("Error", "No signals loaded. Run Search first.")
             return
 
-        selection = self.signals_listbox.curselection()
-        if len(selection) != 2:
-            messagebox.showerror(
-                "Error",
-                "Please select exactly TWO input signals (left list) to combine."
-            )
-            return
+        names = self.signals_listbox.selected_items()
 
-        # Get combine settings (same as convert_data)
+        # Get combine settings
         mode = self.combine_mode_var.get()
         # Get conversion settings (same as convert_data)
         data_type = self.data_type_var.get()
@@ -889,12 +1062,24 @@ class CSVParserTab(ttk.Frame):
         data_par_mode = self.data_par_mode_var.get()
 
         if data_par_mode == "parallel":
+            if not names:
+                messagebox.showerror(
+                    "Error",
+                    "Please select at least ONE input signal (left list) to combine its parallel lanes."
+                )
+                return
+        elif len(names) < 2:
             messagebox.showerror(
                 "Error",
-                "Cannot combine two paralleled signals into one signal. Check the 'Serial' par mode."
+                "Please select at least TWO input signals (left list) to combine.\n"
+                "To combine the lanes of a single signal, check the 'Parallel' par mode."
             )
             return
 
+        if mode not in ("ri", "eo", "poly"):
+            messagebox.showerror("Error", "Unknown combine mode.")
+            return
+
         if self.complex_var.get() and mode == "ri":
             messagebox.showerror(
                 "Error",
@@ -910,104 +1095,43 @@ class CSVParserTab(ttk.Frame):
             )
             return
 
-        name1 = self.signals_full_names[selection[0]]
-        name2 = self.signals_full_names[selection[1]]
-
-        sig1_raw = self.db_raw[name1]["samples"]
-        sig2_raw = self.db_raw[name2]["samples"]
+        sigs_raw = [self.db_raw[name]["samples"] for name in names]
+        n_raw = len(sigs_raw[0])
 
-        if len(sig1_raw) != len(sig2_raw):
+        if any(len(raw) != n_raw for raw in sigs_raw):
+            lens = ", ".join(f"'{name}': {len(raw)}" for name, raw in zip(names, sigs_raw))
             messagebox.showerror(
                 "Error",
-                f"Signals '{name1}' and '{name2}' have different lengths "
-                f"({len(sig1_raw)} vs {len(sig2_raw)})."
+                f"Selected signals have different lengths ({lens})."
             )
             return
 
-        # Optional VALID filter (same logic as convert_data)
-        use_valid = getattr(self, "use_valid_var", None)
-        use_sop = getattr(self, "use_sop_var", None)
-        use_eop = getattr(self, "use_eop_var", None)
-        valid_name, sop_name, eop_name = "", "", ""
-        if use_valid is not None and self.use_valid_var.get():
-            valid_name = self.valid_signal_var.get().strip()
-        if use_sop is not None and self.use_sop_var.get():
-            sop_name = self.sop_signal_var.get().strip()
-        if use_eop is not None and self.use_eop_var.get():
-            eop_name = self.eop_signal_var.get().strip()
-
-        if valid_name:
-            if valid_name not in self.db_raw:
-                messagebox.showerror("Error", f"Valid signal '{valid_name}' not found.")
-                return
-
-            valid_samples = self.db_raw[valid_name]["samples"]
-            sop_samples, eop_samples = [], []
-
-            if sop_name:
-                if sop_name not in self.db_raw:
-                    messagebox.showerror("Error", f"SOP signal '{sop_name}' not found.")
-                    return
-                sop_samples = self.db_raw[sop_name]["samples"]
-                if len(sop_samples) != len(sig1_raw):
-                    messagebox.showerror(
-                        "Error",
-                        f"SOP signal '{sop_name}' length ({len(sop_samples)}) "
-                        f"does not match data length ({len(sig1_raw)})."
-                    )
-                    return
-
-            if eop_name:
-                if eop_name not in self.db_raw:
-                    messagebox.showerror("Error", f"EOP signal '{eop_name}' not found.")
-                    return
-                eop_samples = self.db_raw[eop_name]["samples"]
-                if len(eop_samples) != len(sig1_raw):
-                    messagebox.showerror(
-                        "Error",
-                        f"EOP signal '{eop_name}' length ({len(eop_samples)}) "
-                        f"does not match data length ({len(sig1_raw)})."
-                    )
-                    return
-
-            if len(valid_samples) != len(sig1_raw):
-                messagebox.showerror(
-                    "Error",
-                    f"Valid signal '{valid_name}' length ({len(valid_samples)}) "
-                    f"does not match data length ({len(sig1_raw)})."
-                )
-                return
-
-            if not sop_name and not eop_name:
-                sig1 = [s for s, v in zip(sig1_raw, valid_samples) if sample_is_valid(v)]
-                sig2 = [s for s, v in zip(sig2_raw, valid_samples) if sample_is_valid(v)]
-            else:
-                multi_packets = (getattr(self, "packet_output_var", None) is not None) and (self.packet_output_var.get() == "multi")
-
-                if multi_packets:
-                    pkts1 = filter_data_packets_list(sig1_raw, valid_samples, sop_samples, eop_samples)
-                    pkts2 = filter_data_packets_list(sig2_raw, valid_samples, sop_samples, eop_samples)
-                    packets_pair = (pkts1, pkts2)
-                    # Keep non-empty placeholders to pass the existing empty-check below
-                    sig1 = pkts1[0] if pkts1 else []
-                    sig2 = pkts2[0] if pkts2 else []
-                else:
-                    packets_pair = None
-                    sig1 = filter_data_all_packets(sig1_raw, valid_samples, sop_samples, eop_samples)
-                    sig2 = filter_data_all_packets(sig2_raw, valid_samples, sop_samples, eop_samples)
+        # Optional VALID/SOP/EOP filter: one packet index shared by every lane
+        index = self._packet_index(names)
+        if index is None:
+            return
+        _, packets, multi_packets = index
+        valid_name = self._active_filter_names()[0]
 
+        offsets = None
+        if packets is None:
+            sigs = sigs_raw
         else:
-            sig1 = sig1_raw
-            sig2 = sig2_raw
-
-        if not sig1 or not sig2:
+            flat_idx = np.concatenate(packets) if packets else np.zeros(0, dtype=np.int64)
+            sigs = [take_samples(raw, flat_idx) for raw in sigs_raw]
+            if multi_packets:
+                # Packets are converted and combined as one batch, then split back
+                offsets = np.zeros(len(packets) + 1, dtype=np.int64)
+                offsets[1:] = np.cumsum([idx.size for idx in packets])
+        n_pkts = len(packets) if offsets is not None else 0
+
+        if any(len(sig) == 0 for sig in sigs):
             messagebox.showwarning(
                 "Warning",
                 "After applying valid filtering, no samples remain to combine."
             )
             return
 
-
         try:
             if data_type == "1":  # Fixed
                 sign_bits = int(self.sign_bits_var.get())
@@ -1033,136 +1157,72 @@ class CSVParserTab(ttk.Frame):
             messagebox.showerror("Error", "Precision fields must be integers.")
             return
 
-        # If multi-packet mode is enabled, combine each packet separately
-        if 'packets_pair' in locals() and packets_pair is not None:
-            pkts1, pkts2 = packets_pair
-            if not pkts1 or not pkts2:
-                messagebox.showwarning("Warning", "After applying packet filtering, no samples remain to combine.")
-                return
-
-            n_pkts = min(len(pkts1), len(pkts2))
-            if n_pkts == 0:
-                messagebox.showwarning("Warning", "No complete packets found to combine.")
-                return
-
-            for k in range(n_pkts):
-                temp_db = {
-                    name1: {"idx": 0, "samples": pkts1[k]},
-                    name2: {"idx": 0, "samples": pkts2[k]},
-                }
-
-                try:
-                    conv_db = convert_db(temp_db, data_type, data_prec, data_complex, data_par, data_par_mode)
-                except Exception as e:
-                    messagebox.showerror("Conversion error", str(e))
-                    return
-
-                arr1 = conv_db[name1]["samples"]
-                arr2 = conv_db[name2]["samples"]
-
-                # handle swap roles
-                local_name1, local_name2 = name1, name2
-                if self.combine_swap_var.get():
-                    arr1, arr2 = arr2, arr1
-                    local_name1, local_name2 = name2, name1
-
-                if len(arr1) != len(arr2):
-                    messagebox.showerror("Error", "Converted packet signals have different lengths; cannot combine.")
-                    return
-
-                if mode == 'ri':
-                    combined_samples = [complex(a, b) for a, b in zip(arr1, arr2)]
-                    combined_base = f"{local_name1}_ReIm_{local_name2}"
-                elif mode == 'eo':
-                    combined_samples = []
-                    for a, b in zip(arr1, arr2):
-                        combined_samples.append(a)
-                        combined_samples.append(b)
-                    combined_base = f"{local_name1}_EvenOdd_{local_name2}"
-                else:
-                    messagebox.showerror("Error", "Unknown combine mode.")
-                    return
-
-                combined_name = f"{combined_base}__pkt{k}"
-
-                self.db_converted[combined_name] = {"samples": combined_samples}
-
-                existing = self.converted_listbox.get(0, tk.END)
-                if combined_name not in existing:
-                    self.converted_listbox.insert(tk.END, combined_name)
-
-            mode_str = 'Real/Imag' if mode == 'ri' else 'Even/Odd'
-            if valid_name:
-                self.convert_status_var.set(
-                    f"Combined {n_pkts} packet(s): '{name1}' + '{name2}' ({mode_str}, valid='{valid_name}')."
-                )
-            else:
-                self.convert_status_var.set(
-                    f"Combined {n_pkts} packet(s): '{name1}' + '{name2}' ({mode_str})."
-                )
-            return
-
-        # Convert both signals using existing convert_db helper
-        temp_db = {
-            name1: {"idx": 0, "samples": sig1},
-            name2: {"idx": 0, "samples": sig2},
-        }
+        # Convert all signals using existing convert_db helper
+        temp_db = {name: {"idx": 0, "samples": sig} for name, sig in zip(names, sigs)}
 
         try:
             conv_db = convert_db(temp_db, data_type, data_prec, data_complex, data_par, data_par_mode)
+            lanes = lanes_from_converted(conv_db, names, data_par, data_par_mode)
         except Exception as e:
             messagebox.showerror("Conversion error", str(e))
             return
 
-        arr1 = conv_db[name1]["samples"]
-        arr2 = conv_db[name2]["samples"]
-
-        # handle swap roles
+        # handle swap roles (reverse lane order)
+        lane_names = list(names)
         if self.combine_swap_var.get():
-            arr1, arr2 = arr2, arr1
-            name1, name2 = name2, name1
+            lanes = lanes[::-1]
+            lane_names = lane_names[::-1]
 
-        if len(arr1) != len(arr2):
-            messagebox.showerror(
-                "Error",
-                "Converted signals have different lengths; cannot combine."
-            )
+        try:
+            if mode == "poly" and offsets is not None:
+                # Each packet has its own commutator start: reassemble per packet
+                lane_scale = lanes[0].size // int(offsets[-1])
+                per_lane = [split_packets(lane, offsets, lane_scale) for lane in lanes]
+                combined_pkts = [combine_lanes(pkt_lanes, mode) for pkt_lanes in zip(*per_lane)]
+                combined = np.concatenate(combined_pkts)
+            else:
+                combined = combine_lanes(lanes, mode)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
             return
 
-        if mode == "ri":
-            # Interpret arr1 as real, arr2 as imag → complex
-            combined_samples = [complex(a, b) for a, b in zip(arr1, arr2)]
-            combined_name = f"{name1}_ReIm_{name2}"
-        elif mode == "eo":
-            # Interleave arr1 (even indices) and arr2 (odd indices)
-            combined_samples = []
-            for a, b in zip(arr1, arr2):
-                combined_samples.append(a)  # even
-                combined_samples.append(b)  # odd
-            combined_name = f"{name1}_EvenOdd_{name2}"
+        tag = {"ri": "ReIm", "eo": "EvenOdd", "poly": "Poly"}[mode]
+        if len(lanes) == 2 and len(lane_names) == 2:
+            combined_base = f"{lane_names[0]}_{tag}_{lane_names[1]}"
+        elif len(lane_names) == 1:
+            combined_base = f"{lane_names[0]}_{tag}x{len(lanes)}"
         else:
-            messagebox.showerror("Error", "Unknown combine mode.")
-            return
-
-        # Store in db_converted
-        self.db_converted[combined_name] = {"samples": combined_samples}
+            combined_base = f"{lane_names[0]}_{tag}x{len(lanes)}_{lane_names[-1]}"
+
+        existing = set(self.converted_listbox.get(0, tk.END))
+        if offsets is not None and mode == "poly":
+            stored = [(f"{combined_base}__pkt{k}", pkt) for k, pkt in enumerate(combined_pkts)]
+        elif offsets is not None:
+            # Output samples per input word (data_par, lanes, Re/Im pairing)
+            out_scale = combined.size // int(offsets[-1])
+            stored = []
+            for k, pkt in enumerate(split_packets(combined, offsets, out_scale)):
+                stored.append((f"{combined_base}__pkt{k}", pkt))
+        else:
+            stored = [(combined_base, combined)]
 
-        # Add to converted listbox (if not already there)
-        existing = self.converted_listbox.get(0, tk.END)
-        if combined_name not in existing:
-            self.converted_listbox.insert(tk.END, combined_name)
+        for combined_name, samples in stored:
+            self.db_converted[combined_name] = {"samples": samples}
+            if combined_name not in existing:
+                self.converted_listbox.insert(tk.END, combined_name)
+                existing.add(combined_name)
 
         # Update status
-        mode_str = "Real/Imag" if mode == "ri" else "Even/Odd"
+        mode_str = {"ri": "Real/Imag", "eo": "Even/Odd", "poly": "Polyphase"}[mode]
+        src_str = " + ".join(f"'{name}'" for name in names)
+        if n_pkts:
+            what = f"Combined {n_pkts} packet(s): {src_str}"
+        else:
+            what = f"Combined {src_str} -> '{combined_base}'"
         if valid_name:
-            self.convert_status_var.set(
-                f"Combined '{name1}' + '{name2}' -> '{combined_name}' "
-                f"({mode_str}, valid='{valid_name}')."
-            )
+            self.convert_status_var.set(f"{what} ({mode_str}, {len(lanes)} lanes, valid='{valid_name}').")
         else:
-            self.convert_status_var.set(
-                f"Combined '{name1}' + '{name2}' -> '{combined_name}' ({mode_str})."
-            )
+            self.convert_status_var.set(f"{what} ({mode_str}, {len(lanes)} lanes).")
 
     def open_selector(self, selector: str):
         """Open a popup window to select a valid signal by double-click."""
@@ -1170,21 +1230,13 @@ class CSVParserTab(ttk.Frame):
             messagebox.showerror("Error", "No signals loaded. Run Search first.")
             return
 
-        # Source list of full names
+        # Source list of full names (always what gets stored)
         items = self.signals_full_names or sorted(self.db_raw.keys())
 
-        # Decide what to DISPLAY in the popup: full or short
-        # (change this to short_name if you prefer)
-        display_names = []
-        for full in items:
-            # If you stored short_name in db_raw:
-            # disp = self.db_raw[full].get("short_name", full)
-            disp = full
-            display_names.append(disp)
-
-        # Compute width in characters based on longest display name
-        max_len = max(len(s) for s in display_names) if display_names else 20
-        listbox_width = max_len+2#min(max_len + 2, 250)  # clamp to something reasonable
+        # Width in characters based on longest name, clamped so huge
+        # hierarchies do not produce a screen-wide popup
+        max_len = max((len(s) for s in items), default=20)
+        listbox_width = min(max_len + 2, 120)
 
         # Popup window
         win = tk.Toplevel(self)
@@ -1193,37 +1245,24 @@ class CSVParserTab(ttk.Frame):
         win.transient(self)  # keep on top of main window
         win.grab_set()  # modal
 
-        ttk.Label(win, text=("Double-click a signal to use as " + selector + ":")).pack(
+        ttk.Label(win, text=("Type to filter, double-click a signal to use as " + selector + ":")).pack(
             side="top", anchor="w", padx=10, pady=(10, 5)
         )
 
-        frame = ttk.Frame(win)
-        frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
-
-        lb = tk.Listbox(
-            frame,
-            selectmode="browse",
-            height=max(len(self.signals_full_names),20),
-            width=listbox_width  # <- width in characters
-        )
-        lb.grid(row=0, column=0, sticky="nsew")
-        scroll = ttk.Scrollbar(frame, orient="vertical", command=lb.yview)
-        scroll.grid(row=0, column=1, sticky="ns")
-        lb.config(yscrollcommand=scroll.set)
-
-        frame.columnconfigure(0, weight=1)
-        frame.rowconfigure(0, weight=1)
-
-        # Fill listbox
-        for disp in display_names:
-            lb.insert(tk.END, disp)
+        lb = FilteredListbox(win, selectmode="browse", height=20, width=listbox_width)
+        lb.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        lb.set_items(items)
 
         def on_ok(event=None):
-            sel = lb.curselection()
+            lb.flush_filter()
+            sel = lb.selected_items()
             if not sel:
-                return
-            idx = sel[0]
-            full_name = items[idx]  # always store FULL name
+                # Enter in the filter box picks the only remaining match
+                visible = lb.visible_items()
+                if len(visible) != 1:
+                    return
+                sel = visible
+            full_name = sel[0]  # always store FULL name
             if selector == "valid": # Valid
                 self.valid_signal_var.set(full_name)
             elif selector == "sop": # SOP
@@ -1233,8 +1272,10 @@ class CSVParserTab(ttk.Frame):
             win.destroy()
 
         # Double-click / Enter to select
-        lb.bind("<Double-Button-1>", on_ok)
-        lb.bind("<Return>", on_ok)
+        lb.listbox.bind("<Double-Button-1>", on_ok)
+        lb.listbox.bind("<Return>", on_ok)
+        lb.filter_entry.bind("<Return>", on_ok)
+        lb.focus_filter()
 
         # Let Tk compute required size, then lock it as minimum so everything fits
         win.update_idletasks()
@@ -1247,6 +1288,7 @@ class CSVParserTab(ttk.Frame):
         if directory:
             self.output_dir_var.set(directory)
 
+    @profiled("csv_tab.write_files")
     def write_files(self):
             """
             Write signals to TXT files.
@@ -1291,11 +1333,8 @@ class CSVParserTab(ttk.Frame):
                     messagebox.showerror("Export", "No signals loaded. Run Search first.")
                     return
                 src_db = self.db_raw
-                lb = self.signals_listbox
-                selection = lb.curselection()
-                if selection:
-                    selected_names = [self.signals_full_names[i] for i in selection]
-                else:
+                selected_names = self.signals_listbox.selected_items()
+                if not selected_names:
                     selected_names = list(src_db.keys())
             # Fixed export precision (only needed for Export format = fixed or BTE)
             sign_bit = int_bits = frac_bits = None
@@ -1327,6 +1366,8 @@ class CSVParserTab(ttk.Frame):
 
                 # Normalize to numpy array for vector ops where possible
                 arr = np.asarray(samples)
+                if arr.dtype.kind == "S":
+                    arr = arr.astype(str)
 
                 if export_fmt == "fixed":
                     # We expect numeric samples (real or complex). Best-effort conversion for string arrays.
@@ -1476,6 +1517,7 @@ class CSVParserTab(ttk.Frame):
         )
 
         # Matplotlib figure
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = matplotlib_tk()
         fig = Figure(figsize=(6, 4), dpi=100)
         ax = fig.add_subplot(111)
 
@@ -1678,6 +1720,7 @@ class CSVParserTab(ttk.Frame):
         )
 
         # Matplotlib figure
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = matplotlib_tk()
         fig = Figure(figsize=(6, 4), dpi=100)
         ax = fig.add_subplot(111)
 
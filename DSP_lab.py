@@ -2,52 +2,87 @@
 
 import tkinter as tk
 import json
+import os
+import time
 from tkinter import ttk, filedialog, messagebox
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
 import numpy as np
 from helper_funcs import *  # expects collect_signals_v5, etc.
+from gui_widgets import matplotlib_tk
 
 
 class DSPLabMatTab(ttk.Frame):
-    def __init__(self, parent, *args, **kwargs):
+    def __init__(self, parent, *args, registry=None, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
+        self.registry = registry if registry is not None else shared_signal_registry()
+
         self._build_vars()
         self._build_ui()
 
+        self.registry.subscribe(self._on_registry_published)
+        if len(self.registry):
+            # Built after other tabs already published (lazy tab construction)
+            self._refresh_info_box()
+
     # ---------------- Variables ---------------- #
 
     def _build_vars(self):
 
-        # Shared signals DB: name -> np.ndarray
-        self.signals = {}
+        # Shared signals DB: name -> np.ndarray (the cross-tab registry;
+        # LRU-spilled to disk over the memory budget)
+        self.signals = self.registry
 
         # DSP chain state
         self.dsp_chain = []  # list of dicts: {"op": str, "params": {k: v}}
 
         # Operation registry (extend freely)
+        # kind: "pointwise" (elementwise; optional "block"(x, start, ...) when the
+        # op depends on the sample index), "stateful" (FIR-like; "stream"(n_in, ...)
+        # returns a FirResampler-style object) or "global" (needs the whole signal).
+        # Pointwise ops with "inplace"(x, out, start, ...) writing via out= are
+        # fused with their pointwise neighbours into one pass (no temporaries).
         self.OP_REGISTRY = {
             "Gain": {
                 "params": [("gain", float, 1.0)],
+                "kind": "pointwise",
                 "func": lambda x, gain: x * gain,
+                "inplace": lambda x, out, start, gain: np.multiply(x, gain, out=out),
             },
             "DC Offset": {
                 "params": [("offset", float, 0.0)],
+                "kind": "pointwise",
                 "func": lambda x, offset: x + offset,
+                "inplace": lambda x, out, start, offset: np.add(x, offset, out=out),
             },
             "Normalize (peak=1)": {
                 "params": [],
+                "kind": "global",
                 "func": lambda x: (x / (np.max(np.abs(x)) + 1e-12)),
             },
             "Abs": {
                 "params": [],
+                "kind": "pointwise",
                 "func": lambda x: np.abs(x),
+                "inplace": lambda x, out, start: np.abs(x, out=out),
             },
             "Moving Average": {
                 "params": [("window", int, 8)],
+                "kind": "stateful",
                 "func": self._op_moving_average,
+                "stream": self._moving_average_stream,
+            },
+            "Moving Average (EMA)": {
+                "params": [("window", int, 8)],  # alpha = 2 / (window + 1)
+                "kind": "stateful",
+                "func": lambda x, window: stream_whole(self._ema_stream(np.size(x), window), x),
+                "stream": self._ema_stream,
+            },
+            "CIC Decimator": {
+                "params": [("dec_factor", int, 8), ("stages", int, 3), ("fir_type", str, "same")],
+                "kind": "stateful",
+                "func": lambda x, **p: stream_whole(self._cic_stream(np.size(x), **p), x),
+                "stream": self._cic_stream,
             },
             "FIR Filter (L/M)": {
                 "params": [
@@ -62,22 +97,40 @@ class DSPLabMatTab(ttk.Frame):
 
                     ("fir_type", str, "same"),  # same/full
                 ],
+                "kind": "stateful",
                 "func": self._op_fir_filter,
+                "stream": self._fir_stream,
             },
             "FFT": {
                 "params": [],
+                "kind": "global",
                 "func": lambda x: np.fft.fftshift(np.fft.fft(x)),
             },
             "IFFT": {
                 "params": [],
+                "kind": "global",
                 "func": lambda x: np.fft.ifft(x),
             },
             "NCO": {
                 "params": [("fs", float, 1e6), ("freq", float, 0.0)],
+                "kind": "pointwise",
                 "func": lambda x, fs, freq: x * np.exp(1j * 2 * np.pi * freq * np.arange(len(x)) / fs),
+                "block": lambda x, start, fs, freq: x * np.exp(1j * 2 * np.pi * freq * (start + np.arange(len(x))) / fs),
+                "inplace": lambda x, out, start, fs, freq: np.multiply(
+                    x, np.exp(1j * 2 * np.pi * freq * (start + np.arange(len(x))) / fs), out=out
+                ),
             },
         }
 
+        # Chain execution: stream blocks of CHAIN_BLOCK samples (bounded memory)
+        self.chain_stream_var = tk.BooleanVar(value=True)
+
+        # FIR taps / polyphase branches / FFT kernels reused across chain runs
+        self.fir_cache = FirDesignCache()
+
+        # Batch apply: glob/substring over signal names (empty -> selected signals)
+        self.chain_batch_match_var = tk.StringVar(value="")
+
         # Signal Gen Vars
         self.signal_name = tk.StringVar()
         self.length_var = tk.StringVar(value="1024")
@@ -104,6 +157,10 @@ class DSPLabMatTab(ttk.Frame):
         self.step_q_m_var = tk.StringVar(value="0")
         self.step_q_n_var = tk.StringVar(value="15")
 
+        # Quantizer modes (shared by signal gen, chain and per-step quantization)
+        self.q_round_var = tk.StringVar(value="nearest")
+        self.q_overflow_var = tk.StringVar(value="saturate")
+
     # ---------------- UI Layout ---------------- #
 
     def _build_ui(self):
@@ -111,7 +168,7 @@ class DSPLabMatTab(ttk.Frame):
         sec1 = ttk.LabelFrame(self, text="1. MAT File Browser")
         sec1.pack(fill="x", padx=5, pady=5)
 
-        ttk.Label(sec1, text="Load MAT (v5/v7.2) file and add arrays as signals.").grid(
+        ttk.Label(sec1, text="Load MAT (v5/v7.2/v7.3) file and add arrays as signals.").grid(
             row=0, column=0, sticky="w", padx=10, pady=(5, 5)
         )
 
@@ -219,6 +276,19 @@ class DSPLabMatTab(ttk.Frame):
         ttk.Label(qrow, text="n:").pack(side="left", padx=(10, 2))
         ttk.Entry(qrow, textvariable=self.q_n_var, width=5).pack(side="left")
 
+        ttk.Label(qrow, text="Round:").pack(side="left", padx=(10, 2))
+        ttk.Combobox(
+            qrow, state="readonly", width=10, textvariable=self.q_round_var, values=QUAN_ROUNDING
+        ).pack(side="left")
+        ttk.Label(qrow, text="Overflow:").pack(side="left", padx=(10, 2))
+        ttk.Combobox(
+            qrow, state="readonly", width=9, textvariable=self.q_overflow_var, values=QUAN_OVERFLOW
+        ).pack(side="left")
+
+        ttk.Checkbutton(
+            qrow, text="Streaming (block) execution", variable=self.chain_stream_var
+        ).pack(side="left", padx=(20, 0))
+
         ttk.Label(top, text="Operation:").pack(side="left")
         self.chain_op_cb = ttk.Combobox(
             top,
@@ -284,6 +354,13 @@ class DSPLabMatTab(ttk.Frame):
         ttk.Button(btns, text="Save preset…", command=self._chain_save_preset).pack(side="left")
         ttk.Button(btns, text="Load preset…", command=self._chain_load_preset).pack(side="left", padx=5)
 
+        ttk.Separator(btns, orient="vertical").pack(side="left", fill="y", padx=10)
+
+        ttk.Button(btns, text="Batch apply", command=self._chain_apply_batch).pack(side="left")
+        ttk.Label(btns, text="Match:").pack(side="left", padx=(8, 2))
+        ttk.Entry(btns, textvariable=self.chain_batch_match_var, width=18).pack(side="left")
+        ttk.Label(btns, text="(empty = selected)").pack(side="left", padx=(4, 0))
+
         # Default selection
         if self.chain_op_cb["values"]:
             self.chain_op_cb.current(0)
@@ -349,25 +426,78 @@ class DSPLabMatTab(ttk.Frame):
 
     def _on_browse(self):
         path = filedialog.askopenfilename(
-            title="Open MAT file (v5/v7.2)",
+            title="Open MAT file (v5/v7.2/v7.3)",
             filetypes=[("MATLAB files", "*.mat"), ("All files", "*.*")]
         )
         if not path:
             return
 
         try:
-            mat_signals = collect_signals_v5(path)
+            variables = index_mat_v5(path)
         except NotImplementedError:
-            messagebox.showerror(
-                "Error",
-                "This looks like a v7.3 MAT file.\n"
-                "Current parser only supports non-v7.3."
-            )
+            # v7.3 (HDF5): index only, arrays are read when a signal is used
+            try:
+                mat_signals = index_signals_v73(path)
+            except ImportError as e:
+                messagebox.showerror("Error", f"This is a v7.3 MAT file.\n{e}")
+                return
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to open v7.3 MAT file:\n{e}")
+                return
+            self._add_mat_signals(mat_signals)
             return
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open MAT file:\n{e}")
             return
 
+        if len(variables) <= 1:
+            self._load_mat_v5(path, None)
+        else:
+            self._open_mat_picker(path, variables)
+
+    def _open_mat_picker(self, path, variables):
+        """List the file's variables (from whosmat) and load only the chosen ones."""
+        win = tk.Toplevel(self)
+        win.title(f"MAT variables: {os.path.basename(path)}")
+
+        ttk.Label(win, text="Select variables to load:").pack(side="top", anchor="w", padx=5, pady=(5, 0))
+
+        frame = ttk.Frame(win)
+        frame.pack(side="top", fill="both", expand=True, padx=5, pady=5)
+        lb = tk.Listbox(frame, selectmode="extended", width=60, height=min(20, len(variables)))
+        lb.pack(side="left", fill="both", expand=True)
+        scroll_y = ttk.Scrollbar(frame, orient="vertical", command=lb.yview)
+        scroll_y.pack(side="right", fill="y")
+        lb.configure(yscrollcommand=scroll_y.set)
+
+        for name, shape, mclass in variables:
+            dims = "x".join(str(d) for d in shape)
+            lb.insert(tk.END, f"{name}  |  {dims} {mclass}")
+        lb.selection_set(0, tk.END)
+
+        def load(names):
+            win.destroy()
+            if names:
+                self._load_mat_v5(path, names)
+
+        buttons = ttk.Frame(win)
+        buttons.pack(side="bottom", fill="x", padx=5, pady=(0, 5))
+        ttk.Button(
+            buttons, text="Load selected",
+            command=lambda: load([variables[i][0] for i in lb.curselection()]),
+        ).pack(side="left")
+        ttk.Button(buttons, text="Cancel", command=win.destroy).pack(side="right")
+
+    @profiled("dsp_tab.load_mat")
+    def _load_mat_v5(self, path, variable_names):
+        try:
+            mat_signals = collect_signals_v5(path, variable_names)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open MAT file:\n{e}")
+            return
+        self._add_mat_signals(mat_signals)
+
+    def _add_mat_signals(self, mat_signals):
         # Merge MAT signals into shared DB (avoid name collisions)
         for name, sig in mat_signals.items():
             base = name
@@ -382,21 +512,36 @@ class DSPLabMatTab(ttk.Frame):
 
     # ---------------- Shared list / selection ---------------- #
 
+    def _on_registry_published(self, names, origin):
+        """Signals published by another tab (e.g. CSV Parser) -> refresh the list."""
+        if origin is not self:
+            self._refresh_info_box()
+
+    @profiled("dsp_tab.info_list")
     def _refresh_info_box(self):
         """Show name + basic metadata for all signals."""
-        self.info_list.delete(0, tk.END)
+        lines = []
         for name in sorted(self.signals.keys(), key=str.lower):
-            sig = np.array(self.signals[name])
+            meta = self.signals.meta(name)  # cached: no data is touched here
             display = (
-                f"{name}  |  shape={sig.shape}, "
-                f"dtype={sig.dtype}, size={sig.size}"
+                f"{name}  |  shape={meta.shape}, "
+                f"dtype={meta.dtype}, size={meta.size}"
             )
-            self.info_list.insert(tk.END, display)
+            if meta.has_stats():
+                display += f", min={meta.min:.4g}, max={meta.max:.4g}, rms={meta.rms:.4g}"
+            lines.append(display)
+
+        self.info_list.delete(0, tk.END)
+        if lines:
+            self.info_list.insert(tk.END, *lines)
 
         self._update_chain_signal_choices()
 
-    def _get_selected_signal(self):
-        """Return (name, signal) for the currently selected entry in info_list."""
+    def _get_selected_signal(self, lazy=False):
+        """
+        Return (name, signal) for the currently selected entry in info_list.
+        lazy=True keeps a 1-D LazyArray (v7.3 MAT) in its file for streaming.
+        """
         selection = self.info_list.curselection()
         if not selection:
             messagebox.showwarning(
@@ -407,12 +552,18 @@ class DSPLabMatTab(ttk.Frame):
         idx = selection[0]
         line = self.info_list.get(idx)
         name = line.split("|", 1)[0].strip()
-        sig = self.signals.get(name)
-        if sig is None:
+        if name not in self.signals:
             messagebox.showerror("Error", f"Signal '{name}' not found.")
             return None, None
 
-        return name, sig
+        return name, self._chain_input(name) if lazy else self.signals[name]
+
+    def _chain_input(self, name):
+        """Signal for a chain run: 1-D LazyArrays stay lazy when streaming, else loaded."""
+        sig = self.signals.peek(name)
+        if self.chain_stream_var.get() and isinstance(sig, LazyArray) and sig.ndim == 1:
+            return sig
+        return self.signals[name]
 
     def _on_signal_double_click(self, event):
         """On double-click: open a window showing signal info + preview."""
@@ -454,6 +605,7 @@ class DSPLabMatTab(ttk.Frame):
 
     # ---------------- Signal generation ---------------- #
 
+    @profiled("dsp_tab.generate")
     def generate_signal(self, sig_type: str):
         """Generate a random/analytic real/complex signal of length N and store it by name."""
         try:
@@ -494,9 +646,12 @@ class DSPLabMatTab(ttk.Frame):
             return
 
         if self.use_quan_var.get():
-            x_prec = self._get_x_prec()
-            sig = ba_quan(sig, x_prec)
-            sig = sig.quantize()
+            try:
+                x_prec = self._get_x_prec()
+            except ValueError as e:
+                messagebox.showerror("Invalid parameters", str(e))
+                return
+            sig = quantize(sig, x_prec, out=sig)
 
         self.signals[name] = sig
         self._refresh_info_box()
@@ -509,7 +664,10 @@ class DSPLabMatTab(ttk.Frame):
         except Exception:
             raise ValueError("Invalid quantization precision. s/m/n must be integers.")
 
-        x_prec = {"s": s, "m": m, "n": n}
+        x_prec = {
+            "s": s, "m": m, "n": n,
+            "round": self.q_round_var.get(), "overflow": self.q_overflow_var.get(),
+        }
         return x_prec
 
     # ---------------- Operations ---------------- #
@@ -680,6 +838,8 @@ class DSPLabMatTab(ttk.Frame):
             xp = step.get("x_prec", None)
             if xp is not None:
                 ptxt = f"{ptxt} | quan={xp['s']}.{xp['m']}.{xp['n']}"
+                if "round" in xp:
+                    ptxt = f"{ptxt} {xp['round']}/{xp['overflow']}"
 
             self.chain_tree.insert("", "end", iid=str(i - 1), values=(f"{i}. {op}", ptxt))
 
@@ -716,34 +876,26 @@ class DSPLabMatTab(ttk.Frame):
         self.dsp_chain.clear()
         self._chain_refresh_view()
 
+    @profiled("dsp_tab.chain_apply")
     def _chain_apply(self):
         if not self.dsp_chain:
             messagebox.showinfo("DSP Chain", "Chain is empty.")
             return
 
-        name, x = self._get_selected_signal()
+        name, x = self._get_selected_signal(lazy=True)
         if x is None:
             return
 
-        y = np.asarray(x)
-
         try:
             x_prec = None
             if self.use_quan_var.get():
                 x_prec = self._get_x_prec()
 
-            for step in self.dsp_chain:
-                op = step["op"]
-                params = step.get("params", {})
-                fn = self.OP_REGISTRY[op]["func"]
-                y = fn(y, **params) if params else fn(y)
-                step_prec = step.get("x_prec", None)
-                if step_prec is not None:
-                    y = ba_quan(y, x_prec)  # pseudo: x = quan(x, x_prec)
-                    y = y.quantize()
-                y = np.asarray(y)
+            stages = self._chain_compile(self.dsp_chain, x_prec)
+            block = CHAIN_BLOCK if self.chain_stream_var.get() else None
+            y = run_chain(x, stages, block_size=block)
         except Exception as e:
-            messagebox.showerror("DSP Chain", f"Failed at op '{op}':\n{e}")
+            messagebox.showerror("DSP Chain", str(e))
             return
 
         out_name = self.chain_out_name.get().strip()
@@ -754,6 +906,113 @@ class DSPLabMatTab(ttk.Frame):
         self._refresh_info_box()
         messagebox.showinfo("DSP Chain", f"Created new signal:\n{out_name}")
 
+    def _chain_batch_names(self):
+        """Signals for Batch apply: names matching the Match field, else the selection."""
+        pattern = self.chain_batch_match_var.get().strip()
+        if pattern:
+            mode = "glob" if any(ch in pattern for ch in "*?[") else "substring"
+            match = compile_name_filter(pattern, mode)
+            return [n for n in sorted(self.signals.keys(), key=str.lower) if match(n)]
+
+        names = []
+        for idx in self.info_list.curselection():
+            names.append(self.info_list.get(idx).split("|", 1)[0].strip())
+        return names
+
+    @profiled("dsp_tab.chain_batch")
+    def _chain_apply_batch(self):
+        """Apply the current chain to many signals at once (thread pool), with timings."""
+        if not self.dsp_chain:
+            messagebox.showinfo("DSP Chain", "Chain is empty.")
+            return
+
+        names = [n for n in self._chain_batch_names() if n in self.signals]
+        if not names:
+            messagebox.showwarning(
+                "DSP Chain", "No signals to process. Select signals or enter a Match pattern."
+            )
+            return
+
+        try:
+            x_prec = None
+            if self.use_quan_var.get():
+                x_prec = self._get_x_prec()
+            stages = self._chain_compile(self.dsp_chain, x_prec)
+        except Exception as e:
+            messagebox.showerror("DSP Chain", str(e))
+            return
+
+        block = CHAIN_BLOCK if self.chain_stream_var.get() else None
+        inputs = {name: self._chain_input(name) for name in names}
+
+        t0 = time.perf_counter()
+        results = run_chain_batch(inputs, stages, block_size=block)
+        total = time.perf_counter() - t0
+
+        n_steps = len(self.dsp_chain)
+        lines = []
+        n_ok = 0
+        for name, (y, seconds, err) in results.items():
+            if err is not None:
+                lines.append(f"{name}: FAILED after {seconds:.3f} s\n    {err}")
+                continue
+            out_name = f"{name} | chain({n_steps})"
+            self.signals[out_name] = y
+            n_ok += 1
+            lines.append(f"{out_name}: {seconds:.3f} s, {np.asarray(y).size} samples")
+
+        self._refresh_info_box()
+
+        report = f"Processed {n_ok}/{len(results)} signal(s) in {total:.3f} s\n\n" + "\n".join(lines)
+        win = tk.Toplevel(self)
+        win.title("DSP Chain - batch report")
+        text = tk.Text(win, wrap="none", width=90, height=min(30, len(lines) + 3))
+        text.pack(side="left", fill="both", expand=True)
+        scroll_y = ttk.Scrollbar(win, orient="vertical", command=text.yview)
+        scroll_y.pack(side="right", fill="y")
+        text.configure(yscrollcommand=scroll_y.set)
+        text.insert("end", report)
+        text.configure(state="disabled")
+
+    def _chain_compile(self, chain, x_prec=None):
+        """
+        DSP chain steps -> run_chain() stages (params bound, quantizers inserted).
+        Each step is quantized with its own recorded x_prec, else with x_prec
+        ("Quantize after each op") when given.
+        """
+        stages = []
+        for step in chain:
+            op = step["op"]
+            params = step.get("params", {})
+            opdef = self.OP_REGISTRY[op]
+            fn = opdef["func"]
+            kind = opdef.get("kind", "global")
+
+            stage = {"name": op, "kind": kind, "func": lambda y, fn=fn, p=params: fn(y, **p)}
+            if kind == "pointwise":
+                blk = opdef.get("block")
+                if blk is not None:
+                    stage["block"] = lambda b, start, blk=blk, p=params: blk(b, start, **p)
+                else:
+                    stage["block"] = lambda b, start, fn=fn, p=params: fn(b, **p)
+                inplace = opdef.get("inplace")
+                if inplace is not None:
+                    stage["inplace"] = lambda b, out, start, ip=inplace, p=params: ip(b, out, start, **p)
+            elif kind == "stateful":
+                stage["stream"] = lambda n, mk=opdef["stream"], p=params: mk(n, **p)
+            stages.append(stage)
+
+            prec = step.get("x_prec", None) or x_prec
+            if prec is not None:
+                stages.append({
+                    "name": f"{op} (quan)",
+                    "kind": "pointwise",
+                    "func": lambda y, p=prec: quantize(y, p),
+                    "block": lambda b, start, p=prec: quantize(b, p),
+                    "inplace": lambda b, out, start, p=prec: quantize(b, p, out=out),
+                })
+        return stages
+
     def _chain_save_preset(self):
         if not self.dsp_chain:
             messagebox.showinfo("DSP Chain", "Chain is empty.")
@@ -792,11 +1051,21 @@ class DSPLabMatTab(ttk.Frame):
             messagebox.showerror("DSP Chain", str(e))
 
     def _op_moving_average(self, x, window: int):
+        return stream_whole(self._moving_average_stream(np.size(x), window), x)
+
+    def _moving_average_stream(self, n_in, window: int):
+        """Boxcar of `window` taps, 'same' alignment; O(N) running sums."""
+        return RunningSumFilter(window, n_in=n_in, mode="same")
+
+    def _ema_stream(self, n_in, window: int):
         window = max(1, int(window))
-        if window == 1:
-            return x
-        k = np.ones(window, dtype=float) / float(window)
-        return np.convolve(x, k, mode="same")
+        return ExpAverage(2.0 / (window + 1.0), n_in=n_in)
+
+    def _cic_stream(self, n_in, dec_factor: int, stages: int, fir_type: str):
+        """CIC decimator: `stages` boxcars of dec_factor taps, gain-normalized, keep every R-th."""
+        mode = (fir_type or "same").strip().lower()
+        R = max(1, int(dec_factor))
+        return RunningSumFilter(R, n_in=n_in, mode=mode, stages=stages, R=R)
 
     def _chain_filter_coeff_source_changed(self):
         src = ""
@@ -861,41 +1130,58 @@ class DSPLabMatTab(ttk.Frame):
     def _op_fir_filter(self, x, dec_factor: int, interp_factor: int,
                        coeff_source: str, h_manual: str, h_file: str, h_signal: str,
                        fir_type: str):
-        x = np.asarray(x)
+        x = np.asarray(x).reshape(-1)
+        fir = self._fir_stream(x.size, dec_factor, interp_factor, coeff_source,
+                               h_manual, h_file, h_signal, fir_type)
+        return np.concatenate((fir.process(x), fir.flush()))
+
+    def _fir_stream(self, n_in, dec_factor: int, interp_factor: int,
+                    coeff_source: str, h_manual: str, h_file: str, h_signal: str,
+                    fir_type: str):
+        """FirResampler for the FIR op: zero-stuff by L, filter, keep every M-th."""
         M = max(1, int(dec_factor))
         L = max(1, int(interp_factor))
 
-        src = (coeff_source or "manual").strip().lower()
-        if src == "file":
-            h = self._load_fir_coeffs_from_file(h_file)
-        elif src == "signal":
-            key = (h_signal or "").strip()
-            if key not in self.signals:
-                raise ValueError(f"h_signal '{key}' not found in signals.")
-            h = np.asarray(self.signals[key]).reshape(-1)
-        else:
-            h = self._parse_fir_coeffs_from_string(h_manual)
-
-        if h.size == 0:
-            raise ValueError("Filter coefficients are empty/invalid.")
-
         mode = (fir_type or "same").strip().lower()
         if mode not in ("same", "full"):
             raise ValueError("fir_type must be 'same' or 'full'.")
 
-        if L > 1:
-            up = np.zeros(x.size * L, dtype=x.dtype)
-            up[::L] = x
-            x_u = up
-        else:
-            x_u = x
+        design = self._fir_design(coeff_source, h_manual, h_file, h_signal)
+        return FirResampler(design, L=L, M=M, n_in=n_in, mode=mode)
 
-        y = np.convolve(x_u, h, mode=mode)
+    def _fir_design(self, coeff_source: str, h_manual: str, h_file: str, h_signal: str):
+        """
+        Resolve FIR taps through self.fir_cache, keyed by source: the manual
+        text, file path + mtime/size, or signal name + store version.
+        """
+        src = (coeff_source or "manual").strip().lower()
+        if src == "file":
+            path = (h_file or "").strip()
+            try:
+                st = os.stat(path)
+                key = ("file", os.path.abspath(path), st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = None  # let np.loadtxt report the problem
+            build = lambda: self._load_fir_coeffs_from_file(h_file)
+        elif src == "signal":
+            name = (h_signal or "").strip()
+            if name not in self.signals:
+                raise ValueError(f"h_signal '{name}' not found in signals.")
+            key = ("signal", name, self.signals.version(name))
+            build = lambda: np.asarray(self.signals[name]).reshape(-1)
+        else:
+            key = ("manual", (h_manual or "").strip())
+            build = lambda: self._parse_fir_coeffs_from_string(h_manual)
 
-        if M > 1:
-            y = y[::M]
+        def build_checked():
+            h = build()
+            if h.size == 0:
+                raise ValueError("Filter coefficients are empty/invalid.")
+            return h
 
-        return y
+        if key is None:
+            return FirDesign(build_checked())
+        return self.fir_cache.get_or_build(key, build_checked)
 
     def _get_step_x_prec(self):
         try:
@@ -904,7 +1190,10 @@ class DSPLabMatTab(ttk.Frame):
             n = int(self.step_q_n_var.get())
         except Exception:
             raise ValueError("Invalid STEP precision. s/m/n must be integers.")
-        return {"s": s, "m": m, "n": n}
+        return {
+            "s": s, "m": m, "n": n,
+            "round": self.q_round_var.get(), "overflow": self.q_overflow_var.get(),
+        }
 
     # ---------------- Plot ---------------- #
 
@@ -957,6 +1246,7 @@ class DSPLabMatTab(ttk.Frame):
 
         ttk.Button(controls, text="Update", command=lambda: update_plot()).pack(side="left", padx=10)
 
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = matplotlib_tk()
         fig = Figure(figsize=(6, 4), dpi=100)
         ax = fig.add_subplot(111)
 
@@ -1128,6 +1418,7 @@ class DSPLabMatTab(ttk.Frame):
 
         ttk.Button(controls, text="Update", command=lambda: update_plot()).pack(side="left", padx=10)
 
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = matplotlib_tk()
         fig = Figure(figsize=(6, 4), dpi=100)
         ax = fig.add_subplot(111)
 
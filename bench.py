@@ -0,0 +1,344 @@
+"""
+Benchmark the CSV decode pipeline on synthetic Vivado ILA / Quartus STP captures.
+
+    python bench.py                                  # default capture, JSON to stdout
+    python bench.py --depth 200000 --width 128 --out bench.json
+    python bench.py --compare old.json --out new.json  # ratio per stage vs an earlier run
+
+Each stage is timed --repeat times (min / median reported); peak traced
+memory is measured in a separate pass so tracemalloc does not skew timings.
+Results are one JSON document (meta + one row per stage) to compare across commits.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from helper_funcs import (
+    PROFILER,
+    build_packet_index,
+    convert_db,
+    convert_to_fixed,
+    detect_csv_kind,
+    filter_data_all_packets,
+    filter_data_packets_list,
+    fixed_to_dec,
+    fixed_to_dec_wide,
+    float_to_dec,
+    float_to_dec_wide,
+    load_signals_from_csv,
+    load_signals_from_stp_csv,
+    take_samples,
+)
+
+PKT_LEN = 64        # mean packet length (cycles)
+X_SEG_LEN = 32      # mean X segment length (cycles)
+CONTROL_PROBES = ("valid", "sop", "eop")
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+
+# ---------- Synthetic captures ---------- #
+
+def random_hex_words(rng, n, width):
+    """n random width-bit words as zero-padded lowercase hex strings."""
+    digits = max(1, -(-width // 4))
+    nib = rng.integers(0, 16, size=(n, digits), dtype=np.uint8)
+    top_bits = width - 4 * (digits - 1)
+    nib[:, 0] &= (1 << top_bits) - 1
+    text = _HEX_DIGITS[nib].tobytes()
+    return np.frombuffer(text, dtype=f"S{digits}").astype(f"U{digits}").tolist()
+
+
+def packet_controls(rng, depth, density):
+    """valid / sop / eop (uint8 0/1) with packets of ~PKT_LEN cycles covering ~density of the capture."""
+    valid = np.zeros(depth, dtype=np.uint8)
+    sop = np.zeros(depth, dtype=np.uint8)
+    eop = np.zeros(depth, dtype=np.uint8)
+    density = min(max(density, 0.0), 1.0)
+    if density == 0.0:
+        return valid, sop, eop
+
+    mean_gap = PKT_LEN * (1.0 - density) / density
+    t = 0
+    while t < depth:
+        if mean_gap > 0:
+            t += int(rng.exponential(mean_gap))
+        if t >= depth:
+            break
+        plen = int(rng.integers(PKT_LEN // 2, PKT_LEN * 3 // 2 + 1))
+        end = min(t + plen, depth)
+        valid[t:end] = 1
+        sop[t] = 1
+        eop[end - 1] = 1
+        t = end
+    return valid, sop, eop
+
+
+def x_segments(rng, valid, x_fraction):
+    """Bool mask of X (unknown) cycles: ~x_fraction of the capture, only outside packets."""
+    depth = valid.size
+    mask = np.zeros(depth, dtype=bool)
+    n_segs = int(depth * x_fraction / X_SEG_LEN)
+    for start in rng.integers(0, max(depth - X_SEG_LEN, 1), size=n_segs):
+        seg = slice(start, start + int(rng.integers(1, 2 * X_SEG_LEN)))
+        mask[seg] = valid[seg] == 0
+    return mask
+
+
+def synth_capture(probes=8, width=64, depth=100_000, density=0.3, x_fraction=0.05, seed=0):
+    """
+    Column data for one capture: {probe_name: (bit_width, [text values])}.
+    Control probes (valid/sop/eop) come first, then `probes` data buses.
+    X cycles are written as 'X' on every probe.
+    """
+    rng = np.random.default_rng(seed)
+    valid, sop, eop = packet_controls(rng, depth, density)
+    xmask = x_segments(rng, valid, x_fraction)
+
+    def with_x(values):
+        for i in np.flatnonzero(xmask).tolist():
+            values[i] = "X"
+        return values
+
+    cols = {}
+    for name, bits in zip(CONTROL_PROBES, (valid, sop, eop)):
+        cols[name] = (1, with_x(bits.astype("U1").tolist()))
+    for k in range(probes):
+        cols[f"data_{k}"] = (width, with_x(random_hex_words(rng, depth, width)))
+    return cols
+
+
+def write_ila_csv(path, cols):
+    """Vivado ILA export: 3 metadata columns, a radix row, one row per sample."""
+    names = [f"design_1_i/ila_0/{n}[{w - 1}:0]" if w > 1 else f"design_1_i/ila_0/{n}" for n, (w, _) in cols.items()]
+    radix = ["BINARY" if w == 1 else "HEX" for w, _ in cols.values()]
+    columns = [v for _, v in cols.values()]
+    depth = len(columns[0])
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        f.write(",".join(["Sample in Buffer", "Sample in Window", "TRIGGER"] + names) + "\n")
+        f.write(",".join(["Radix - UNSIGNED", "UNSIGNED", "UNSIGNED"] + radix) + "\n")
+        for i, row in enumerate(zip(*columns)):
+            f.write(f"{i},{i},{int(i == depth // 2)}," + ",".join(row) + "\n")
+
+
+def write_stp_csv(path, cols):
+    """Quartus SignalTap export: header sections, Groups:, then Data: with a time column ('X' left empty)."""
+    names = list(cols)
+    columns = [[("" if v == "X" else v) for v in vals] for _, vals in cols.values()]
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        f.write("Signal Tap Logic Analyzer\nInstance: auto_signaltap_0\n\nGroups:\n")
+        for n, (w, _) in cols.items():
+            f.write(f"{n}={w}\n")
+        f.write("\nData:\n")
+        f.write("time," + ",".join(names) + "\n")
+        for i, row in enumerate(zip(*columns)):
+            f.write(f"{i}," + ",".join(row) + "\n")
+
+
+# ---------- Timing ---------- #
+
+def time_stage(func, repeat):
+    """Run func() `repeat` times; return (last result, [seconds, ...])."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - t0)
+    return result, times
+
+
+def peak_memory(name, func):
+    """Peak traced memory of one func() call (bytes above the starting level)."""
+    PROFILER.reset()
+    PROFILER.enable(track_memory=True)
+    try:
+        with PROFILER.span(name):
+            func()
+    finally:
+        PROFILER.disable()
+    return PROFILER.events[-1][4]
+
+
+def run_stage(results, capture, stage, func, items, repeat, measure_memory):
+    result, times = time_stage(func, repeat)
+    best = min(times)
+    row = {
+        "capture": capture,
+        "stage": stage,
+        "items": int(items),
+        "repeat": repeat,
+        "min_s": best,
+        "median_s": statistics.median(times),
+        "items_per_s": items / best if best > 0 else None,
+        "peak_bytes": peak_memory(stage, func) if measure_memory else None,
+    }
+    results.append(row)
+    print(f"  {capture:4s} {stage:28s} {best * 1e3:10.2f} ms  {row['items_per_s'] or 0:14,.0f} items/s",
+          file=sys.stderr)
+    return result
+
+
+def probe_columns(db):
+    """
+    {short probe name: samples} from a loaded capture. STP captures split
+    each probe at its X cycles into name__segK pieces; those are rejoined
+    (X cycles are shared by every probe, so the pieces stay aligned).
+    """
+    cols = {}
+    for name, info in db.items():
+        base, _, seg = name.partition("__seg")
+        base = base.rsplit("/", 1)[-1].split("[", 1)[0]
+        cols.setdefault(base, []).append((int(seg or 0), list(info["samples"])))
+    return {base: [v for _, part in sorted(parts) for v in part] for base, parts in cols.items()}
+
+
+def bench_capture(results, capture, db, width, repeat, measure_memory, scalar_limit):
+    """Filter + decode stages on one loaded capture (db from the ILA or STP reader)."""
+    cols = probe_columns(db)
+    data_names = [n for n in cols if n.startswith("data_")]
+    samples = cols[data_names[0]]
+    n = len(samples)
+    valid, sop, eop = (cols.get(role, []) for role in CONTROL_PROBES)
+
+    packets = run_stage(results, capture, "build_packet_index",
+                        lambda: build_packet_index(n, valid, sop, eop), n, repeat, measure_memory)
+    flat = np.concatenate(packets) if packets else np.zeros(0, dtype=np.int64)
+    run_stage(results, capture, "filter_data_all_packets",
+              lambda: filter_data_all_packets(samples, valid, sop, eop), n, repeat, measure_memory)
+    run_stage(results, capture, "filter_data_packets_list",
+              lambda: filter_data_packets_list(samples, valid, sop, eop), n, repeat, measure_memory)
+
+    words = take_samples(samples, flat)
+    n_words = len(words)
+    fixed_prec, fixed_par = (1, 3, 12), max(1, width // 32)    # complex 16-bit I/Q lanes
+    float_prec, float_par = (4, 14), max(1, width // 32)       # 4-bit exponent + 2 x 14-bit mantissa
+    head = words[:scalar_limit]
+
+    run_stage(results, capture, "fixed_to_dec",
+              lambda: fixed_to_dec(head, fixed_prec, "y", fixed_par, "serial"), len(head), repeat, measure_memory)
+    fixed = run_stage(results, capture, "fixed_to_dec_wide",
+                      lambda: fixed_to_dec_wide(words, fixed_prec, "y", fixed_par, "serial"),
+                      n_words, repeat, measure_memory)
+    run_stage(results, capture, "float_to_dec",
+              lambda: float_to_dec(head, float_prec, "y", float_par, "serial"), len(head), repeat, measure_memory)
+    run_stage(results, capture, "float_to_dec_wide",
+              lambda: float_to_dec_wide(words, float_prec, "y", float_par, "serial"),
+              n_words, repeat, measure_memory)
+
+    values = np.asarray(fixed)[:scalar_limit] / 4.0
+    run_stage(results, capture, "convert_to_fixed",
+              lambda: convert_to_fixed(values, 1, 3, 12), values.size, repeat, measure_memory)
+
+    db_sel = {name: {"samples": take_samples(cols[name], flat)} for name in data_names}
+    run_stage(results, capture, "convert_db",
+              lambda: convert_db(db_sel, "1", fixed_prec, "y", fixed_par, "serial"),
+              n_words * len(db_sel), repeat, measure_memory)
+
+
+def git_revision():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=10,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(results, old_path):
+    """Print new/old speed ratio per (capture, stage) to stderr."""
+    with open(old_path, encoding="utf-8") as f:
+        old = {(r["capture"], r["stage"]): r for r in json.load(f)["results"]}
+    print(f"\nvs {old_path} (ratio > 1: faster now)", file=sys.stderr)
+    for r in results:
+        prev = old.get((r["capture"], r["stage"]))
+        if prev and r["min_s"] > 0:
+            print(f"  {r['capture']:4s} {r['stage']:28s} x{prev['min_s'] / r['min_s']:.2f}", file=sys.stderr)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--kinds", default="ila,stp", help="captures to generate: ila, stp or both")
+    ap.add_argument("--probes", type=int, default=8, help="data buses per capture")
+    ap.add_argument("--width", type=int, default=64, help="data bus width in bits")
+    ap.add_argument("--depth", type=int, default=100_000, help="samples per probe")
+    ap.add_argument("--density", type=float, default=0.3, help="fraction of cycles inside packets")
+    ap.add_argument("--x-fraction", type=float, default=0.05, help="fraction of cycles that are X")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--scalar-limit", type=int, default=20_000,
+                    help="samples fed to the scalar reference decoders")
+    ap.add_argument("--no-memory", action="store_true", help="skip the peak-memory pass")
+    ap.add_argument("--out", help="write JSON here instead of stdout")
+    ap.add_argument("--compare", help="earlier JSON result to compare against")
+    ap.add_argument("--keep", help="directory to keep the generated CSVs in")
+    args = ap.parse_args(argv)
+
+    params = {k: getattr(args, k) for k in ("probes", "width", "depth", "density", "x_fraction", "seed", "repeat")}
+    cols = synth_capture(args.probes, args.width, args.depth, args.density, args.x_fraction, args.seed)
+
+    work = args.keep or tempfile.mkdtemp(prefix="ila_bench_")
+    os.makedirs(work, exist_ok=True)
+    results = []
+    n_cells = args.depth * len(cols)
+    measure_memory = not args.no_memory
+
+    for kind in [k.strip() for k in args.kinds.split(",") if k.strip()]:
+        if kind == "ila":
+            path = os.path.join(work, "synthetic_ila.csv")
+            write_ila_csv(path, cols)
+            loader = lambda: load_signals_from_csv(Path(path), "")
+        elif kind == "stp":
+            path = os.path.join(work, "synthetic_stp.csv")
+            write_stp_csv(path, cols)
+            loader = lambda: load_signals_from_stp_csv(Path(path), "")
+        else:
+            ap.error(f"unknown capture kind {kind!r}")
+
+        assert detect_csv_kind(Path(path)) == ("vivado_ila" if kind == "ila" else "quartus_stp")
+        db = run_stage(results, kind, f"load_{kind}", loader, n_cells, args.repeat, measure_memory)
+        bench_capture(results, kind, db, args.width, args.repeat, measure_memory, args.scalar_limit)
+
+        if not args.keep:
+            os.remove(path)
+    if not args.keep:
+        os.rmdir(work)
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "params": params,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+"""
+Golden-equivalence check: scalar reference implementations vs their fast paths.
+
+    python golden_check.py            # full sweep
+    python golden_check.py --quick    # fewer widths / cases
+    python golden_check.py --json golden.json
+
+Pairs checked (reference -> fast):
+    fixed_to_dec          -> fixed_to_dec_wide
+    float_to_dec          -> float_to_dec_wide
+    convert_to_fixed      -> quantize(..., "convergent", "saturate") * 2**frac
+    sample_is_valid       -> valid_mask
+    _find_packet_ranges   -> _find_packet_ranges_fast
+    filter_data_*         -> build_packet_index + take_samples
+
+Inputs are randomized (seeded) plus edge cases: every sign/int/frac split,
+data_par 1..4 in serial and parallel mode, real and complex, words wider
+than one 64-bit limb, '0x' / upper-case / int spellings and 'X' samples
+(both sides must raise). Outputs are compared bit for bit after casting
+the reference into the fast dtype. The first mismatch of each pair is
+printed with its inputs; each pair also reports ref/fast speedup on a
+larger input. Exit status is 1 when any pair mismatches.
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from helper_funcs import (
+    _find_packet_ranges,
+    _find_packet_ranges_fast,
+    build_packet_index,
+    convert_to_fixed,
+    filter_data_all_packets,
+    filter_data_packets_list,
+    fixed_to_dec,
+    fixed_to_dec_wide,
+    float_to_dec,
+    float_to_dec_wide,
+    quantize,
+    sample_is_valid,
+    take_samples,
+    valid_mask,
+)
+
+FLAG_VALUES = ["1", "0", "X", "x", "", " 1 ", "0x1", "0b1", "1'b1", "1b1", "01", "2", "Z"]
+
+
+class Mismatch(Exception):
+    pass
+
+
+# ---------- Comparison ---------- #
+
+def _call(fn):
+    try:
+        return fn(), None
+    except Exception as e:  # the error itself is part of the contract
+        return None, e
+
+
+def _same_lane(ref, fast):
+    """Index of the first differing element (None when equal, -1 for shape / length)."""
+    fast = np.asarray(fast)
+    ref = np.asarray(ref, dtype=fast.dtype) if len(ref) else np.zeros(0, dtype=fast.dtype)
+    if ref.shape != fast.shape:
+        return -1
+    if fast.size == 0:
+        return None
+    if fast.dtype.kind in "fc":
+        diff = ref.view(np.uint8).reshape(ref.size, -1) != fast.view(np.uint8).reshape(fast.size, -1)
+        bad = np.flatnonzero(diff.any(axis=1))
+    else:
+        bad = np.flatnonzero(ref != fast)
+    return int(bad[0]) if bad.size else None
+
+
+def check_pair(case, ref_fn, fast_fn, lanes=False, inputs=None):
+    """Run both sides; raise Mismatch describing the first difference."""
+    ref, ref_err = _call(ref_fn)
+    fast, fast_err = _call(fast_fn)
+
+    if ref_err is not None or fast_err is not None:
+        if ref_err is None or fast_err is None:
+            raise Mismatch(f"{case}: reference raised {ref_err!r}, fast raised {fast_err!r}")
+        return
+
+    ref_lanes = ref if lanes else [ref]
+    fast_lanes = fast if lanes else [fast]
+    if len(ref_lanes) != len(fast_lanes):
+        raise Mismatch(f"{case}: {len(ref_lanes)} reference lanes vs {len(fast_lanes)} fast lanes")
+    for k, (r, f) in enumerate(zip(ref_lanes, fast_lanes)):
+        bad = _same_lane(r, f)
+        if bad is None:
+            continue
+        where = f"lane {k}, " if lanes else ""
+        if bad < 0:
+            raise Mismatch(f"{case}: {where}length {len(r)} vs {len(f)}")
+        src = ""
+        if inputs is not None and bad < len(inputs):
+            src = f", input {inputs[bad]!r}"
+        raise Mismatch(f"{case}: {where}index {bad}{src}: reference {r[bad]!r} vs fast {np.asarray(f)[bad]!r}")
+
+
+# ---------- Input generators ---------- #
+
+def random_word(rng, bits):
+    """Random non-negative int of `bits` bits (Python int, any width)."""
+    word = 0
+    for _ in range(-(-bits // 32)):
+        word = (word << 32) | int(rng.integers(0, 1 << 32))
+    return word & ((1 << bits) - 1) if bits > 0 else 0
+
+
+def packed_words(rng, field_bits, n_fields, n):
+    """Words of n_fields packed fields: edge patterns per field plus random fields."""
+    word_bits = field_bits * n_fields
+    mask = (1 << field_bits) - 1
+    edges = [0, mask, 1 << (field_bits - 1), mask >> 1, 1]
+    words = []
+    for e in edges:
+        w = 0
+        for _ in range(n_fields):
+            w = (w << field_bits) | (e & mask)
+        words.append(w)
+    words += [random_word(rng, word_bits) for _ in range(max(0, n - len(words)))]
+    words.append(random_word(rng, word_bits + 7))  # junk above the used bits is ignored
+    return words
+
+
+def spell(rng, words):
+    """Mix of the spellings the decoders accept: hex, 0x-prefixed, upper case, padded, int."""
+    out = []
+    for w in words:
+        style = int(rng.integers(0, 5))
+        if style == 0:
+            out.append(f"{w:x}")
+        elif style == 1:
+            out.append(f"0x{w:X}")
+        elif style == 2:
+            out.append(f"{w:032x}")
+        elif style == 3:
+            out.append(w)
+        else:
+            out.append(f"{w:X}")
+    return out
+
+
+# ---------- Checks ---------- #
+
+def fixed_cases(rng, quick):
+    widths = range(1, 65, 7 if quick else 1)
+    for s in (0, 1):
+        for total in list(widths) + [80]:  # 80: fast path falls back to the reference
+            if total < s:
+                continue
+            splits = {0, total - s}
+            splits.add(int(rng.integers(0, total - s + 1)))
+            for m in sorted(splits):
+                n_frac = total - s - m
+                for cplx in ("y", "n"):
+                    par = int(rng.integers(1, 5))
+                    mode = "parallel" if rng.integers(0, 2) else "serial"
+                    yield (s, m, n_frac), cplx, par, mode
+
+
+def check_fixed(rng, quick):
+    count = 0
+    for prec, cplx, par, mode in fixed_cases(rng, quick):
+        field = sum(prec) * (2 if cplx == "y" else 1)
+        samples = spell(rng, packed_words(rng, field, par, 24))
+        case = f"fixed prec={prec} complex={cplx} par={par} mode={mode}"
+        check_pair(case, lambda: fixed_to_dec(samples, prec, cplx, par, mode),
+                   lambda: fixed_to_dec_wide(samples, prec, cplx, par, mode),
+                   lanes=mode == "parallel", inputs=samples if mode == "parallel" or par == 1 else None)
+        count += 1
+    # 'X' (unknown) samples must be rejected by both
+    bad = ["12ab", "X", "0"]
+    check_pair("fixed with X sample", lambda: fixed_to_dec(bad, (1, 7, 8), "n", 1, "serial"),
+               lambda: fixed_to_dec_wide(bad, (1, 7, 8), "n", 1, "serial"))
+    return count + 1
+
+
+def bench_fixed(rng, n):
+    samples = spell(rng, packed_words(rng, 32, 2, n))
+    args = ((1, 3, 12), "y", 2, "serial")
+    return n, (lambda: fixed_to_dec(samples, *args)), (lambda: fixed_to_dec_wide(samples, *args))
+
+
+def check_float(rng, quick):
+    count = 0
+    for exp_bits in range(0, 9, 4 if quick else 1):
+        for man_bits in list(range(1, 65, 9 if quick else 1)) + [70]:
+            par = int(rng.integers(1, 4))
+            mode = "parallel" if rng.integers(0, 2) else "serial"
+            prec = (exp_bits, man_bits)
+            samples = spell(rng, packed_words(rng, exp_bits + 2 * man_bits, par, 24))
+            case = f"float prec={prec} par={par} mode={mode}"
+            check_pair(case, lambda: float_to_dec(samples, prec, "y", par, mode),
+                       lambda: float_to_dec_wide(samples, prec, "y", par, mode),
+                       lanes=mode == "parallel")
+            count += 1
+    bad = ["X"]
+    check_pair("float with X sample", lambda: float_to_dec(bad, (4, 14), "y", 1, "serial"),
+               lambda: float_to_dec_wide(bad, (4, 14), "y", 1, "serial"))
+    return count + 1
+
+
+def bench_float(rng, n):
+    samples = spell(rng, packed_words(rng, 32, 2, n))
+    args = ((4, 14), "y", 2, "serial")
+    return n, (lambda: float_to_dec(samples, *args)), (lambda: float_to_dec_wide(samples, *args))
+
+
+def fixed_values(rng, s, m, n_frac, cplx, n=40):
+    """Floats around the s.m.n range: exact ties, the limits, out of range, random."""
+    lsb = 2.0 ** -n_frac
+    top = 2.0 ** m
+    lo = -top if s else 0.0
+    vals = [0.0, -0.0, lo, top - lsb, top, -top - lsb, lsb / 2, -lsb / 2, 1.5 * lsb, -2.5 * lsb, 3 * top]
+    k = rng.integers(-(1 << min(m + n_frac, 40)), 1 << min(m + n_frac, 40), size=n)
+    vals += list((k + 0.5) * lsb)  # ties
+    vals += list(rng.uniform(lo - top / 4, top * 1.25, size=n))
+    vals = np.array(vals)
+    if cplx:
+        vals = vals + 1j * rng.permutation(vals)
+    return vals
+
+
+def _convert_to_fixed_fast(x, s, m, n_frac):
+    # + 0.0 turns -0.0 into 0.0: the reference returns integers, which have no signed zero
+    return quantize(x, (s, m, n_frac), rounding="convergent", overflow="saturate") * float(2 ** n_frac) + 0.0
+
+
+def check_convert_to_fixed(rng, quick):
+    count = 0
+    for s in (0, 1):
+        for m in range(0, 21, 5 if quick else 1):
+            for n_frac in range(0, 31, 6 if quick else 2):
+                if s + m + n_frac > 53 or s + m + n_frac == 0:
+                    continue
+                for cplx in (False, True):
+                    x = fixed_values(rng, s, m, n_frac, cplx)
+                    case = f"convert_to_fixed s={s} m={m} n={n_frac} complex={cplx}"
+                    check_pair(case, lambda: convert_to_fixed(x, s, m, n_frac),
+                               lambda: _convert_to_fixed_fast(x, s, m, n_frac), inputs=x)
+                    count += 1
+    return count
+
+
+def bench_convert_to_fixed(rng, n):
+    x = rng.uniform(-9, 9, size=n)
+    return n, (lambda: convert_to_fixed(x, 1, 3, 12)), (lambda: _convert_to_fixed_fast(x, 1, 3, 12))
+
+
+def flag_column(rng, n, kind):
+    """VALID/SOP/EOP column as the readers and stores hold it."""
+    if kind == "str":
+        return [FLAG_VALUES[i] for i in rng.integers(0, len(FLAG_VALUES), size=n)]
+    if kind == "bytes":
+        return np.array([FLAG_VALUES[i] for i in rng.integers(0, len(FLAG_VALUES), size=n)], dtype=np.bytes_)
+    if kind == "int":
+        return [int(v) for v in rng.integers(0, 3, size=n)]
+    if kind == "int_array":
+        return rng.integers(0, 3, size=n)
+    return rng.integers(0, 2, size=n).astype(bool)
+
+
+def check_valid_mask(rng, quick):
+    count = 0
+    for kind in ("str", "bytes", "int", "int_array", "bool"):
+        for n in (0, 1, 7, 200):
+            col = flag_column(rng, n, kind)
+            case = f"valid_mask kind={kind} n={n}"
+            check_pair(case, lambda: np.array([sample_is_valid(v) for v in col], dtype=bool),
+                       lambda: valid_mask(col), inputs=col)
+            count += 1
+    return count
+
+
+def bench_valid_mask(rng, n):
+    col = flag_column(rng, n, "str")
+    return n, (lambda: [sample_is_valid(v) for v in col]), (lambda: valid_mask(col))
+
+
+def _filters_fast(samples, valid, sop, eop):
+    packets = build_packet_index(len(samples), valid, sop, eop)
+    flat = np.concatenate(packets) if packets else np.zeros(0, dtype=np.int64)
+    return take_samples(samples, flat), [take_samples(samples, idx) for idx in packets]
+
+
+def packet_cases(rng, quick):
+    sizes = (0, 1, 2, 5, 64, 300) if quick else (0, 1, 2, 3, 5, 17, 64, 300, 1000)
+    kinds = ("str", "bytes", "int", "int_array", "bool")
+    for n in sizes:
+        for _ in range(3 if quick else 12):
+            cols = []
+            for _ in range(3):  # valid, sop, eop
+                pick = int(rng.integers(0, 7))
+                if pick == 0:
+                    cols.append(None)
+                elif pick == 1:
+                    cols.append([])
+                else:
+                    cols.append(flag_column(rng, n, kinds[pick - 2]))
+            yield n, cols
+
+
+def check_packets(rng, quick):
+    count = 0
+    for n, (valid, sop, eop) in packet_cases(rng, quick):
+        samples = [f"{i:x}" for i in range(n)]
+        case = (f"packets n={n} valid={type(valid).__name__} sop={type(sop).__name__} "
+                f"eop={type(eop).__name__}")
+        ranges_ref, ranges_fast = _find_packet_ranges(n, sop, eop), _find_packet_ranges_fast(n, sop, eop)
+        if ranges_ref != ranges_fast:
+            raise Mismatch(f"{case}: ranges {ranges_ref[:5]}... vs {ranges_fast[:5]}...")
+
+        fast_all, fast_list = _filters_fast(samples, valid, sop, eop)
+        check_pair(case + " all_packets", lambda: filter_data_all_packets(samples, valid, sop, eop),
+                   lambda: fast_all)
+        ref_list = filter_data_packets_list(samples, valid, sop, eop)
+        if ref_list != fast_list:
+            raise Mismatch(f"{case} packets_list: {len(ref_list)} reference packets vs {len(fast_list)} fast")
+        count += 1
+    return count
+
+
+def bench_packets(rng, n):
+    # Capture-like control: 64-cycle packets, valid ~90% of cycles
+    samples = [f"{i:x}" for i in range(n)]
+    pos = np.arange(n)
+    valid = np.where(rng.random(n) < 0.9, "1", "0").tolist()
+    sop = np.where(pos % 64 == 0, "1", "0").tolist()
+    eop = np.where(pos % 64 == 63, "1", "0").tolist()
+    return (n, (lambda: filter_data_all_packets(samples, valid, sop, eop)),
+            (lambda: _filters_fast(samples, valid, sop, eop)[0]))
+
+
+PAIRS = [
+    ("fixed_to_dec -> fixed_to_dec_wide", check_fixed, bench_fixed),
+    ("float_to_dec -> float_to_dec_wide", check_float, bench_float),
+    ("convert_to_fixed -> quantize", check_convert_to_fixed, bench_convert_to_fixed),
+    ("sample_is_valid -> valid_mask", check_valid_mask, bench_valid_mask),
+    ("filter_data_* -> build_packet_index", check_packets, bench_packets),
+]
+
+
+def best_time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--quick", action="store_true", help="sample the width grid instead of sweeping it")
+    ap.add_argument("--bench-size", type=int, default=50_000, help="samples for the speedup measurement")
+    ap.add_argument("--json", help="also write the results here")
+    args = ap.parse_args(argv)
+
+    results = []
+    failed = False
+    for name, check, bench in PAIRS:
+        rng = np.random.default_rng(args.seed)
+        row = {"pair": name, "cases": 0, "ok": True, "mismatch": None, "speedup": None}
+        try:
+            row["cases"] = check(rng, args.quick)
+        except Mismatch as e:
+            row["ok"] = False
+            row["mismatch"] = str(e)
+            failed = True
+
+        n, ref_fn, fast_fn = bench(rng, args.bench_size)
+        t_ref, t_fast = best_time(ref_fn), best_time(fast_fn)
+        row.update(bench_items=n, ref_s=t_ref, fast_s=t_fast, speedup=t_ref / t_fast if t_fast > 0 else None)
+        results.append(row)
+
+        status = f"{row['cases']} cases OK" if row["ok"] else "MISMATCH"
+        print(f"{name:40s} {status:16s} speedup x{row['speedup']:.1f} ({n} items)")
+        if not row["ok"]:
+            print(f"    first mismatch: {row['mismatch']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"seed": args.seed, "quick": args.quick, "results": results}, f, indent=2)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
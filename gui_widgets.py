@@ -0,0 +1,166 @@
+import re
+import tkinter as tk
+from tkinter import ttk
+
+from helper_funcs import compile_name_filter
+
+
+def matplotlib_tk():
+    """
+    (Figure, FigureCanvasTkAgg, NavigationToolbar2Tk), importing matplotlib
+    on the first plot instead of at startup.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+    return Figure, FigureCanvasTkAgg, NavigationToolbar2Tk
+
+
+class FilteredListbox(ttk.Frame):
+    """
+    Listbox backed by a Python item list and an index view, with a
+    type-ahead filter entry (substring / glob / regex).
+
+    Items are pushed to Tk in one call per refresh (the Tk listbox itself only
+    draws the visible rows), and substring filtering narrows the previous view
+    when the new pattern extends the old one, so typing stays responsive on
+    10K+ signal captures.
+    """
+
+    FILTER_MODES = ("substring", "glob", "regex")
+    FILTER_DELAY_MS = 120
+
+    def __init__(self, parent, selectmode="extended", height=8, width=None, show_filter=True, **kwargs):
+        super().__init__(parent, **kwargs)
+
+        self._items = []    # full names (what callers get back)
+        self._display = []  # what the listbox shows
+        self._view = []     # indices into self._items currently shown
+        self._last_key = None
+        self._after_id = None
+
+        self.filter_var = tk.StringVar(value="")
+        self.filter_mode_var = tk.StringVar(value="substring")
+        self.count_var = tk.StringVar(value="")
+
+        row = 0
+        if show_filter:
+            bar = ttk.Frame(self)
+            bar.grid(row=0, column=0, columnspan=2, sticky="we", pady=(0, 2))
+
+            ttk.Label(bar, text="Filter:").pack(side="left")
+            self.filter_entry = ttk.Entry(bar, textvariable=self.filter_var)
+            self.filter_entry.pack(side="left", fill="x", expand=True, padx=(4, 4))
+            ttk.Combobox(
+                bar,
+                state="readonly",
+                width=9,
+                textvariable=self.filter_mode_var,
+                values=self.FILTER_MODES,
+            ).pack(side="left")
+            ttk.Label(bar, textvariable=self.count_var).pack(side="left", padx=(6, 0))
+
+            self.filter_var.trace_add("write", self._schedule_filter)
+            self.filter_mode_var.trace_add("write", self._schedule_filter)
+            row = 1
+        else:
+            self.filter_entry = None
+
+        lb_kwargs = {"selectmode": selectmode, "height": height, "exportselection": False}
+        if width is not None:
+            lb_kwargs["width"] = width
+        self.listbox = tk.Listbox(self, **lb_kwargs)
+        self.listbox.grid(row=row, column=0, sticky="nsew")
+        scroll = ttk.Scrollbar(self, orient="vertical", command=self.listbox.yview)
+        scroll.grid(row=row, column=1, sticky="ns")
+        self.listbox.config(yscrollcommand=scroll.set)
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(row, weight=1)
+
+    # --- Items ---
+
+    def set_items(self, items, display=None):
+        """Replace the backing items (full names) and optional display strings."""
+        self._items = list(items)
+        self._display = list(display) if display is not None else list(self._items)
+        self._last_key = None
+        self._apply_filter(keep_selection=False)
+
+    def visible_items(self):
+        return [self._items[i] for i in self._view]
+
+    def selected_indices(self):
+        """Indices into the backing item list for the current selection."""
+        return [self._view[pos] for pos in self.listbox.curselection()]
+
+    def selected_items(self):
+        return [self._items[i] for i in self.selected_indices()]
+
+    def curselection(self):
+        return self.listbox.curselection()
+
+    def flush_filter(self):
+        """Apply a pending (debounced) filter change immediately."""
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._apply_filter()
+
+    def focus_filter(self):
+        if self.filter_entry is not None:
+            self.filter_entry.focus_set()
+
+    # --- Filtering ---
+
+    def _schedule_filter(self, *_):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self._after_id = self.after(self.FILTER_DELAY_MS, self._apply_filter)
+
+    def _apply_filter(self, keep_selection=True):
+        self._after_id = None
+        pattern = self.filter_var.get().strip()
+        mode = self.filter_mode_var.get()
+        key = (mode, pattern.lower())
+
+        if key == self._last_key:
+            return
+
+        if not pattern:
+            view = list(range(len(self._items)))
+        else:
+            try:
+                match = compile_name_filter(pattern, mode)
+            except re.error:
+                # Incomplete regex while typing: keep the current view
+                # (unless the items were just replaced)
+                if self._last_key is not None:
+                    return
+                match = lambda name: True
+
+            # Substring filters only narrow as the pattern grows
+            last = self._last_key
+            if last is not None and mode == "substring" and last[0] == mode and last[1] and last[1] in key[1]:
+                candidates = self._view
+            else:
+                candidates = range(len(self._items))
+            view = [i for i in candidates if match(self._display[i])]
+
+        selected = set(self.selected_indices()) if keep_selection else set()
+
+        self._view = view
+        self._last_key = key
+
+        self.listbox.delete(0, tk.END)
+        if view:
+            self.listbox.insert(tk.END, *[self._display[i] for i in view])
+
+        if selected:
+            for pos, i in enumerate(view):
+                if i in selected:
+                    self.listbox.selection_set(pos)
+
+        if len(view) == len(self._items):
+            self.count_var.set(f"{len(view)}")
+        else:
+            self.count_var.set(f"{len(view)}/{len(self._items)}")
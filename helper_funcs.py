@@ -1,83 +1,1055 @@
+import atexit
 import csv
+import fnmatch
+import itertools
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import wraps
 from pathlib import Path
 import numpy as np
-from scipy.io import loadmat
-from scipy.io.matlab.mio5_params import mat_struct
 
-# ------------------------
-#  Core conversion helpers
-# ------------------------
+# scipy (MAT v5, EMA filter) and h5py (MAT v7.3) are imported where first
+# needed, so starting the app and parsing CSVs does not pay for them.
 
-# ---------- MAT Helpers ---------- #
-def _matobj_to_dict(obj):
+# ---------- Profiling ---------- #
+
+class _Span:
+    __slots__ = ("items",)
+
+    def __init__(self, items=None):
+        self.items = items
+
+
+class Profiler:
     """
-    Recursively convert scipy.io.matlab.mat_struct and object arrays
-    into nested Python dict / list / numpy arrays.
+    Records timed spans (wall time, items processed, optional peak traced
+    memory) for the decode pipeline and tab actions. Off by default; a
+    disabled span costs one flag check. Thread-safe (batch workers).
+    tracemalloc's peak is process-wide, so only main-thread spans measure
+    memory; worker-thread spans record no peak (their allocations still
+    count towards the enclosing main-thread span).
     """
-    if isinstance(obj, mat_struct):
+
+    def __init__(self):
+        self.enabled = False
+        self.track_memory = False
+        self.events = []  # (name, start_s, dur_s, items, peak_bytes, thread_id)
+        self.version = 0  # bumped per recorded span (cheap change check for the UI)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._t0 = time.perf_counter()
+
+    def enable(self, track_memory=False):
+        self.track_memory = track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not track_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def reset(self):
+        with self._lock:
+            self.events = []
+            self.version += 1
+
+    @contextmanager
+    def span(self, name, items=None):
+        """with PROFILER.span("stage", items=n) as sp: ... (sp.items may be set inside)"""
+        sp = _Span(items)
+        if not self.enabled:
+            yield sp
+            return
+
+        mem = (
+            self.track_memory and tracemalloc.is_tracing()
+            and threading.current_thread() is threading.main_thread()
+        )
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        if mem:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)  # parent keeps its peak so far
+            tracemalloc.reset_peak()
+            frame = [current, 0]
+        else:
+            frame = [0, 0]
+        stack.append(frame)
+
+        start = time.perf_counter()
+        try:
+            yield sp
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            peak_bytes = None
+            if mem and tracemalloc.is_tracing():
+                peak = max(tracemalloc.get_traced_memory()[1], frame[1])
+                peak_bytes = max(0, peak - frame[0])
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], peak)
+            with self._lock:
+                self.events.append(
+                    (name, start - self._t0, end - start, sp.items, peak_bytes, threading.get_ident())
+                )
+                self.version += 1
+
+    def summary(self):
+        """{name: {"calls", "seconds", "items", "peak_bytes"}} ordered by total time."""
         out = {}
-        for name in obj._fieldnames:
-            value = getattr(obj, name)
-            out[name] = _matobj_to_dict(value)
-        return out
+        with self._lock:
+            events = list(self.events)
+        for name, _, dur, items, peak, _ in events:
+            row = out.setdefault(name, {"calls": 0, "seconds": 0.0, "items": 0, "peak_bytes": None})
+            row["calls"] += 1
+            row["seconds"] += dur
+            if items:
+                row["items"] += int(items)
+            if peak is not None:
+                row["peak_bytes"] = max(row["peak_bytes"] or 0, peak)
+        return dict(sorted(out.items(), key=lambda kv: -kv[1]["seconds"]))
+
+    def summary_text(self, top=4):
+        """One line for a status bar: the slowest operations with throughput."""
+        parts = []
+        for name, row in list(self.summary().items())[:top]:
+            text = f"{name} {row['seconds'] * 1e3:.0f} ms"
+            if row["items"] and row["seconds"] > 0:
+                text += f" ({row['items'] / row['seconds'] / 1e6:.2f} M/s)"
+            if row["peak_bytes"]:
+                text += f" peak {row['peak_bytes'] / 2**20:.1f} MB"
+            if row["calls"] > 1:
+                text += f" x{row['calls']}"
+            parts.append(text)
+        return " | ".join(parts)
+
+    def dump_chrome_trace(self, path):
+        """Write the spans as Chrome trace JSON (chrome://tracing, Perfetto)."""
+        with self._lock:
+            events = list(self.events)
+        pid = os.getpid()
+        trace = []
+        for name, start, dur, items, peak, tid in events:
+            args = {}
+            if items is not None:
+                args["items"] = int(items)
+            if peak is not None:
+                args["peak_bytes"] = int(peak)
+            trace.append({
+                "name": name, "ph": "X", "pid": pid, "tid": tid,
+                "ts": start * 1e6, "dur": dur * 1e6, "args": args,
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+
+PROFILER = Profiler()
+
+
+def profiled(name=None, items=None):
+    """
+    Decorator: run the call inside a PROFILER span.
+    items(result, *args, **kwargs) -> count of rows/samples processed
+    (only evaluated while profiling is enabled).
+    """
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with PROFILER.span(label) as sp:
+                result = func(*args, **kwargs)
+                if items is not None:
+                    sp.items = items(result, *args, **kwargs)
+                return result
+
+        return wrapper
 
-    # cell arrays or struct arrays become lists
-    if isinstance(obj, np.ndarray) and obj.dtype == object:
-        return [_matobj_to_dict(v) for v in obj.flat]
+    return decorate
 
-    # numeric arrays, strings, scalars – leave as is
-    return obj
+
+def db_sample_count(db):
+    """Total samples in a {name: {"samples": ...}} database (profiling item counts)."""
+    total = 0
+    for info in db.values():
+        samples = info["samples"]
+        if isinstance(samples, list) and samples and isinstance(samples[0], np.ndarray):
+            total += sum(len(a) for a in samples)
+        else:
+            total += len(samples)
+    return total
 
 
+# ------------------------
+#  Core conversion helpers
+# ------------------------
+
+# ---------- MAT Helpers ---------- #
 def _flatten_struct(obj, parent_key="", sep="."):
     """
-    Walk nested dict/list and yield (path, leaf_array).
-    Only emits leaves that can be interpreted as numeric numpy arrays.
+    Walk loaded MAT values (mat_struct / cell or struct arrays / arrays) and
+    yield (path, leaf_array). Only numeric leaves are emitted; they are
+    passed through as loaded (no per-leaf copy).
     """
-    if isinstance(obj, dict):
-        for k, v in obj.items():
+    from scipy.io.matlab import mat_struct
+
+    if isinstance(obj, mat_struct):
+        for k in obj._fieldnames:
             new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            yield from _flatten_struct(v, new_key, sep)
+            yield from _flatten_struct(getattr(obj, k), new_key, sep)
 
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
+    elif isinstance(obj, np.ndarray) and obj.dtype == object:
+        # cell arrays or struct arrays
+        for i, v in enumerate(obj.flat):
             new_key = f"{parent_key}{sep}{i}" if parent_key else str(i)
             yield from _flatten_struct(v, new_key, sep)
 
-    else:
-        # leaf – try to interpret as numeric array
-        arr = np.array(obj)
-        if np.issubdtype(arr.dtype, np.number):
-            # Only emit if we have a meaningful name
-            if parent_key:
-                yield parent_key, arr
+    elif parent_key:  # Only emit if we have a meaningful name
+        if isinstance(obj, np.ndarray):
+            if np.issubdtype(obj.dtype, np.number):
+                yield parent_key, obj
+        elif isinstance(obj, (int, float, complex, np.number)) and not isinstance(obj, bool):
+            yield parent_key, np.asarray(obj)
+
+
+def index_mat_v5(path):
+    """
+    List the variables of a (non-v7.3) MAT file without loading them:
+        [ (name, shape, matlab_class), ... ]
+    Raises NotImplementedError for v7.3 files (like loadmat).
+    """
+    from scipy.io import whosmat
+
+    return whosmat(path)
 
 
-def collect_signals_v5(path):
+@profiled("mat.load_v5", items=lambda r, *a, **k: sum(np.size(v) for v in r.values()))
+def collect_signals_v5(path, variable_names=None):
     """
     Load a (non-v7.3) MAT file and return:
         { "var.subfield[.subsub]": np.ndarray, ... }
+    variable_names limits loading to those top-level variables.
     """
-    raw = loadmat(path, struct_as_record=False, squeeze_me=True)
+    from scipy.io import loadmat
 
-    # Strip MATLAB internal keys
-    top = {}
-    for k, v in raw.items():
-        if k.startswith("__"): # Meta data
-            continue
-        top[k] = _matobj_to_dict(v)
+    raw = loadmat(
+        path,
+        struct_as_record=False,
+        squeeze_me=True,
+        variable_names=list(variable_names) if variable_names is not None else None,
+    )
 
     signals = {}
-    for top_name, top_val in top.items():
+    for top_name, top_val in raw.items():
+        if top_name.startswith("__"):  # Meta data
+            continue
         for name, arr in _flatten_struct(top_val, parent_key=top_name):
             signals[name] = arr
 
     return signals
 
 
+class LazyArray:
+    """
+    Array that stays in its file: shape / dtype are known up front, data is
+    read by load() / np.asarray(), or one slice at a time with x[a:b] (1-D).
+    read(key) returns the full array for key=None, else the 1-D slice.
+    owner keeps the backing file open for as long as this array is alive.
+    """
+
+    def __init__(self, shape, dtype, read, source="", owner=None):
+        self.shape = tuple(int(d) for d in shape)
+        self.dtype = np.dtype(dtype)
+        self.source = source
+        self._read = read
+        self._owner = owner
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def nbytes(self):
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("len() of unsized LazyArray")
+        return self.shape[0]
+
+    def load(self):
+        return self._read(None)
+
+    def __array__(self, dtype=None, copy=None):
+        arr = self.load()
+        return arr.astype(dtype, copy=False) if dtype is not None else arr
+
+    def __getitem__(self, key):
+        if self.ndim == 1 and isinstance(key, slice) and key.step in (None, 1):
+            return self._read(key)
+        return self.load()[key]
+
+    def __repr__(self):
+        return f"LazyArray(shape={self.shape}, dtype={self.dtype}, source={self.source!r})"
+
+
+_MAT_NUMERIC_CLASSES = {
+    "double", "single", "logical",
+    "int8", "uint8", "int16", "uint16", "int32", "uint32", "int64", "uint64",
+}
+
+
+def _h5_attr_str(obj, key):
+    val = obj.attrs.get(key, b"")
+    return val.decode("ascii", "ignore") if isinstance(val, bytes) else str(val)
+
+
+class _SharedFile:
+    """Open file shared by LazyArrays; closed once the last of them is garbage-collected."""
+
+    def __init__(self, f):
+        self.file = f
+        self._finalizer = weakref.finalize(self, f.close)
+
+    def close(self):
+        self._finalizer()
+
+
+def _h5_lazy_leaf(ds, name, owner=None):
+    """LazyArray for one MATLAB numeric dataset (None for char/empty/other classes)."""
+    if _h5_attr_str(ds, "MATLAB_class") not in _MAT_NUMERIC_CLASSES:
+        return None
+    if ds.attrs.get("MATLAB_empty", 0):
+        return None
+
+    fields = ds.dtype.names
+    if fields and "real" in fields and "imag" in fields:
+        dtype = np.result_type(ds.dtype["real"], np.complex64)
+    elif fields:
+        return None
+    else:
+        dtype = ds.dtype
+
+    # HDF5 holds MATLAB's column-major array transposed; squeeze like loadmat(squeeze_me=True)
+    mat_shape = ds.shape[::-1]
+    shape = tuple(d for d in mat_shape if d != 1)
+    long_axes = [ax for ax, d in enumerate(ds.shape) if d != 1]
+
+    def combine(data):
+        if data.dtype.names:
+            out = np.empty(data.shape, dtype=dtype)
+            out.real = data["real"]
+            out.imag = data["imag"]
+            return out
+        return data
+
+    def read(key):
+        if key is not None and len(long_axes) == 1:
+            sel = [0] * len(ds.shape)
+            sel[long_axes[0]] = key
+            return combine(ds[tuple(sel)])
+        data = combine(ds[()])
+        data = np.ascontiguousarray(data.T).reshape(shape)
+        return data if key is None else data[key]
+
+    return LazyArray(shape, dtype, read, source=name, owner=owner)
+
+
+@profiled("mat.index_v73", items=lambda r, *a, **k: len(r))
+def index_signals_v73(path):
+    """
+    Open a MAT v7.3 (HDF5) file and return { "var.subfield[.i]": LazyArray, ... }
+    Only the group tree and dataset headers are read; data is pulled when a
+    signal is used. Structs are walked like _flatten_struct; cell / struct
+    arrays (object references) yield one leaf per element.
+    """
+    try:
+        import h5py  # optional: only needed for MAT v7.3 (HDF5) files
+    except ImportError:
+        raise ImportError("MAT v7.3 files need the 'h5py' package (pip install h5py).") from None
+
+    # Closed when the last LazyArray from this file is dropped (e.g. replaced on reload)
+    owner = _SharedFile(h5py.File(path, "r"))
+    f = owner.file
+    signals = {}
+
+    def walk(item, name):
+        if isinstance(item, h5py.Group):
+            for key, child in item.items():
+                if key.startswith("#"):  # #refs# / #subsystem#
+                    continue
+                walk(child, f"{name}.{key}" if name else key)
+        elif isinstance(item, h5py.Dataset):
+            if item.dtype == h5py.ref_dtype:
+                refs = item[()].T.reshape(-1)  # MATLAB (column-major) element order
+                for i, ref in enumerate(refs):
+                    if ref:
+                        walk(f[ref], f"{name}.{i}")
+                return
+            leaf = _h5_lazy_leaf(item, name, owner)
+            if leaf is not None:
+                signals[name] = leaf
+
+    try:
+        walk(f, "")
+    except Exception:
+        owner.close()
+        raise
+    if not signals:
+        owner.close()
+    return signals
+
+
 # ---------- DSP Helpers ---------- #
+
+QUAN_ROUNDING = ("nearest", "round", "convergent", "floor", "fix")
+QUAN_OVERFLOW = ("saturate", "wrap")
+
+
+def quantize(x, prec, rounding=None, overflow=None, out=None):
+    """
+    Vectorized s.m.n fixed-point quantization (real or complex, per part).
+    prec: {"s", "m", "n"[, "round", "overflow"]} or (s, m, n); s = sign bit,
+          m = integer bits, n = fractional bits (as convert_to_fixed).
+    rounding: nearest (half up, default) | round (half away from zero) |
+              convergent (half even) | floor | fix (toward zero)
+    overflow: saturate (default) | wrap (two's complement / modulo)
+    Returns values on the 2^-n grid as float64/complex128, written into out
+    when given (out may be x itself). Exact up to 53 total bits.
+    """
+    if isinstance(prec, dict):
+        s, m, n = int(prec["s"]), int(prec["m"]), int(prec["n"])
+        rounding = rounding or prec.get("round")
+        overflow = overflow or prec.get("overflow")
+    else:
+        s, m, n = (int(v) for v in prec)
+    rounding = rounding or "nearest"
+    overflow = overflow or "saturate"
+    if rounding not in QUAN_ROUNDING:
+        raise ValueError(f"Unknown rounding mode '{rounding}'.")
+    if overflow not in QUAN_OVERFLOW:
+        raise ValueError(f"Unknown overflow mode '{overflow}'.")
+
+    x = np.asarray(x)
+    is_complex = np.iscomplexobj(x)
+    if out is None:
+        out = np.empty(x.shape, dtype=np.complex128 if is_complex else np.float64)
+
+    if is_complex:
+        _quantize_part(x.real, out.real, s, m, n, rounding, overflow)
+        _quantize_part(x.imag, out.imag, s, m, n, rounding, overflow)
+    else:
+        _quantize_part(x, out.real if np.iscomplexobj(out) else out, s, m, n, rounding, overflow)
+        if np.iscomplexobj(out):
+            out.imag = 0
+    return out
+
+
+def _quantize_part(x, out, s, m, n, rounding, overflow):
+    """Quantize one real array into out (in place when out is x)."""
+    mag_bits = m + n
+    lo = -(2.0 ** mag_bits) if s == 1 else 0.0
+    hi = 2.0 ** mag_bits - 1
+
+    np.multiply(x, 2.0 ** n, out=out)
+    if rounding == "nearest":
+        np.add(out, 0.5, out=out)
+        np.floor(out, out=out)
+    elif rounding == "round":
+        half = np.copysign(0.5, out)
+        np.add(out, half, out=out)
+        np.trunc(out, out=out)
+    elif rounding == "convergent":
+        np.rint(out, out=out)
+    elif rounding == "floor":
+        np.floor(out, out=out)
+    else:
+        np.trunc(out, out=out)
+
+    if overflow == "saturate":
+        np.clip(out, lo, hi, out=out)
+    else:
+        # out - span * floor((out - lo) / span); exact, span is a power of two
+        span = hi - lo + 1
+        wraps = np.subtract(out, lo)
+        np.multiply(wraps, 1.0 / span, out=wraps)
+        np.floor(wraps, out=wraps)
+        np.multiply(wraps, span, out=wraps)
+        np.subtract(out, wraps, out=out)
+
+    np.multiply(out, 2.0 ** -n, out=out)
+    return out
+
+
+CHAIN_BLOCK = 1 << 16  # samples per block in streaming chain execution
+
+
+def _fir_out_range(n_in, n_taps, L, mode):
+    """(first full-convolution index kept, kept length) for np.convolve(up(x), h, mode)."""
+    n_up = n_in * L
+    if n_up == 0:
+        return 0, 0  # an empty signal has no outputs (np.convolve rejects it)
+    if mode == "full":
+        return 0, n_up + n_taps - 1
+    return (min(n_up, n_taps) - 1) // 2, max(n_up, n_taps)
+
+
+FIR_FFT_TAPS = 64  # sub-filters at least this long use overlap-add FFT convolution
+
+
+def _next_pow2(n):
+    return 1 << max(0, int(n) - 1).bit_length()
+
+
+def ola_convolve(x, h, nfft=None, kernel_fft=None):
+    """
+    Full linear convolution by overlap-add FFT blocks; same result as
+    np.convolve(x, h) up to rounding. nfft defaults to ~8x the filter length.
+    kernel_fft(nfft, is_complex) may supply a precomputed spectrum of h.
+    """
+    x = np.asarray(x).reshape(-1)
+    h = np.asarray(h).reshape(-1)
+    nx, nh = x.size, h.size
+    dtype = np.result_type(x, h, np.float64)
+    if nx == 0 or nh == 0:
+        return np.zeros(0, dtype=dtype)
+
+    if nfft is None:
+        nfft = min(_next_pow2(8 * nh), _next_pow2(nx + nh - 1))
+    nfft = max(int(nfft), _next_pow2(2 * nh - 1))
+    B = nfft - nh + 1  # new input samples per FFT block (>= nh, so tails don't stack)
+
+    is_complex = np.iscomplexobj(x) or np.iscomplexobj(h)
+    if is_complex:
+        fwd, inv = np.fft.fft, np.fft.ifft
+    else:
+        fwd, inv = np.fft.rfft, np.fft.irfft
+    H = kernel_fft(nfft, is_complex) if kernel_fft is not None else fwd(h, nfft)
+
+    n_blocks = -(-nx // B)
+    out = np.zeros((n_blocks + 1) * B, dtype=dtype)
+    rows = max(1, (1 << 20) // nfft)  # bound the FFT work buffer
+    for r0 in range(0, n_blocks, rows):
+        r1 = min(n_blocks, r0 + rows)
+        seg = np.zeros((r1 - r0, B), dtype=x.dtype)
+        flat = x[r0 * B:r1 * B]
+        seg.reshape(-1)[:flat.size] = flat
+        Y = inv(fwd(seg, nfft, axis=1) * H, nfft, axis=1)
+        out[r0 * B:r1 * B] += Y[:, :B].reshape(-1)
+        if nh > 1:
+            tails = np.zeros((r1 - r0, B), dtype=dtype)
+            tails[:, :nh - 1] = Y[:, B:]
+            out[(r0 + 1) * B:(r1 + 1) * B] += tails.reshape(-1)
+    return out[:nx + nh - 1]
+
+
+def _convolve_valid(z, g, kernel_fft=None):
+    """np.convolve(z, g, "valid"), via overlap-add FFT for long (inexact) filters."""
+    if g.size >= FIR_FFT_TAPS and z.size >= 2 * g.size and np.result_type(z, g).kind in "fc":
+        return ola_convolve(z, g, kernel_fft=kernel_fft)[g.size - 1:z.size]
+    return np.convolve(z, g, mode="valid")
+
+
+class FirDesign:
+    """
+    FIR taps plus the polyphase branches and FFT kernel spectra derived from
+    them, built lazily and kept for reuse across chain runs / signals.
+    """
+
+    def __init__(self, h):
+        self.h = np.asarray(h).reshape(-1)
+        self._branches = {}  # (L, S, r) -> [h[r::L][v::S] for v < S]
+        self._spectra = {}   # (L, S, r, v, nfft, is_complex) -> FFT of that sub-filter
+
+    def branch(self, L, S, r):
+        key = (L, S, r)
+        subs = self._branches.get(key)
+        if subs is None:
+            hr = self.h[r::L]
+            subs = [hr[v::S] for v in range(min(S, hr.size))]
+            self._branches[key] = subs
+        return subs
+
+    def kernel_fft(self, L, S, r, v):
+        """kernel_fft callable for ola_convolve() on sub-filter (r, v)."""
+        def spectrum(nfft, is_complex):
+            key = (L, S, r, v, nfft, is_complex)
+            H = self._spectra.get(key)
+            if H is None:
+                g = self.branch(L, S, r)[v]
+                H = np.fft.fft(g, nfft) if is_complex else np.fft.rfft(g, nfft)
+                self._spectra[key] = H
+            return H
+        return spectrum
+
+
+class FirDesignCache:
+    """Small LRU of FirDesign objects keyed by coefficient source."""
+
+    def __init__(self, max_entries=32):
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_build(self, key, build):
+        """Return the design cached under key, or FirDesign(build()) stored for next time."""
+        with self._lock:
+            design = self._entries.get(key)
+            if design is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return design
+            self.misses += 1
+
+        design = FirDesign(build())
+        with self._lock:
+            self._entries[key] = design
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return design
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FirResampler:
+    """
+    Stateful rational L/M FIR, equal to np.convolve(zero-stuffed x, h, mode)[::M]
+    without building the zero-stuffed signal: polyphase, only the kept
+    outputs are computed (long sub-filters go through ola_convolve).
+    Samples can be pushed in blocks; only the taps' worth of input is kept
+    between blocks. h may be a FirDesign to reuse its branches / FFT kernels.
+    """
+
+    def __init__(self, h, L=1, M=1, n_in=0, mode="same"):
+        self.design = h if isinstance(h, FirDesign) else FirDesign(h)
+        self.h = self.design.h
+        self.L = max(1, int(L))
+        self.M = max(1, int(M))
+        if mode not in ("same", "full"):
+            raise ValueError("fir_type must be 'same' or 'full'.")
+
+        start, length = _fir_out_range(int(n_in), self.h.size, self.L, mode)
+        self.n_in = int(n_in)
+        self.n_out = -(-length // self.M) if length > 0 else 0
+        self._k_first = start                 # full-conv index of output 0
+        self._next = 0                        # next output index to emit
+        self._hist = np.zeros(0, dtype=self.h.dtype)
+        self._hist_start = 0                  # input index of _hist[0]
+        self._seen = 0                        # input samples received
+
+        # Output i has full-conv index k = k_first + M*i. Outputs P apart share
+        # the polyphase branch h[r::L] and step S inputs apart.
+        g = np.gcd(self.L, self.M)
+        self._P = self.L // g
+        self._S = self.M // g
+
+    def _emit(self, k_stop):
+        """Outputs whose full-conv index is < k_stop (all their inputs are in _hist)."""
+        dtype = np.result_type(self._hist, self.h)
+        stop = min(self.n_out, max(0, -(-(k_stop - self._k_first) // self.M)))
+        n = stop - self._next
+        if n <= 0:
+            return np.zeros(0, dtype=dtype)
+
+        L, S, P = self.L, self._S, self._P
+        k0 = self._k_first + self.M * self._next
+
+        # Zero-padded input window covering every sample these outputs touch
+        q_lo = (k0 - self.h.size + 1) // L
+        q_hi = (k0 + self.M * (n - 1)) // L
+        xp = np.zeros(q_hi - q_lo + 1, dtype=self._hist.dtype)
+        a = max(self._hist_start, q_lo)
+        b = min(self._hist_start + self._hist.size, q_hi + 1)
+        if b > a:
+            xp[a - q_lo:b - q_lo] = self._hist[a - self._hist_start:b - self._hist_start]
+
+        # y[k] = sum_t h[r + t*L] * x[q - t]  (k = q*L + r); split t = u*S + v
+        y = np.zeros(n, dtype=dtype)
+        for c in range(min(P, n)):
+            J = -(-(n - c) // P)
+            k_c = k0 + self.M * c
+            q_c, r = divmod(k_c, L)
+            for v, g in enumerate(self.design.branch(L, S, r)):
+                U = g.size
+                s0 = q_c - v - S * (U - 1) - q_lo
+                z = xp[s0:s0 + S * (J + U - 2) + 1:S]
+                y[c::P] += _convolve_valid(z, g, self.design.kernel_fft(L, S, r, v))
+
+        self._next = stop
+        return y
+
+    def process(self, block):
+        block = np.asarray(block).reshape(-1)
+        self._hist = np.concatenate((self._hist, block))  # copy: callers may reuse block buffers
+        self._seen += block.size
+        y = self._emit(self._seen * self.L)
+
+        # Drop inputs no future output can use
+        k_next = self._k_first + self.M * self._next
+        p_min = max(0, -(-(k_next - self.h.size + 1) // self.L))
+        drop = min(max(0, p_min - self._hist_start), self._hist.size)
+        if drop:
+            self._hist = self._hist[drop:]
+            self._hist_start += drop
+        return y
+
+    def flush(self):
+        return self._emit(np.iinfo(np.int64).max // 2)
+
+
+def stream_whole(stream, x):
+    """Run a FirResampler-style stream over a whole array in one go."""
+    x = np.asarray(x).reshape(-1)
+    return np.concatenate((stream.process(x), stream.flush()))
+
+
+class _RunningSum:
+    """Full convolution with ones(w), one block at a time, via a cumulative sum
+    restarted every block (no float drift however long the signal)."""
+
+    def __init__(self, w):
+        self.w = w
+        self._hist = None
+
+    SEGMENT = 1 << 16  # cumulative sums restart at least this often
+
+    def process(self, block):
+        if self._hist is None:
+            dt = np.result_type(block)
+            if dt.kind == "f":
+                dt = np.float64
+            elif dt.kind == "c":
+                dt = np.complex128
+            elif dt.kind in "biu":
+                dt = np.int64
+            self._hist = np.zeros(0, dtype=dt)
+        if block.size > self.SEGMENT:
+            return np.concatenate([
+                self._segment(block[a:a + self.SEGMENT]) for a in range(0, block.size, self.SEGMENT)
+            ])
+        return self._segment(block)
+
+    def _segment(self, block):
+        local = np.concatenate((self._hist, block))
+        c = np.zeros(local.size + 1, dtype=local.dtype)
+        np.cumsum(local, out=c[1:])
+        ends = np.arange(self._hist.size, local.size) + 1
+        sums = c[ends] - c[np.maximum(ends - self.w, 0)]
+        self._hist = local[max(0, local.size - (self.w - 1)):] if self.w > 1 else local[:0]
+        return sums
+
+    def flush(self):
+        if self._hist is None or self.w == 1:
+            return np.zeros(0)
+        return self.process(np.zeros(self.w - 1, dtype=self._hist.dtype))
+
+
+class RunningSumFilter:
+    """
+    O(N) boxcar family: `stages` cascaded moving sums of length w, normalized
+    by w**stages, keeping every R-th output. Equals
+    np.convolve(x, ones(w)/w (convolved `stages` times), mode)[::R] for any w:
+    stages=1, R=1 is the plain moving average; R=w, stages=K is a CIC decimator.
+    """
+
+    def __init__(self, w, n_in=0, mode="same", stages=1, R=1):
+        self.w = max(1, int(w))
+        self.stages = max(1, int(stages))
+        self.R = max(1, int(R))
+        if mode not in ("same", "full"):
+            raise ValueError("fir_type must be 'same' or 'full'.")
+
+        n_taps = self.stages * (self.w - 1) + 1
+        start, length = _fir_out_range(int(n_in), n_taps, 1, mode)
+        self.n_in = int(n_in)
+        self.n_out = -(-length // self.R) if length > 0 else 0
+        self._k_first = start
+        self._k = 0      # full-conv index of the next cascade output
+        self._next = 0   # next kept output index
+        self._scale = float(self.w) ** -self.stages
+        self._sums = [_RunningSum(self.w) for _ in range(self.stages)]
+
+    def _keep(self, full):
+        """Pick the kept outputs out of a run of full-conv outputs."""
+        k0, self._k = self._k, self._k + full.size
+        stop = min(self.n_out, max(0, -(-(self._k - self._k_first) // self.R)))
+        if stop <= self._next:
+            return np.zeros(0, dtype=np.result_type(full, np.float64))
+        pos = self._k_first + self.R * np.arange(self._next, stop) - k0
+        self._next = stop
+        return full[pos] * self._scale
+
+    def _cascade(self, block, first):
+        for st in self._sums[first:]:
+            block = st.process(block)
+        return block
+
+    def process(self, block):
+        block = np.asarray(block).reshape(-1)
+        if block.size == 0:
+            return np.zeros(0, dtype=np.result_type(block, np.float64))
+        return self._keep(self._cascade(block, 0))
+
+    def flush(self):
+        out = []
+        for i, st in enumerate(self._sums):
+            tail = st.flush()
+            if tail.size:
+                out.append(self._keep(self._cascade(tail, i + 1)))
+        out = [part for part in out if part.size]
+        return np.concatenate(out) if out else np.zeros(0)
+
+
+class ExpAverage:
+    """
+    Exponential moving average y[n] = a*x[n] + (1-a)*y[n-1], started at x[0]
+    (no start-up transient); filter state is carried between blocks.
+    """
+
+    def __init__(self, alpha, n_in=0):
+        self.alpha = float(alpha)
+        if not 0.0 < self.alpha <= 1.0:
+            raise ValueError("EMA alpha must be in (0, 1].")
+        self.n_in = int(n_in)
+        self.n_out = self.n_in
+        self._zi = None
+
+    def process(self, block):
+        block = np.asarray(block).reshape(-1)
+        if block.size == 0:
+            return np.zeros(0, dtype=np.result_type(block, np.float64))
+        from scipy.signal import lfilter
+
+        a = self.alpha
+        if self._zi is None:
+            self._zi = np.array([(1.0 - a) * block[0]], dtype=np.result_type(block, np.float64))
+        y, self._zi = lfilter([a], [1.0, -(1.0 - a)], block, zi=self._zi)
+        return y
+
+    def flush(self):
+        return np.zeros(0)
+
+
+@profiled("dsp.run_chain", items=lambda r, x, *a, **k: np.size(x))
+def run_chain(x, stages, block_size=CHAIN_BLOCK):
+    """
+    Run a compiled DSP chain. stages: [{"name", "kind", "func", "block", "stream"}]
+      kind "pointwise": block(x, start) works on any slice (start = index of x[0])
+      kind "stateful":  stream(n_in) -> object with process()/flush()/n_out
+      kind "global":    func(x) needs the whole signal (FFT, Normalize, ...)
+    Consecutive pointwise stages that provide "inplace"(x, out, start) are
+    fused into one pass (see fuse_pointwise). With block_size, runs of
+    pointwise/stateful stages are streamed in blocks so intermediates stay
+    block-sized; block_size=None runs whole arrays.
+    """
+    stages = fuse_pointwise(stages)
+    y = x if isinstance(x, LazyArray) else np.asarray(x)  # 1-D LazyArray: read block by block
+    streamable = block_size and y.ndim == 1 and y.size > 0
+    i = 0
+    while i < len(stages):
+        if not streamable or stages[i]["kind"] == "global":
+            st = stages[i]
+            try:
+                y = np.asarray(st["func"](np.asarray(y)))
+            except Exception as e:
+                raise ValueError(f"Failed at op '{st['name']}':\n{e}") from e
+            streamable = streamable and y.ndim == 1 and y.size > 0
+            i += 1
+            continue
+
+        j = i
+        while j < len(stages) and stages[j]["kind"] != "global":
+            j += 1
+        y = _stream_segment(y, stages[i:j], int(block_size))
+        i = j
+    return y
+
+
+def fuse_pointwise(stages):
+    """
+    Merge runs of consecutive pointwise stages that have an "inplace" form into
+    one stage. The fused pass writes every step into one buffer with out=
+    ufunc calls; a new buffer is taken only where a step changes the dtype
+    (e.g. real -> complex for NCO, complex -> real for Abs).
+    """
+    fused = []
+    group = []
+
+    def close():
+        if len(group) == 1:
+            fused.append(group[0])
+        elif group:
+            fused.append(_fused_stage(list(group)))
+        group.clear()
+
+    for st in stages:
+        if st["kind"] == "pointwise" and st.get("inplace") is not None:
+            group.append(st)
+        else:
+            close()
+            fused.append(st)
+    close()
+    return fused
+
+
+def _fused_stage(group):
+    dtype_plans = {}  # input dtype -> per-step output dtypes
+
+    def step_dtypes(dt):
+        if dt not in dtype_plans:
+            probe = np.zeros(1, dtype=dt)
+            plan = []
+            for st in group:
+                probe = np.asarray(st["block"](probe, 0))
+                plan.append(probe.dtype)
+            dtype_plans[dt] = plan
+        return dtype_plans[dt]
+
+    def run(b, start=0):
+        b = np.asarray(b)
+        cur = b
+        for st, dt in zip(group, step_dtypes(b.dtype)):
+            dst = cur if (cur is not b and cur.dtype == dt) else np.empty(b.shape, dtype=dt)
+            st["inplace"](cur, dst, start)
+            cur = dst
+        return cur
+
+    return {
+        "name": " + ".join(st["name"] for st in group),
+        "kind": "pointwise",
+        "func": run,
+        "block": run,
+    }
+
+
+def run_chain_batch(signals, stages, block_size=CHAIN_BLOCK, max_workers=None):
+    """
+    Run one compiled chain over many signals concurrently.
+    signals: {name: array}. Inputs are shared with the worker threads by
+    reference (NumPy releases the GIL in the heavy passes).
+    Returns {name: (output or None, seconds, error message or None)} in input order.
+    """
+    def _one(item):
+        name, x = item
+        t0 = time.perf_counter()
+        try:
+            y = run_chain(x, stages, block_size=block_size)
+            return name, (y, time.perf_counter() - t0, None)
+        except Exception as e:
+            return name, (None, time.perf_counter() - t0, str(e))
+
+    items = list(signals.items())
+    workers = max_workers or min(len(items), os.cpu_count() or 1) or 1
+
+    if workers <= 1:
+        results = list(map(_one, items))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_one, items))
+    return dict(results)
+
+
+def _stream_segment(x, stages, block_size):
+    """Push x through pointwise/stateful stages in blocks; returns the full output."""
+    n = x.size
+    streams = []
+    starts = [0] * len(stages)
+    for st in stages:
+        if st["kind"] == "stateful":
+            try:
+                obj = st["stream"](n)
+            except Exception as e:
+                raise ValueError(f"Failed at op '{st['name']}':\n{e}") from e
+            n = obj.n_out
+            streams.append(obj)
+        else:
+            streams.append(None)
+
+    out = None
+    pos = 0
+
+    def feed(b, first):
+        nonlocal out, pos
+        for s in range(first, len(stages)):
+            if b.size == 0:
+                return
+            st = stages[s]
+            try:
+                if streams[s] is not None:
+                    b = np.asarray(streams[s].process(b))
+                else:
+                    b = np.asarray(st["block"](b, starts[s]))
+                    starts[s] += b.size
+            except Exception as e:
+                raise ValueError(f"Failed at op '{st['name']}':\n{e}") from e
+        if b.size == 0:
+            return
+        if out is None:
+            out = np.empty(n, dtype=b.dtype)
+        out[pos:pos + b.size] = b
+        pos += b.size
+
+    for a in range(0, x.size, block_size):
+        feed(x[a:a + block_size], 0)
+    for s, obj in enumerate(streams):
+        if obj is not None:
+            feed(np.asarray(obj.flush()), s + 1)
+
+    if out is None:
+        return np.zeros(0, dtype=x.dtype)
+    return out[:pos]
 # ---------- ILA Helpers ---------- #
 
+def compile_name_filter(pattern: str, mode: str = "substring"):
+    """
+    Build a case-insensitive predicate name -> bool for signal name filtering.
+    mode: 'substring', 'glob' (fnmatch style, whole name) or 'regex' (search).
+    Raises re.error for an invalid regex.
+    """
+    if mode == "glob":
+        rx = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+        return lambda name: rx.match(name) is not None
+
+    if mode == "regex":
+        rx = re.compile(pattern, re.IGNORECASE)
+        return lambda name: rx.search(name) is not None
+
+    pat = pattern.lower()
+    return lambda name: pat in name.lower()
+
+
 def detect_csv_kind(csv_path: Path) -> str:
 
     """Return 'quartus_stp', 'vivado_ila', or 'unknown'."""
@@ -190,6 +1162,7 @@ def convert_to_fixed(samples, sign_bit, int_bits, frac_bits):
 def fixed_to_dec(samples, data_prec, data_complex, data_par, data_par_mode):
     """
     Convert samples encoded as fixed-point (optionally complex, concatenated).
+    Scalar reference implementation; convert_db() uses fixed_to_dec_wide().
     samples: list of hex strings or ints
     data_prec: [sign_bits, int_bits, frac_bits]
     data_complex: "y" for complex, anything else for real
@@ -236,6 +1209,7 @@ def float_to_dec(samples, data_prec, data_complex, data_par, data_par_mode):
     """
     Convert samples encoded as custom float:
     [exp_bits][mantissa_I_bits][mantissa_Q_bits]
+    Scalar reference implementation; convert_db() uses float_to_dec_wide().
     samples: list of hex strings or ints
     data_prec: [exp_bits, man_bits]  (man_bits for I and Q each)
     data_complex is currently ignored (assumed complex)
@@ -279,12 +1253,305 @@ def float_to_dec(samples, data_prec, data_complex, data_par, data_par_mode):
     return out
 
 
+# ---------- Wide-word (vectorized) decoding ---------- #
+
+# ASCII -> nibble value, 255 marks a non-hex character
+_HEX_LUT = np.full(256, 255, dtype=np.uint8)
+for _i, _c in enumerate(b"0123456789abcdef"):
+    _HEX_LUT[_c] = _i
+for _i, _c in enumerate(b"ABCDEF"):
+    _HEX_LUT[_c] = 10 + _i
+
+
+def hex_to_limbs(samples):
+    """
+    Parse hex words (strings, optionally '0x'-prefixed, or ints) into a
+    (N, n_limbs) uint64 array. Limb 0 holds bits [0, 64), limb 1 bits [64, 128), ...
+    Cost is linear in N * word width; no Python big-int is built per sample.
+    """
+    if isinstance(samples, np.ndarray):
+        samples = samples.tolist()
+    strs = [
+        s if isinstance(s, str) else s.decode("ascii", "replace") if isinstance(s, bytes) else format(int(s), "x")
+        for s in samples
+    ]
+    if not strs:
+        return np.zeros((0, 1), dtype=np.uint64)
+
+    # Same spellings int(s, 16) accepts: surrounding blanks, 0x prefix, '_'
+    clean = []
+    for s in strs:
+        s = s.strip().replace("_", "")
+        if s[:2] in ("0x", "0X"):
+            s = s[2:]
+        clean.append(s)
+
+    try:
+        arr = np.array(clean, dtype=np.bytes_)
+    except UnicodeEncodeError:
+        raise ValueError("Hex samples must be ASCII text.")
+
+    lengths = np.char.str_len(arr)
+    if (lengths == 0).any():
+        bad = int(np.argmax(lengths == 0))
+        raise ValueError(f"invalid hex sample {strs[bad]!r} at index {bad}")
+
+    n_limbs = max(1, -(-int(lengths.max()) // 16))
+    width = 16 * n_limbs
+    arr = np.char.rjust(arr, width, b"0").astype(f"S{width}")
+
+    nib = _HEX_LUT[np.frombuffer(arr.tobytes(), dtype=np.uint8)].reshape(len(strs), n_limbs, 16)
+    if (nib == 255).any():
+        bad = int(np.argmax((nib == 255).any(axis=(1, 2))))
+        raise ValueError(f"invalid hex sample {strs[bad]!r} at index {bad}")
+
+    # Text is MSB first: fold 16 nibbles per limb, then flip limb order
+    acc = np.zeros((len(strs), n_limbs), dtype=np.uint64)
+    four = np.uint64(4)
+    for d in range(16):
+        acc <<= four
+        acc |= nib[:, :, d]
+
+    return np.ascontiguousarray(acc[:, ::-1])
+
+
+def extract_bits(limbs, offset, width):
+    """
+    Extract the bit field [offset, offset + width) from every row of a
+    (N, n_limbs) uint64 array, including fields that cross a limb boundary.
+    width <= 64. Returns a uint64 array of length N.
+    """
+    if width > 64:
+        raise ValueError("extract_bits supports fields up to 64 bits.")
+
+    n, n_limbs = limbs.shape
+    li, sh = divmod(int(offset), 64)
+    if li >= n_limbs:
+        return np.zeros(n, dtype=np.uint64)
+
+    out = limbs[:, li] >> np.uint64(sh)
+    if sh and sh + width > 64 and li + 1 < n_limbs:
+        out |= limbs[:, li + 1] << np.uint64(64 - sh)
+    if width < 64:
+        out &= np.uint64((1 << width) - 1)
+    return out
+
+
+def to_signed_dec_array(raw, data_prec):
+    """
+    Vectorized to_signed_dec(): uint64 raw fields in s.int.frac format -> float64.
+    """
+    sign_bits, int_bits, frac_bits = data_prec
+    total_bits = sign_bits + int_bits + frac_bits
+
+    if sign_bits == 1:
+        # Sign-extend: move the field's sign bit to bit 63, shift back arithmetically
+        shift = np.int64(64 - total_bits)
+        vals = (raw << shift.astype(np.uint64)).view(np.int64) >> shift
+    else:
+        vals = raw
+
+    return vals / float(2 ** frac_bits)
+
+
+def _lanes_to_output(lanes, data_par_mode):
+    """Serial: lane samples of one word are consecutive. Parallel: list of lanes."""
+    if data_par_mode == "parallel":
+        return lanes
+    if len(lanes) == 1:
+        return lanes[0]
+    out = np.empty((lanes[0].size, len(lanes)), dtype=np.result_type(*lanes))
+    for k, lane in enumerate(lanes):
+        out[:, k] = lane
+    return out.reshape(-1)
+
+
+@profiled("decode.fixed_wide", items=lambda r, samples, *a, **k: len(samples))
+def fixed_to_dec_wide(samples, data_prec, data_complex, data_par, data_par_mode):
+    """
+    Vectorized fixed_to_dec() for arbitrary bus widths.
+    Same arguments, lane layout and values; returns NumPy arrays
+    (float64 / complex128) instead of Python lists.
+    Falls back to fixed_to_dec() for fields wider than 64 bits.
+    """
+    sign_bits, int_bits, frac_bits = data_prec
+    total_bits = sign_bits + int_bits + frac_bits
+    if total_bits <= 0 or total_bits > 64:
+        return fixed_to_dec(samples, data_prec, data_complex, data_par, data_par_mode)
+
+    limbs = hex_to_limbs(samples)
+    is_complex = data_complex == "y"
+    sample_size_in_bits = total_bits * (2 if is_complex else 1)
+
+    lanes = []
+    for i in range(data_par):
+        offset = i * sample_size_in_bits
+        val_i = to_signed_dec_array(extract_bits(limbs, offset, total_bits), data_prec)
+        if is_complex:
+            val_q = to_signed_dec_array(extract_bits(limbs, offset + total_bits, total_bits), data_prec)
+            lane = np.empty(val_i.size, dtype=np.complex128)
+            lane.real = val_i
+            lane.imag = val_q
+        else:
+            lane = val_i
+        lanes.append(lane)
+
+    return _lanes_to_output(lanes, data_par_mode)
+
+
+@profiled("decode.float_wide", items=lambda r, samples, *a, **k: len(samples))
+def float_to_dec_wide(samples, data_prec, data_complex, data_par, data_par_mode):
+    """
+    Vectorized float_to_dec() for arbitrary bus widths.
+    Same arguments, lane layout and values; returns complex128 NumPy arrays.
+    Falls back to float_to_dec() for mantissas wider than 64 bits.
+    """
+    exp_bits, man_bits = data_prec
+    if man_bits <= 0 or man_bits > 64:
+        return float_to_dec(samples, data_prec, data_complex, data_par, data_par_mode)
+
+    limbs = hex_to_limbs(samples)
+    total_bits = exp_bits + 2 * man_bits
+    man_prec = [1, 0, man_bits - 1]
+
+    lanes = []
+    for i in range(data_par):
+        offset = i * total_bits
+        lane = np.empty(limbs.shape[0], dtype=np.complex128)
+        lane.real = to_signed_dec_array(extract_bits(limbs, offset, man_bits), man_prec)
+        lane.imag = to_signed_dec_array(extract_bits(limbs, offset + man_bits, man_bits), man_prec)
+        lanes.append(lane)
+
+    return _lanes_to_output(lanes, data_par_mode)
+
+
+# ---------- Bit-field layouts ---------- #
+
+def compile_bit_layout(layout):
+    """
+    Validate a bit-field layout and compile it into an extraction plan.
+
+    layout (JSON-compatible dict):
+        {
+          "name": "adc_pack",
+          "repeat": 1,          # optional: packed copies per word (like data_par)
+          "stride": 32,         # optional: bits between copies (default: end of last field)
+          "fields": [
+            {"name": "flags", "offset": 0,  "width": 2},
+            {"name": "I",     "offset": 2,  "width": 12, "signed": true, "frac_bits": 11},
+            {"name": "Q",     "offset": 14, "width": 12, "signed": true, "frac_bits": 11},
+            {"name": "exp",   "offset": 26, "width": 6,  "scale": 1.0}
+          ],
+          "complex": [{"name": "IQ", "re": "I", "im": "Q"}]   # optional
+        }
+    value = (signed/unsigned raw) / 2**frac_bits * scale
+    With repeat > 1 each field is unpacked serially (copy 0 first), as in
+    'serial' concatenation mode.
+    """
+    if not isinstance(layout, dict):
+        raise ValueError("Bit layout must be a JSON object.")
+
+    fields = layout.get("fields") or []
+    if not fields:
+        raise ValueError("Bit layout has no fields.")
+
+    plan_fields = []
+    names = set()
+    end_bit = 0
+    for fd in fields:
+        name = str(fd.get("name", "")).strip()
+        if not name or name in names:
+            raise ValueError(f"Bit layout field name missing or duplicated: '{name}'.")
+        try:
+            offset = int(fd["offset"])
+            width = int(fd["width"])
+            frac_bits = int(fd.get("frac_bits", 0))
+            scale = float(fd.get("scale", 1.0))
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"Bit layout field '{name}' needs integer offset/width.")
+        if offset < 0 or not 1 <= width <= 64:
+            raise ValueError(f"Bit layout field '{name}': offset >= 0 and 1 <= width <= 64 required.")
+
+        signed = bool(fd.get("signed", False))
+        names.add(name)
+        end_bit = max(end_bit, offset + width)
+        plan_fields.append({
+            "name": name,
+            "offset": offset,
+            "width": width,
+            # to_signed_dec_array() only needs the sign flag, total and frac bits
+            "prec": [1 if signed else 0, width - (1 if signed else 0) - frac_bits, frac_bits],
+            "scale": scale,
+        })
+
+    repeat = int(layout.get("repeat", 1))
+    stride = int(layout.get("stride", end_bit))
+    if repeat < 1 or (repeat > 1 and stride < end_bit):
+        raise ValueError("Bit layout repeat must be >= 1 and stride must cover all fields.")
+
+    pairs = []
+    for cp in layout.get("complex", []) or []:
+        re_name, im_name = cp.get("re"), cp.get("im")
+        if re_name not in names or im_name not in names:
+            raise ValueError(f"Bit layout complex pair refers to unknown fields: {re_name}, {im_name}.")
+        pairs.append((str(cp.get("name") or f"{re_name}{im_name}"), re_name, im_name))
+
+    return {
+        "name": str(layout.get("name", "layout")),
+        "fields": plan_fields,
+        "repeat": repeat,
+        "stride": stride,
+        "complex": pairs,
+        "layout": layout,
+    }
+
+
+def load_bit_layout(path):
+    """Read a bit-field layout JSON file and return its compiled plan."""
+    with open(path, "r", encoding="utf-8") as f:
+        return compile_bit_layout(json.load(f))
+
+
+@profiled("decode.bit_layout", items=lambda r, plan, samples, *a, **k: len(samples))
+def apply_bit_layout(plan, samples):
+    """
+    Decode one raw probe column with a compiled layout plan.
+    The hex text is parsed once; every field is a vectorized extraction.
+    Returns {field_name: np.ndarray, complex_pair_name: np.ndarray, ...}.
+    """
+    limbs = hex_to_limbs(samples)
+    repeat, stride = plan["repeat"], plan["stride"]
+
+    out = {}
+    for fd in plan["fields"]:
+        copies = []
+        for r in range(repeat):
+            raw = extract_bits(limbs, r * stride + fd["offset"], fd["width"])
+            val = to_signed_dec_array(raw, fd["prec"])
+            if fd["scale"] != 1.0:
+                val *= fd["scale"]
+            copies.append(val)
+        out[fd["name"]] = _lanes_to_output(copies, "serial")
+
+    for name, re_name, im_name in plan["complex"]:
+        val = np.empty(out[re_name].size, dtype=np.complex128)
+        val.real = out[re_name]
+        val.imag = out[im_name]
+        out[name] = val
+
+    return out
+
+
 def sample_is_valid(val) -> bool:
     """Return True if 'val' represents a logical 1."""
-    # Handle ints directly
-    if isinstance(val, int):
+    # Handle ints directly (NumPy scalars too, as valid_mask() does for int/bool arrays)
+    if isinstance(val, (int, np.integer, np.bool_)):
         return val == 1
 
+    # Compact stores keep ASCII text as bytes
+    if isinstance(val, bytes):
+        val = val.decode("ascii", "ignore")
+
     if not isinstance(val, str):
         return False
 
@@ -303,32 +1570,665 @@ def sample_is_valid(val) -> bool:
         return False
 
 
-def convert_db(db_in, data_type, data_prec, data_complex, data_par, data_par_mode):
+@profiled("filter.valid_mask", items=lambda r, *a, **k: len(r))
+def valid_mask(samples):
+    """
+    Vectorized sample_is_valid() over a whole column -> bool array.
+    Each distinct value is classified once (ILA flag columns have very few).
+    """
+    n = len(samples)
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+
+    arr = samples if isinstance(samples, np.ndarray) else None
+    if arr is None:
+        try:
+            arr = np.array(samples)
+        except Exception:
+            arr = None
+    if arr is None or arr.dtype.kind not in "SUib" or arr.ndim != 1:
+        return np.fromiter((sample_is_valid(v) for v in samples), dtype=bool, count=n)
+
+    if arr.dtype.kind in "ib":
+        return arr == 1
+
+    uniq, inv = np.unique(arr, return_inverse=True)
+    lut = np.array([sample_is_valid(u) for u in uniq.tolist()], dtype=bool)
+    return lut[inv.reshape(-1)]
+
+
+@profiled("convert_db", items=lambda r, db_in, *a, **k: db_sample_count(db_in))
+def convert_db(db_in, data_type, data_prec, data_complex, data_par, data_par_mode, cache=None):
     """
     Convert the samples in db according to user settings.
     db_in: {sig_name: {"idx": int, "samples": [raw_strings]}}
-    returns new dict: {sig_name: {"samples": [converted_values]}}
+    returns new dict: {sig_name: {"samples": converted_values}}
+    Fixed/Float samples come back as NumPy arrays (vectorized wide-word decode).
+    data_type "4" decodes a bit-field layout (data_prec = compiled plan) into
+    one output per field: {"sig.field": {...}, ...}.
+    cache: optional ConversionCache; entries carrying a "cache_key" (source
+    signal + filter selection) reuse earlier results for the same parameters.
     """
     db_out = {}
     for sig, info in db_in.items():
+        key = None
+        if cache is not None and info.get("cache_key") is not None:
+            key = conversion_key(info["cache_key"], data_type, data_prec, data_complex, data_par, data_par_mode)
+            hit = cache.get(key)
+            if hit is not None:
+                db_out.update(hit)
+                continue
+
+        outputs = {}
         samples = info["samples"]
-        if data_type == "1":      # Fixed
-            converted = fixed_to_dec(samples, data_prec, data_complex, data_par, data_par_mode)
-        elif data_type == "2":    # Float
-            converted = float_to_dec(samples, data_prec, data_complex, data_par, data_par_mode)
-        else:                     # As-is
-            converted = samples[:]
-
-        if data_par_mode == "serial": # Serial
-            db_out[sig] = {"samples": converted}
-        else: # Parallel
-            for idx,arr in enumerate(converted):
-                sig_indexed = sig + "_" + str(idx)
-                db_out[sig_indexed] = {"samples": arr}
+        if data_type == "4":      # Bit layout (data_prec is the compiled plan)
+            for field, arr in apply_bit_layout(data_prec, samples).items():
+                outputs[f"{sig}.{field}"] = {"samples": arr}
+        else:
+            if data_type == "1":      # Fixed
+                converted = fixed_to_dec_wide(samples, data_prec, data_complex, data_par, data_par_mode)
+            elif data_type == "2":    # Float
+                converted = float_to_dec_wide(samples, data_prec, data_complex, data_par, data_par_mode)
+            else:                     # As-is
+                converted = samples[:]
+
+            if data_par_mode == "serial":
+                converted = compact_samples(converted)
+            else:
+                converted = [compact_samples(arr) for arr in converted]
+            if data_par_mode == "serial": # Serial
+                outputs[sig] = {"samples": converted}
+            else: # Parallel
+                for idx,arr in enumerate(converted):
+                    sig_indexed = sig + "_" + str(idx)
+                    outputs[sig_indexed] = {"samples": arr}
+
+        if key is not None:
+            for name, out in outputs.items():
+                out["conv_key"] = (key, name)  # identifies this output across cache hits
+            cache.put(key, outputs)
+        db_out.update(outputs)
 
     return db_out
 
 
+# ---------- Conversion cache ---------- #
+
+def samples_nbytes(samples):
+    """Approximate memory held by a samples container (array or list)."""
+    if isinstance(samples, np.ndarray):
+        return samples.nbytes
+    if isinstance(samples, LazyArray):
+        return 0  # still in its file
+    n = len(samples)
+    if n == 0:
+        return sys.getsizeof(samples)
+    return sys.getsizeof(samples) + n * sys.getsizeof(samples[0])
+
+
+def conversion_key(source_key, data_type, data_prec, data_complex, data_par, data_par_mode):
+    """Hashable key for one signal converted with one set of parameters."""
+    if isinstance(data_prec, dict):   # compiled bit layout
+        prec_key = json.dumps(data_prec["layout"], sort_keys=True)
+    else:
+        prec_key = tuple(data_prec)
+    return (source_key, data_type, prec_key, data_complex, int(data_par), data_par_mode)
+
+
+class ConversionCache:
+    """
+    LRU memo of per-signal convert_db() outputs, bounded by max_bytes.
+    Evicting an entry only drops the cache reference; arrays still listed
+    as converted signals stay alive. refresh_record() keeps an entry pointing
+    at its stored record's current samples (spilled memmap / faulted-in
+    array), so the cache never pins a second in-RAM copy.
+    """
+
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (outputs, nbytes)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    @staticmethod
+    def _size(outputs):
+        # Memory-mapped (spilled) samples are not resident
+        return sum(
+            0 if isinstance(info["samples"], np.memmap) else samples_nbytes(info["samples"])
+            for info in outputs.values()
+        )
+
+    def put(self, key, outputs):
+        size = self._size(outputs)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (outputs, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes and self._entries:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self.nbytes -= dropped
+
+    def refresh_record(self, record):
+        """MemoryBudget listener: point the entry for record.conv_key at record.samples."""
+        conv_key = getattr(record, "conv_key", None)
+        if conv_key is None:
+            return
+        key, name = conv_key
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or name not in entry[0]:
+                return
+            outputs = dict(entry[0])
+            outputs[name] = dict(outputs[name], samples=record.samples)
+            size = self._size(outputs)
+            self._entries[key] = (outputs, size)
+            self.nbytes += size - entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+# ---------- Signal store ---------- #
+
+_INT_DTYPES = (np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32, np.int64, np.uint64)
+
+
+def compact_samples(samples):
+    """
+    Smallest exact typed array for a samples container.
+    Text -> fixed-width bytes ('S', ASCII) or 'U'; ints -> narrowest dtype
+    that holds the range. Floats/complex keep their width so decoded signals
+    stay double precision through DSP ops and exports.
+    Mixed/object data is returned unchanged, as is an already-compact array.
+    """
+    if isinstance(samples, np.ndarray):
+        arr = samples
+    else:
+        if len(samples) == 0:
+            return np.zeros(0, dtype=np.float64)
+        first = samples[0]
+        if isinstance(first, (str, bytes)):
+            if not all(type(v) is type(first) for v in samples):
+                return samples
+            try:
+                return np.array(samples, dtype=np.bytes_) if isinstance(first, bytes) or \
+                    all(v.isascii() for v in samples) else np.array(samples, dtype=np.str_)
+            except (UnicodeEncodeError, ValueError):
+                return samples
+        try:
+            arr = np.asarray(samples)
+        except ValueError:
+            return samples
+        if arr.dtype == object or arr.ndim != 1:
+            return samples
+
+    kind = arr.dtype.kind
+    if kind == "U":
+        try:
+            return arr.astype(np.bytes_)
+        except UnicodeEncodeError:
+            return arr
+    if arr.size == 0:
+        return arr
+    if kind in "iu":
+        lo, hi = int(arr.min()), int(arr.max())
+        for dt in _INT_DTYPES:
+            info = np.iinfo(dt)
+            if info.min <= lo and hi <= info.max:
+                return arr if np.dtype(dt).itemsize >= arr.dtype.itemsize else arr.astype(dt)
+    return arr
+
+
+class SignalMeta:
+    """Shape / dtype / size of a signal plus min / max / RMS (of |x| for complex)."""
+
+    __slots__ = ("shape", "dtype", "size", "nbytes", "min", "max", "rms")
+
+    def __init__(self, shape, dtype, size, nbytes, vmin=None, vmax=None, rms=None):
+        self.shape = shape
+        self.dtype = dtype
+        self.size = size
+        self.nbytes = nbytes
+        self.min = vmin
+        self.max = vmax
+        self.rms = rms
+
+    def has_stats(self):
+        return self.rms is not None
+
+
+def signal_meta(samples):
+    """
+    Build a SignalMeta for an array / LazyArray / list. Stats are computed for
+    non-empty numeric arrays only; a LazyArray is described without reading it.
+    """
+    if not isinstance(samples, (np.ndarray, LazyArray)):
+        samples = np.asarray(samples)
+    meta = SignalMeta(samples.shape, samples.dtype, samples.size, samples.nbytes)
+    if isinstance(samples, LazyArray) or samples.size == 0 or samples.dtype.kind not in "biufc":
+        return meta
+
+    mag = np.abs(samples) if samples.dtype.kind == "c" else samples
+    meta.min = mag.min().item()
+    meta.max = mag.max().item()
+    if mag.dtype.kind == "f":
+        flat = mag.reshape(-1)
+        meta.rms = float(np.sqrt(np.vdot(flat, flat).real / flat.size))
+    else:
+        meta.rms = float(np.sqrt(np.mean(np.square(mag, dtype=np.float64))))
+    return meta
+
+
+class SignalRecord:
+    """One stored signal: typed samples plus its header metadata."""
+
+    __slots__ = ("samples", "idx", "short_name", "source", "spill_path", "meta", "conv_key")
+    _FIELDS = ("samples", "idx", "short_name", "source")
+
+    def __init__(self, samples, idx=None, short_name=None, source=None, conv_key=None):
+        self.samples = samples
+        self.idx = idx
+        self.short_name = short_name
+        self.source = source
+        self.spill_path = None  # set while samples are a memory-mapped spill file
+        self.meta = None        # cached SignalMeta, see SignalStore.meta()
+        self.conv_key = conv_key  # (conversion_key, output name) for convert_db outputs
+
+    # Dict-style access so existing info["samples"] / info.get(...) code keeps working
+    def keys(self):
+        return [f for f in self._FIELDS if getattr(self, f) is not None]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __contains__(self, key):
+        return key in self._FIELDS and getattr(self, key) is not None
+
+    def __getitem__(self, key):
+        if key not in self._FIELDS or getattr(self, key) is None:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+        if key == "samples":
+            self.meta = None
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in self._FIELDS else None
+        return default if value is None else value
+
+
+SIGNAL_BUDGET_MB = 2048  # default; the SIGNAL_BUDGET_MB environment variable overrides it
+
+
+def signal_budget_mb():
+    """Shared budget size in MB: $SIGNAL_BUDGET_MB when set, else SIGNAL_BUDGET_MB."""
+    raw = os.environ.get("SIGNAL_BUDGET_MB", "").strip()
+    if not raw:
+        return SIGNAL_BUDGET_MB
+    try:
+        mb = float(raw)
+    except ValueError:
+        mb = 0
+    if mb <= 0:
+        raise ValueError(f"SIGNAL_BUDGET_MB must be a positive number of MB, got '{raw}'.")
+    return mb
+
+
+class MemoryBudget:
+    """
+    Byte budget shared by SignalStores. When resident samples exceed
+    max_bytes, least-recently-used arrays are written to .npy temp files and
+    re-opened memory-mapped; the next store access loads them back into RAM.
+    Lists / object arrays count towards the budget but are never spilled.
+    """
+
+    def __init__(self, max_bytes, spill_dir=None):
+        self.max_bytes = int(max_bytes)
+        self.resident_bytes = 0
+        self.spilled_bytes = 0
+        self.spills = 0
+        self.faults = 0
+        self._spill_dir = spill_dir
+        self._counter = 0
+        self._lru = OrderedDict()  # id(record) -> (record, nbytes), resident only
+        self._refs = {}            # id(record) -> number of stores holding it
+        self._listeners = []       # callback(record) after its samples were swapped
+        self._lock = threading.RLock()
+
+    def add_listener(self, callback):
+        """callback(record) runs after a spill or fault-in replaced record.samples."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def _swapped(self, record):
+        for callback in self._listeners:
+            callback(record)
+
+    @staticmethod
+    def _spillable(samples):
+        return isinstance(samples, np.ndarray) and samples.dtype.kind in "biufcSU" and samples.size > 0
+
+    def track(self, record):
+        """Account for a newly stored record (may spill older ones)."""
+        with self._lock:
+            refs = self._refs.get(id(record), 0)
+            self._refs[id(record)] = refs + 1
+            if refs:
+                return  # same record published in another store
+            if record.spill_path is not None:
+                self.spilled_bytes += record.samples.nbytes
+                return
+            if id(record) in self._lru:
+                return
+            size = samples_nbytes(record.samples)
+            self._lru[id(record)] = (record, size)
+            self.resident_bytes += size
+            self._enforce(keep=record)
+
+    def forget(self, record):
+        """Stop accounting for a record removed from its store."""
+        with self._lock:
+            refs = self._refs.pop(id(record), 0) - 1
+            if refs > 0:
+                self._refs[id(record)] = refs
+                return
+            entry = self._lru.pop(id(record), None)
+            if entry is not None:
+                self.resident_bytes -= entry[1]
+            if record.spill_path is not None:
+                self.spilled_bytes -= record.samples.nbytes
+                path, record.spill_path = record.spill_path, None
+                self._remove(path)
+
+    def touch(self, record):
+        """Mark a record as used, faulting its samples back into RAM if spilled."""
+        with self._lock:
+            if record.spill_path is not None:
+                self._fault_in(record)
+                self._enforce(keep=record)
+            elif id(record) in self._lru:
+                self._lru.move_to_end(id(record))
+
+    def resize(self, record):
+        """Re-measure a resident record whose samples were replaced (e.g. a LazyArray loaded)."""
+        with self._lock:
+            entry = self._lru.get(id(record))
+            if entry is None:
+                return
+            size = samples_nbytes(record.samples)
+            self.resident_bytes += size - entry[1]
+            self._lru[id(record)] = (record, size)
+            self._lru.move_to_end(id(record))
+            self._enforce(keep=record)
+
+    def _enforce(self, keep=None):
+        if self.resident_bytes <= self.max_bytes:
+            return
+        for key in list(self._lru):
+            if self.resident_bytes <= self.max_bytes:
+                break
+            record, size = self._lru[key]
+            if record is keep or not self._spillable(record.samples):
+                continue
+            self._spill(record)
+            del self._lru[key]
+            self.resident_bytes -= size
+
+    def _spill(self, record):
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="ila_parser_spill_")
+            atexit.register(shutil.rmtree, self._spill_dir, True)
+        self._counter += 1
+        path = os.path.join(self._spill_dir, f"sig_{self._counter}.npy")
+        np.save(path, record.samples)
+        record.samples = np.load(path, mmap_mode="r")
+        record.spill_path = path
+        self.spilled_bytes += record.samples.nbytes
+        self.spills += 1
+        self._swapped(record)
+
+    def _fault_in(self, record):
+        mapped = record.samples
+        record.samples = np.array(mapped)
+        path, record.spill_path = record.spill_path, None
+        self.spilled_bytes -= mapped.nbytes
+        self._swapped(record)  # listeners drop their reference to the mapping first
+        del mapped
+        self._remove(path)
+
+        size = record.samples.nbytes
+        self._lru[id(record)] = (record, size)
+        self.resident_bytes += size
+        self.faults += 1
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # still mapped elsewhere (e.g. an open plot); removed at exit
+
+
+_shared_budget = None
+
+
+def shared_memory_budget():
+    """Process-wide MemoryBudget (signal_budget_mb()) shared by all tabs."""
+    global _shared_budget
+    if _shared_budget is None:
+        _shared_budget = MemoryBudget(signal_budget_mb() * 1024 * 1024)
+    return _shared_budget
+
+
+# Version stamps are unique across stores, so (name, version) still identifies
+# one signal after a store is replaced (e.g. by a new Search)
+_version_stamps = itertools.count(1)
+
+
+class SignalStore(MutableMapping):
+    """
+    Name -> SignalRecord mapping that keeps samples as compact typed arrays.
+    Assigning a plain {"samples": [...], "idx": ...} dict packs it; unknown
+    keys are dropped. Reads behave like the old dict-of-dicts databases.
+    With a MemoryBudget, reads fault spilled samples back in; use peek() /
+    records() to inspect without touching the LRU order.
+    """
+
+    def __init__(self, data=None, budget=None):
+        self._records = {}
+        self._versions = {}
+        self.budget = budget
+        if data:
+            self.update(data)
+
+    def _make_record(self, info):
+        if isinstance(info, SignalRecord):
+            return info
+        return SignalRecord(
+            compact_samples(info["samples"]),
+            idx=info.get("idx"),
+            short_name=info.get("short_name"),
+            source=info.get("source"),
+            conv_key=info.get("conv_key"),
+        )
+
+    def __getitem__(self, name):
+        record = self._records[name]
+        if self.budget is not None:
+            self.budget.touch(record)
+        if isinstance(record.samples, LazyArray):
+            record.samples = record.samples.load()
+            record.meta = None  # now with stats
+            if self.budget is not None:
+                self.budget.resize(record)
+        return record
+
+    def __setitem__(self, name, info):
+        record = self._make_record(info)
+        old = self._records.get(name)
+        self._records[name] = record
+        self._versions[name] = next(_version_stamps)
+        if self.budget is not None:
+            if old is not None and old is not record:
+                self.budget.forget(old)
+            self.budget.track(record)
+
+    def __delitem__(self, name):
+        record = self._records.pop(name)
+        self._versions.pop(name, None)
+        if self.budget is not None:
+            self.budget.forget(record)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, name):
+        # Membership must not go through __getitem__ (LRU touch / fault-in / lazy load)
+        return name in self._records
+
+    def get(self, name, default=None):
+        """peek() with a default: no LRU touch, no fault-in of spilled samples."""
+        if name not in self._records:
+            return default
+        return self.peek(name)
+
+    def clear(self):
+        for name in list(self._records):
+            del self[name]
+
+    def peek(self, name):
+        return self._records[name]
+
+    def version(self, name):
+        """Changes whenever the signal stored under name is replaced (unique across stores)."""
+        return self._versions.get(name)
+
+    def meta(self, name):
+        """
+        SignalMeta for name, computed on first request and kept on the record
+        (a replaced signal gets a new record, so the cache follows updates).
+        Does not touch the LRU order or load a LazyArray.
+        """
+        record = self._records[name]
+        if record.meta is None:
+            record.meta = signal_meta(record.samples)
+        return record.meta
+
+    def records(self):
+        return list(self._records.values())
+
+    def nbytes(self):
+        return sum(samples_nbytes(rec.samples) for rec in self._records.values())
+
+
+class ArrayStore(SignalStore):
+    """SignalStore whose values are the sample arrays themselves (DSP tab: name -> np.ndarray)."""
+
+    def _make_record(self, info):
+        if isinstance(info, SignalRecord):
+            return info
+        return SignalRecord(info if isinstance(info, (np.ndarray, LazyArray)) else np.asarray(info))
+
+    def __getitem__(self, name):
+        return super().__getitem__(name).samples
+
+    def peek(self, name):
+        return self._records[name].samples
+
+
+class SignalRegistry(ArrayStore):
+    """
+    Signal list shared between tabs. publish() stores records/arrays by
+    reference (no copy; a record shared with another store is counted once
+    in the memory budget) and tells every subscriber which names changed.
+    """
+
+    def __init__(self, data=None, budget=None):
+        self._subscribers = []
+        super().__init__(data, budget=budget)
+
+    def subscribe(self, callback):
+        """callback(names, origin) runs after every publish()/notify()."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def notify(self, names, origin=None):
+        for callback in list(self._subscribers):
+            callback(names, origin)
+
+    def publish(self, signals, origin=None, suffix="pub"):
+        """
+        signals: {name: SignalRecord | array}. Name clashes with a different
+        signal get '{name}_{suffix}{k}'; re-publishing the same record is a no-op.
+        Returns {requested_name: stored_name}.
+        """
+        stored = {id(rec): name for name, rec in self._records.items()}
+        names = {}
+        changed = []
+        for name, sig in signals.items():
+            record = self._make_record(sig)
+            if id(record) in stored:
+                names[name] = stored[id(record)]
+                continue
+            changed.append(name)
+            new_name = name
+            k = 1
+            while new_name in self._records:
+                new_name = f"{name}_{suffix}{k}"
+                k += 1
+            self[new_name] = record
+            stored[id(record)] = new_name
+            names[name] = new_name
+
+        if changed:
+            self.notify([names[name] for name in changed], origin)
+        return names
+
+
+_shared_registry = None
+
+
+def shared_signal_registry():
+    """Process-wide SignalRegistry (under the shared memory budget)."""
+    global _shared_registry
+    if _shared_registry is None:
+        _shared_registry = SignalRegistry(budget=shared_memory_budget())
+    return _shared_registry
+
+
+@profiled("csv.load_ila", items=lambda r, *a, **k: db_sample_count(r))
 def load_signals_from_csv(csv_path: Path, name_filter: str):
     """
     Parse the CSV file, find all columns whose *short* name contains 'name_filter',
@@ -390,10 +2290,129 @@ def load_signals_from_csv(csv_path: Path, name_filter: str):
     return db
 
 
+@profiled("csv.load_stp", items=lambda r, *a, **k: db_sample_count(r))
+def load_signals_from_stp_csv(csv_path: Path, name_filter: str = "") -> dict:
+    """
+    Parse a Quartus SignalTap (STP) CSV: the signal columns after 'Data:',
+    limited to those listed under 'Groups:' when that section exists.
+    Samples are split on 'X' gaps; each gap-free run becomes
+    '{name}__seg{k}' when there is more than one.
+
+    Returns {signal_name: {"idx": signal_index, "samples": [raw_strings]}, ...}
+    """
+    name_filter_l = (name_filter or "").strip().lower()
+
+    with open(csv_path, "r", encoding="utf-8", errors="ignore") as f:
+        lines = [ln.rstrip("\n") for ln in f]
+
+    # ---- Locate sections + collect "signals_list" from Groups: ----
+    data_idx = None
+    groups_idx = None
+
+    for i, ln in enumerate(lines):
+        s = ln.strip().lower()
+        if s == "groups:":
+            groups_idx = i
+        if s == "data:":
+            data_idx = i
+            break  # important: stop scanning header sections once Data: starts
+
+    if data_idx is None:
+        raise ValueError("Not a Quartus SignalTap CSV: missing 'Data:' section.")
+    if data_idx + 1 >= len(lines):
+        raise ValueError("STP CSV is missing header row after 'Data:' section.")
+
+    # signals_list: set of signal names defined in Groups section
+    signals_list = set()
+    if groups_idx is not None:
+        # Between "Groups:" and "Data:" there are lines like:
+        #   some_signal_name=...
+        # We only take the left side of '='
+        for ln in lines[groups_idx + 1: data_idx]:
+            if "=" not in ln:
+                continue
+            left = ln.split("=", 1)[0].strip()
+            if left:
+                signals_list.add(left)
+
+    # ---- Parse Data header row ----
+    header_all = [t.strip() for t in lines[data_idx + 1].split(",") if t.strip() != ""]
+    if len(header_all) < 2:
+        raise ValueError("STP CSV header is too short.")
+
+    # First column is time; remaining are signal columns
+    sig_names_all = header_all[1:]
+
+    # Apply signals_list filter ONLY if we actually found any signals in Groups:
+    if signals_list:
+        sig_names = [n for n in sig_names_all if n in signals_list]
+    else:
+        sig_names = sig_names_all
+
+    if not sig_names:
+        raise ValueError("No matching STP signals found (after applying signals_list filter).")
+
+    cols = {name: [] for name in sig_names}
+
+    # ---- Parse data rows ----
+    # We need mapping from name -> original column index in the CSV row
+    name_to_col = {name: (1 + sig_names_all.index(name)) for name in sig_names}
+
+    for ln in lines[data_idx + 2:]:
+        if not ln.strip():
+            continue
+        toks = [t.strip() for t in ln.split(",")]
+        if len(toks) < 2:
+            continue
+
+        # For safety: pad rows
+        need = 1 + len(sig_names_all)
+        if len(toks) < need:
+            toks += [""] * (need - len(toks))
+
+        for name, col_idx in name_to_col.items():
+            v = toks[col_idx].strip() if col_idx < len(toks) else ""
+            if v == "":
+                v = "X"
+            cols[name].append(v)
+
+    def split_on_x(samples):
+        segs, curr = [], []
+        for v in samples:
+            if str(v).strip().upper() == "X":
+                if curr:
+                    segs.append(curr)
+                    curr = []
+            else:
+                curr.append(v)
+        if curr:
+            segs.append(curr)
+        return segs
+
+    db = {}
+    for idx, name in enumerate(sig_names):
+        if name_filter_l and name_filter_l not in name.lower():
+            continue
+
+        segs = split_on_x(cols.get(name, []))
+        if not segs:
+            continue
+
+        if len(segs) == 1:
+            db[name] = {"idx": idx, "samples": segs[0]}
+        else:
+            for k, seg in enumerate(segs):
+                db[f"{name}__seg{k}"] = {"idx": idx, "samples": seg}
+
+    return db
+
+
 def _find_packet_ranges(n: int, sop_samples=None, eop_samples=None):
     """Return list of (start, end_exclusive) ranges for all packets found."""
-    sop_samples = sop_samples or []
-    eop_samples = eop_samples or []
+    if sop_samples is None:
+        sop_samples = []
+    if eop_samples is None:
+        eop_samples = []
 
     ranges = []
     i = 0
@@ -402,7 +2421,7 @@ def _find_packet_ranges(n: int, sop_samples=None, eop_samples=None):
         start = i
 
         # If SOP is provided, packet starts at next sop==1
-        if sop_samples:
+        if len(sop_samples):
             found = False
             for k in range(i, n):
                 if sample_is_valid(sop_samples[k]):
@@ -414,7 +2433,7 @@ def _find_packet_ranges(n: int, sop_samples=None, eop_samples=None):
 
         # End is next eop==1 after start (inclusive), else end of trace
         end = n
-        if eop_samples:
+        if len(eop_samples):
             for k in range(start, n):
                 if sample_is_valid(eop_samples[k]):
                     end = k + 1
@@ -427,12 +2446,46 @@ def _find_packet_ranges(n: int, sop_samples=None, eop_samples=None):
         i = end
 
         # No SOP/EOP => single range
-        if not sop_samples and not eop_samples:
+        if not len(sop_samples) and not len(eop_samples):
             break
 
     return ranges
 
 
+@profiled("filter.packet_ranges", items=lambda r, n, *a, **k: n)
+def _find_packet_ranges_fast(n: int, sop_samples=None, eop_samples=None):
+    """
+    Same ranges as _find_packet_ranges(), but SOP/EOP are classified once
+    with valid_mask() and packet boundaries are found with searchsorted.
+    """
+    sop_pos = np.flatnonzero(valid_mask(sop_samples[:n])) if sop_samples is not None and len(sop_samples) else None
+    eop_pos = np.flatnonzero(valid_mask(eop_samples[:n])) if eop_samples is not None and len(eop_samples) else None
+
+    if sop_pos is None and eop_pos is None:
+        return [(0, n)] if n > 0 else []
+
+    ranges = []
+    i = 0
+    while i < n:
+        start = i
+        if sop_pos is not None:
+            k = np.searchsorted(sop_pos, i)
+            if k >= sop_pos.size:
+                break
+            start = int(sop_pos[k])
+
+        end = n
+        if eop_pos is not None:
+            k = np.searchsorted(eop_pos, start)
+            if k < eop_pos.size:
+                end = int(eop_pos[k]) + 1
+
+        ranges.append((start, end))
+        i = end
+
+    return ranges
+
+
 def filter_data_all_packets(samples, valid_samples=None, sop_samples=None, eop_samples=None):
     """Concatenate all packets into one list, optionally filtering by VALID within each packet."""
     n = len(samples)
@@ -443,7 +2496,7 @@ def filter_data_all_packets(samples, valid_samples=None, sop_samples=None, eop_s
     out = []
 
     for start, end in ranges:
-        if valid_samples:
+        if valid_samples is not None and len(valid_samples):
             for i in range(start, min(end, n)):
                 if sample_is_valid(valid_samples[i]):
                     out.append(samples[i])
@@ -463,7 +2516,7 @@ def filter_data_packets_list(samples, valid_samples=None, sop_samples=None, eop_
     packets = []
 
     for start, end in ranges:
-        if valid_samples:
+        if valid_samples is not None and len(valid_samples):
             pkt = []
             for i in range(start, min(end, n)):
                 if sample_is_valid(valid_samples[i]):
@@ -472,7 +2525,289 @@ def filter_data_packets_list(samples, valid_samples=None, sop_samples=None, eop_
                 packets.append(pkt)
         else:
             pkt = samples[start:min(end, n)]
-            if pkt:
+            if len(pkt):
                 packets.append(list(pkt))
 
     return packets
+
+
+@profiled("filter.packet_index", items=lambda r, n, *a, **k: n)
+def build_packet_index(n, valid_samples=None, sop_samples=None, eop_samples=None):
+    """
+    Compute the sample indices kept by the VALID/SOP/EOP filters once, so the
+    same masks can be applied to many signals of length n.
+    Returns a list of np.int64 index arrays, one per non-empty packet.
+    Taking them from a signal gives filter_data_packets_list(); concatenated,
+    filter_data_all_packets().
+    """
+    if n == 0:
+        return []
+
+    ranges = _find_packet_ranges_fast(n, sop_samples=sop_samples, eop_samples=eop_samples)
+    keep = None
+    if valid_samples is not None and len(valid_samples):
+        keep = valid_mask(valid_samples)
+
+    packets = []
+    for start, end in ranges:
+        end = min(end, n)
+        idx = np.arange(start, end, dtype=np.int64)
+        if keep is not None:
+            idx = idx[keep[start:end]]
+        if idx.size:
+            packets.append(idx)
+    return packets
+
+
+def take_samples(samples, idx):
+    """Pick samples[idx] from a list (or array) of raw samples."""
+    if isinstance(samples, np.ndarray):
+        return samples[idx]
+    return [samples[i] for i in idx.tolist()]
+
+
+def concat_packets(packets):
+    """
+    Flatten a list of packets into one list plus packet offsets.
+    Packet k is flat[offsets[k]:offsets[k + 1]].
+    """
+    offsets = np.zeros(len(packets) + 1, dtype=np.int64)
+    if packets:
+        offsets[1:] = np.cumsum([len(p) for p in packets])
+
+    flat = []
+    for pkt in packets:
+        flat.extend(pkt)
+    return flat, offsets
+
+
+def split_packets(arr, offsets, scale=1):
+    """
+    Split a flat array back into packets using offsets from concat_packets.
+    scale: output samples per input sample (e.g. data_par, x2 for even/odd).
+    Returns views into 'arr' (no copies).
+    """
+    arr = np.asarray(arr)
+    bounds = np.asarray(offsets, dtype=np.int64) * int(scale)
+    return [arr[bounds[k]:bounds[k + 1]] for k in range(len(bounds) - 1)]
+
+
+def combine_lanes(lanes, mode):
+    """
+    Combine N equal-length lanes into one stream (preallocated, strided scatter).
+    mode 'eo'  : interleave, lane k -> out[k::N] (Even/Odd for N=2)
+    mode 'ri'  : lanes are (re0, im0, re1, im1, ...); each pair becomes one
+                 complex lane, complex lanes are then interleaved
+                 (arr1 + 1j*arr2 for N=2)
+    mode 'poly': undo a polyphase commutator split, lane k = x delayed by k
+                 then decimated by N: lane_k[i] = x[i*N - k]. Lane k > 0 starts
+                 with a delay-line sample from before x[0], which is dropped;
+                 returns x[0 .. (n-1)*N] ((n-1)*N + 1 samples).
+    """
+    lanes = [np.asarray(l) for l in lanes]
+    if not lanes:
+        raise ValueError("No lanes to combine.")
+
+    n = lanes[0].shape[0]
+    if any(l.ndim != 1 or l.shape[0] != n for l in lanes):
+        raise ValueError("Signals to combine must have the same length.")
+
+    if mode == "ri":
+        if len(lanes) % 2:
+            raise ValueError("Real/Imag combine needs an even number of lanes.")
+        re_lanes, im_lanes = lanes[0::2], lanes[1::2]
+        out = np.empty((n, len(re_lanes)), dtype=np.result_type(*lanes, 1j))
+        for k, (a, b) in enumerate(zip(re_lanes, im_lanes)):
+            if np.iscomplexobj(a) or np.iscomplexobj(b):
+                out[:, k] = a + 1j * b
+            else:
+                out.real[:, k] = a
+                out.imag[:, k] = b
+        return out.reshape(-1)
+
+    if mode == "poly":
+        N = len(lanes)
+        if n == 0:
+            return np.empty(0, dtype=np.result_type(*lanes))
+        out = np.empty((n, N), dtype=np.result_type(*lanes))
+        out[:, 0] = lanes[0]
+        for k in range(1, N):
+            out[:-1, N - k] = lanes[k][1:]  # x[(i+1)*N - k] = lane_k[i+1]
+        return out.reshape(-1)[:(n - 1) * N + 1]
+    if mode != "eo":
+        raise ValueError(f"Unknown combine mode '{mode}'.")
+
+    out = np.empty((n, len(lanes)), dtype=np.result_type(*lanes))
+    for k, lane in enumerate(lanes):
+        out[:, k] = lane
+    return out.reshape(-1)
+
+
+def lanes_from_converted(db_conv, names, data_par, data_par_mode):
+    """
+    Collect combine lanes from a convert_db() result.
+    Serial: one lane per signal.
+    Parallel, one signal: its data_par lanes (sig_0 .. sig_{P-1}).
+    Parallel, several signals: each signal's lanes are first reassembled
+    into one stream (same order as serial unpacking), one lane per signal.
+    """
+    if data_par_mode != "parallel":
+        return [db_conv[name]["samples"] for name in names]
+
+    per_sig = [[db_conv[f"{name}_{i}"]["samples"] for i in range(data_par)] for name in names]
+    if len(per_sig) == 1:
+        return per_sig[0]
+    return [combine_lanes(lanes, "eo") for lanes in per_sig]
+
+
+# ---------- Conversion plans ---------- #
+
+_PLAN_TYPES = {"fixed": "1", "float": "2", "as-is": "3", "layout": "4"}
+
+
+def compile_conversion_plan(rules, base_dir=None):
+    """
+    Validate a conversion plan and compile it for convert_batch().
+
+    rules (JSON-compatible list, first match wins):
+        [
+          {"name": "top/ila_0/data_0[63:0]", "type": "fixed", "prec": [1, 0, 15]},
+          {"match": "*adc_i*", "type": "fixed", "prec": [1, 0, 15],
+           "complex": false, "data_par": 4, "mode": "serial"},
+          {"match": "*iq_pack*", "type": "float", "prec": [6, 13]},
+          {"match": "*status*", "type": "layout", "layout": "status_layout.json"}
+        ]
+    'name' is an exact full or short signal name (bus brackets are literal);
+    'match' is a glob tested against the full and the short signal name.
+    Exact 'name' rules are tried before any 'match' glob.
+    'layout' is an inline layout dict or a JSON path (relative to base_dir).
+    """
+    if not isinstance(rules, list):
+        raise ValueError("Conversion plan must be a JSON list of rules.")
+
+    compiled = []
+    for k, rule in enumerate(rules):
+        if not isinstance(rule, dict):
+            raise ValueError(f"Plan rule {k}: must be an object.")
+        exact = str(rule.get("name", "")).strip()
+        pattern = str(rule.get("match", "")).strip()
+        if not exact and not pattern:
+            raise ValueError(f"Plan rule {k}: 'name' or 'match' is required.")
+
+        type_name = str(rule.get("type", "fixed")).strip().lower()
+        if type_name not in _PLAN_TYPES:
+            raise ValueError(f"Plan rule {k}: unknown type '{type_name}'.")
+        data_type = _PLAN_TYPES[type_name]
+
+        if data_type == "4":
+            layout = rule.get("layout")
+            if isinstance(layout, str):
+                path = Path(layout)
+                if base_dir is not None and not path.is_absolute():
+                    path = Path(base_dir) / path
+                data_prec = load_bit_layout(path)
+            else:
+                data_prec = compile_bit_layout(layout)
+        elif data_type == "3":
+            data_prec = []
+        else:
+            try:
+                data_prec = [int(v) for v in rule.get("prec", [])]
+            except (TypeError, ValueError):
+                raise ValueError(f"Plan rule {k}: 'prec' must be a list of integers.")
+            need = 3 if data_type == "1" else 2
+            if len(data_prec) != need:
+                raise ValueError(f"Plan rule {k}: '{type_name}' needs {need} precision values.")
+
+        mode = str(rule.get("mode", "serial")).strip().lower()
+        if mode not in ("serial", "parallel"):
+            raise ValueError(f"Plan rule {k}: mode must be 'serial' or 'parallel'.")
+
+        if exact:
+            matcher = exact.__eq__
+        else:
+            matcher = compile_name_filter(pattern, "glob")
+
+        compiled.append({
+            "match": matcher,
+            "exact": bool(exact),
+            "data_type": data_type,
+            "data_prec": data_prec,
+            "data_complex": "y" if (data_type == "1" and rule.get("complex", False)) else "n",
+            "data_par": max(1, int(rule.get("data_par", 1))),
+            "data_par_mode": mode,
+            "rule": rule,
+        })
+
+    # Per-signal rules win over broad globs, whatever their position in the file
+    compiled.sort(key=lambda r: not r["exact"])
+    return compiled
+
+
+def load_conversion_plan(path):
+    """Read a conversion plan JSON file. Returns (rules, compiled_plan)."""
+    with open(path, "r", encoding="utf-8") as f:
+        rules = json.load(f)
+    return rules, compile_conversion_plan(rules, base_dir=Path(path).parent)
+
+
+def save_conversion_plan(rules, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rules, f, indent=2)
+
+
+def resolve_conversion_plan(compiled, names):
+    """Map each signal name to its first matching compiled rule (unmatched names are skipped)."""
+    out = {}
+    for name in names:
+        short = Path(name.replace("\\", "/")).name
+        for rule in compiled:
+            if rule["match"](name) or rule["match"](short):
+                out[name] = rule
+                break
+    return out
+
+
+@profiled("convert_batch", items=lambda r, db_in, *a, **k: db_sample_count(db_in))
+def convert_batch(db_in, assignments, max_workers=None, cache=None):
+    """
+    Convert many signals, each with its own rule, as one batched job.
+    db_in: {sig_name: {"samples": [...]}}
+    assignments: {sig_name: compiled rule}, keys of db_in may carry a
+                 '__pktK' suffix of the assigned name.
+    Signals are decoded concurrently (NumPy releases the GIL in the heavy
+    array passes); the result keeps db_in order.
+    """
+    def _rule_for(sig):
+        rule = assignments.get(sig)
+        if rule is None and "__pkt" in sig:
+            rule = assignments.get(sig.rsplit("__pkt", 1)[0])
+        return rule
+
+    def _one(item):
+        sig, info = item
+        rule = _rule_for(sig)
+        if rule is None:
+            return {}
+        return convert_db(
+            {sig: info},
+            rule["data_type"],
+            rule["data_prec"],
+            rule["data_complex"],
+            rule["data_par"],
+            rule["data_par_mode"],
+            cache=cache,
+        )
+
+    items = list(db_in.items())
+    workers = max_workers or min(len(items), os.cpu_count() or 1) or 1
+
+    db_out = {}
+    if workers <= 1:
+        results = map(_one, items)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_one, items))
+    for part in results:
+        db_out.update(part)
+    return db_out
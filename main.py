@@ -1,8 +1,13 @@
+import time
+
+_T_START = time.perf_counter()  # before the app's own imports (startup-time mode)
+
+import importlib
+import sys
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog, messagebox
 
-from CSV_parser import CSVParserTab
-from DSP_lab import DSPLabMatTab
+from helper_funcs import PROFILER, SignalRegistry, shared_memory_budget
 
 class MainApp(tk.Tk):
     def __init__(self):
@@ -11,18 +16,154 @@ class MainApp(tk.Tk):
         self._build_ui()
 
     def _build_ui(self):
-        notebook = ttk.Notebook(self)
-        notebook.pack(fill="both", expand=True)
+        self._build_status_bar()
+
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill="both", expand=True)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        self.tabs = {}        # title -> built tab widget
+        self._tab_specs = {}  # host frame name -> (title, factory, kwargs)
+
+        # One registry: converted ILA/STP arrays reach the DSP chain by reference
+        self.registry = SignalRegistry(budget=shared_memory_budget())
+
+        self.register_tab("CSV Parser", "CSV_parser:CSVParserTab", registry=self.registry)
+        self.register_tab("DSP-MAT-Lab", "DSP_lab:DSPLabMatTab", registry=self.registry)
+        self.register_tab("ILA CSV Parser", "ILA_CSV_parser:ILACSVParserTab")
+
+        # Cold start builds only the visible tab
+        self._build_tab(self.notebook.select())
+
+    # --- Lazy tabs ---
+
+    def register_tab(self, title, factory, **kwargs):
+        """
+        Add a notebook tab that is built the first time it is selected.
+        factory(parent, **kwargs) creates the tab widget; a "module:Class"
+        string also defers importing the module until then.
+        """
+        host = ttk.Frame(self.notebook)
+        self.notebook.add(host, text=title)
+        self._tab_specs[str(host)] = (title, factory, kwargs)
+        return host
+
+    def get_tab(self, title):
+        """The tab widget registered under title, building it if needed."""
+        if title not in self.tabs:
+            for host, spec in list(self._tab_specs.items()):
+                if spec[0] == title:
+                    if not self._build_tab(host):
+                        raise RuntimeError(f"Tab '{title}' could not be built.")
+                    break
+            else:
+                raise KeyError(title)
+        return self.tabs[title]
+
+    def _on_tab_changed(self, event=None):
+        self._build_tab(self.notebook.select())
+
+    def _build_tab(self, host):
+        """Build a registered tab; on failure its spec stays so reselecting retries."""
+        spec = self._tab_specs.get(str(host))
+        if spec is None:
+            return True  # already built (or no tab selected)
+        title, factory, kwargs = spec
+        parent = self.nametowidget(host)
+        try:
+            with PROFILER.span(f"app.build_tab:{title}"):
+                if isinstance(factory, str):
+                    module_name, _, attr = factory.partition(":")
+                    factory = getattr(importlib.import_module(module_name), attr)
+                tab = factory(parent, **kwargs)
+                tab.pack(fill="both", expand=True)
+        except Exception as e:
+            for child in parent.winfo_children():  # drop a half-built tab
+                child.destroy()
+            messagebox.showerror("Error", f"Failed to build the '{title}' tab:\n{e}")
+            return False
+        del self._tab_specs[str(host)]
+        self.tabs[title] = tab
+        return True
+
+    # --- Profiling status bar ---
+
+    PROFILE_POLL_MS = 500
+
+    def _build_status_bar(self):
+        """Bottom bar: profiling switches + per-operation timing summary."""
+        self.profile_var = tk.BooleanVar(value=False)
+        self.profile_mem_var = tk.BooleanVar(value=False)
+        self.profile_status_var = tk.StringVar(value="")
+        self._profile_seen = None
+
+        bar = ttk.Frame(self)
+        bar.pack(side="bottom", fill="x", padx=5, pady=(0, 3))
+        ttk.Checkbutton(bar, text="Profile", variable=self.profile_var,
+                        command=self._on_profile_toggle).pack(side="left")
+        ttk.Checkbutton(bar, text="Track memory", variable=self.profile_mem_var,
+                        command=self._on_profile_toggle).pack(side="left", padx=(4, 0))
+        ttk.Button(bar, text="Reset", command=PROFILER.reset).pack(side="left", padx=(8, 0))
+        ttk.Button(bar, text="Save trace…", command=self._save_profile_trace).pack(side="left", padx=(4, 0))
+        ttk.Label(bar, textvariable=self.profile_status_var).pack(side="left", padx=(8, 0))
+
+    def _on_profile_toggle(self):
+        if self.profile_var.get():
+            PROFILER.enable(track_memory=self.profile_mem_var.get())
+            self._poll_profile()
+        else:
+            PROFILER.disable()
+
+    def _poll_profile(self):
+        if PROFILER.version != self._profile_seen:
+            self._profile_seen = PROFILER.version
+            self.profile_status_var.set(PROFILER.summary_text())
+        if PROFILER.enabled:
+            self.after(self.PROFILE_POLL_MS, self._poll_profile)
+
+    def _save_profile_trace(self):
+        if not PROFILER.events:
+            messagebox.showinfo("Profile", "No profiled operations yet. Enable Profile and run something.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save Chrome trace",
+            defaultextension=".json",
+            filetypes=[("Chrome trace", "*.json"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            PROFILER.dump_chrome_trace(path)
+        except OSError as e:
+            messagebox.showerror("Profile", f"Failed to write trace:\n{e}")
+
+
+# Imported on demand; startup-time mode reports any that were loaded up front
+HEAVY_MODULES = ("matplotlib", "scipy", "h5py")
 
-        self.csv_tab = CSVParserTab(notebook)
-        self.dsp_mat_tab = DSPLabMatTab(notebook)
 
-        notebook.add(self.csv_tab, text="CSV Parser")
-        notebook.add(self.dsp_mat_tab, text="DSP-MAT-Lab")
+def report_startup(app, t_imported, t_built):
+    """Print where startup time went (python main.py --startup-time)."""
+    app.update()  # map and draw the window once
+    t_drawn = time.perf_counter()
+    loaded = [m for m in HEAVY_MODULES if m in sys.modules]
+    print(
+        f"startup: imports {t_imported - _T_START:.3f} s, "
+        f"build UI {t_built - t_imported:.3f} s, "
+        f"first draw {t_drawn - t_built:.3f} s, "
+        f"total {t_drawn - _T_START:.3f} s"
+    )
+    print(f"tabs built at startup: {', '.join(app.tabs)}")
+    print(f"heavy modules loaded at startup: {', '.join(loaded) if loaded else 'none'}")
 
 
 def main():
+    t_imported = time.perf_counter()
     app = MainApp()
+    if "--startup-time" in sys.argv[1:]:
+        report_startup(app, t_imported, time.perf_counter())
+        app.destroy()
+        return
     app.mainloop()
 
 if __name__ == "__main__":
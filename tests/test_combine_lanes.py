@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from helper_funcs import combine_lanes
+
+
+def polyphase_split(x, N):
+    """Commutator split: lane k is x delayed by k samples, decimated by N."""
+    return [np.concatenate((np.zeros(k), x))[:x.size][::N] for k in range(N)]
+
+
+@pytest.mark.parametrize("N", [2, 3, 4, 8, 16])
+def test_eo_interleaves_lane_k_into_k_step_n(N):
+    lanes = [np.arange(5) * 100 + k for k in range(N)]
+    out = combine_lanes(lanes, "eo")
+    assert out.size == 5 * N
+    for k in range(N):
+        assert np.array_equal(out[k::N], lanes[k])
+
+
+def test_eo_two_lanes_matches_even_odd():
+    out = combine_lanes([np.array([0, 2, 4]), np.array([1, 3, 5])], "eo")
+    assert np.array_equal(out, np.arange(6))
+
+
+def test_ri_pairs_real_and_imag():
+    re, im = np.array([1.0, 2.0]), np.array([3.0, 4.0])
+    assert np.array_equal(combine_lanes([re, im], "ri"), re + 1j * im)
+
+
+def test_ri_four_lanes_interleaves_complex_pairs():
+    a, b, c, d = (np.arange(3, dtype=float) + off for off in (0, 10, 20, 30))
+    out = combine_lanes([a, b, c, d], "ri")
+    assert np.array_equal(out[0::2], a + 1j * b)
+    assert np.array_equal(out[1::2], c + 1j * d)
+
+
+def test_ri_with_complex_lane_adds_rotated_imag():
+    a = np.array([1 + 1j, 2 + 0j])
+    b = np.array([1.0, -1.0])
+    assert np.allclose(combine_lanes([a, b], "ri"), a + 1j * b)
+
+
+def test_ri_needs_even_lane_count():
+    with pytest.raises(ValueError):
+        combine_lanes([np.zeros(3)] * 3, "ri")
+
+
+@pytest.mark.parametrize("N", [2, 3, 4, 8])
+@pytest.mark.parametrize("n", [1, 2, 7, 64])
+def test_poly_inverts_commutator_split(N, n):
+    x = np.random.default_rng(N * 100 + n).standard_normal(n * N)
+    out = combine_lanes(polyphase_split(x, N), "poly")
+    assert out.size == (n - 1) * N + 1
+    assert np.array_equal(out, x[:out.size])
+
+
+def test_poly_differs_from_reversed_interleave():
+    x = np.arange(12.0)
+    lanes = polyphase_split(x, 3)
+    assert not np.array_equal(combine_lanes(lanes, "poly"), combine_lanes(lanes[::-1], "eo")[:10])
+
+
+@pytest.mark.parametrize("mode", ["eo", "ri", "poly"])
+def test_empty_lanes_give_empty_output(mode):
+    out = combine_lanes([np.zeros(0), np.zeros(0)], mode)
+    assert out.size == 0
+
+
+def test_dtype_promotes_across_lanes():
+    out = combine_lanes([np.array([1, 2], dtype=np.int16), np.array([0.5, 1.5])], "eo")
+    assert out.dtype == np.float64
+    assert np.array_equal(out, [1.0, 0.5, 2.0, 1.5])
+
+
+def test_unequal_lengths_rejected():
+    with pytest.raises(ValueError):
+        combine_lanes([np.zeros(3), np.zeros(4)], "eo")
+
+
+def test_no_lanes_rejected():
+    with pytest.raises(ValueError):
+        combine_lanes([], "eo")
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        combine_lanes([np.zeros(2), np.zeros(2)], "zigzag")
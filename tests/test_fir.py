@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+import helper_funcs
+from helper_funcs import FirDesign, FirResampler, ola_convolve, stream_whole
+
+
+def reference_fir(x, h, L, M, mode):
+    """Zero-stuff by L, convolve, keep every M-th output (the pre-polyphase path)."""
+    up = np.zeros(x.size * L, dtype=x.dtype)
+    up[::L] = x
+    return np.convolve(up, h, mode=mode)[::M]
+
+
+def run_blocks(res, x, sizes):
+    parts, a = [], 0
+    for size in sizes:
+        parts.append(res.process(x[a:a + size]))
+        a += size
+    parts.append(res.process(x[a:]))
+    parts.append(res.flush())
+    return np.concatenate(parts)
+
+
+@pytest.mark.parametrize("n_taps", [1, 5, 31, 96])  # 96 taps reach the overlap-add path
+@pytest.mark.parametrize("L,M", [(1, 1), (1, 3), (4, 1), (3, 2), (2, 5)])
+@pytest.mark.parametrize("mode", ["same", "full"])
+def test_resampler_matches_zero_stuffed_convolution(n_taps, L, M, mode):
+    rng = np.random.default_rng(n_taps * 31 + L * 7 + M)
+    x = rng.standard_normal(500)
+    h = rng.standard_normal(n_taps)
+    res = FirResampler(h, L, M, n_in=x.size, mode=mode)
+    y = stream_whole(res, x)
+    ref = reference_fir(x, h, L, M, mode)
+    assert y.size == res.n_out == ref.size
+    assert np.allclose(y, ref, atol=1e-9)
+
+
+@pytest.mark.parametrize("sizes", [[1] * 40, [7, 13, 1, 64], [0, 0, 250], [499]])
+@pytest.mark.parametrize("L,M", [(1, 1), (3, 2), (1, 4)])
+def test_block_boundaries_do_not_change_the_output(sizes, L, M):
+    rng = np.random.default_rng(len(sizes) + L * M)
+    x = rng.standard_normal(500)
+    h = rng.standard_normal(80)
+    whole = stream_whole(FirResampler(h, L, M, n_in=x.size), x)
+    blocked = run_blocks(FirResampler(h, L, M, n_in=x.size), x, sizes)
+    assert np.allclose(blocked, whole, atol=1e-9)
+
+
+@pytest.mark.parametrize("n", [1, 2, 9])
+@pytest.mark.parametrize("mode", ["same", "full"])
+def test_input_shorter_than_filter(n, mode):
+    x = np.arange(1.0, n + 1)
+    h = np.linspace(-1, 1, 21)
+    y = stream_whole(FirResampler(h, 2, 3, n_in=n, mode=mode), x)
+    assert np.allclose(y, reference_fir(x, h, 2, 3, mode))
+
+
+def test_empty_input_gives_no_output():
+    res = FirResampler(np.ones(5), 2, 1, n_in=0)
+    assert res.n_out == 0
+    assert stream_whole(res, np.zeros(0)).size == 0
+
+
+def test_complex_input():
+    rng = np.random.default_rng(3)
+    x = rng.standard_normal(300) + 1j * rng.standard_normal(300)
+    h = rng.standard_normal(70)
+    y = stream_whole(FirResampler(h, 2, 3, n_in=x.size), x)
+    assert np.allclose(y, reference_fir(x, h, 2, 3, "same"))
+
+
+def test_shared_design_gives_same_result():
+    rng = np.random.default_rng(4)
+    x, h = rng.standard_normal(400), rng.standard_normal(100)
+    design = FirDesign(h)
+    first = stream_whole(FirResampler(design, 3, 2, n_in=x.size), x)
+    second = stream_whole(FirResampler(design, 3, 2, n_in=x.size), x)
+    assert np.array_equal(first, second)
+    assert np.allclose(first, reference_fir(x, h, 3, 2, "same"))
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError):
+        FirResampler(np.ones(3), mode="valid")
+
+
+@pytest.mark.parametrize("nx,nh", [(1, 1), (5, 40), (40, 5), (1000, 64), (4097, 129)])
+def test_ola_convolve_matches_np_convolve(nx, nh):
+    rng = np.random.default_rng(nx + nh)
+    x, h = rng.standard_normal(nx), rng.standard_normal(nh)
+    assert np.allclose(ola_convolve(x, h), np.convolve(x, h))
+
+
+def test_ola_convolve_small_fft_blocks():
+    # nfft close to the filter length forces many blocks and tail overlaps
+    rng = np.random.default_rng(5)
+    x, h = rng.standard_normal(1000), rng.standard_normal(33)
+    assert np.allclose(ola_convolve(x, h, nfft=64), np.convolve(x, h))
+
+
+def test_ola_convolve_complex_and_empty():
+    rng = np.random.default_rng(6)
+    x = rng.standard_normal(200) + 1j * rng.standard_normal(200)
+    h = rng.standard_normal(17)
+    assert np.allclose(ola_convolve(x, h), np.convolve(x, h))
+    assert ola_convolve(np.zeros(0), h).size == 0
+
+
+def test_fft_threshold_switch_is_transparent(monkeypatch):
+    rng = np.random.default_rng(7)
+    x, h = rng.standard_normal(600), rng.standard_normal(70)
+    monkeypatch.setattr(helper_funcs, "FIR_FFT_TAPS", 10**9)  # direct convolution only
+    direct = stream_whole(FirResampler(h, 2, 3, n_in=x.size), x)
+    monkeypatch.setattr(helper_funcs, "FIR_FFT_TAPS", 2)      # FFT for every sub-filter
+    fft = stream_whole(FirResampler(h, 2, 3, n_in=x.size), x)
+    assert np.allclose(direct, fft, atol=1e-9)
@@ -0,0 +1,70 @@
+import threading
+
+import numpy as np
+import pytest
+
+from helper_funcs import Profiler
+
+
+@pytest.fixture
+def profiler():
+    prof = Profiler()
+    prof.enable(track_memory=True)
+    yield prof
+    prof.disable()
+
+
+def _events(prof, name):
+    return [ev for ev in prof.events if ev[0] == name]
+
+
+def test_worker_span_does_not_reset_main_thread_peak(profiler):
+    def worker():
+        with profiler.span("worker"):
+            np.ones(1000)
+
+    with profiler.span("main"):
+        big = np.ones(8 * 2**20 // 8)  # 8 MB, freed before the worker runs
+        del big
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+    (main,) = _events(profiler, "main")
+    assert main[4] >= 8 * 2**20
+
+
+def test_worker_spans_record_no_peak(profiler):
+    def worker():
+        with profiler.span("worker"):
+            np.ones(1000)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    workers = _events(profiler, "worker")
+    assert len(workers) == 2
+    assert all(ev[4] is None for ev in workers)
+
+
+def test_nested_main_thread_spans_keep_parent_peak(profiler):
+    with profiler.span("outer"):
+        with profiler.span("inner"):
+            big = np.ones(4 * 2**20 // 8)
+            del big
+        np.ones(10)
+
+    (outer,) = _events(profiler, "outer")
+    (inner,) = _events(profiler, "inner")
+    assert inner[4] >= 4 * 2**20
+    assert outer[4] >= inner[4]
+
+
+def test_disabled_profiler_records_nothing():
+    prof = Profiler()
+    with prof.span("off") as sp:
+        sp.items = 3
+    assert prof.events == []
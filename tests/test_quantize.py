@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from helper_funcs import quantize
+
+TIES = np.array([-2.5, -1.5, -0.5, 0.5, 1.5, 2.5])
+
+
+@pytest.mark.parametrize("rounding,expected", [
+    ("nearest", [-2, -1, 0, 1, 2, 3]),        # half up
+    ("round", [-3, -2, -1, 1, 2, 3]),         # half away from zero
+    ("convergent", [-2, -2, 0, 0, 2, 2]),     # half to even
+    ("floor", [-3, -2, -1, 0, 1, 2]),
+    ("fix", [-2, -1, 0, 0, 1, 2]),            # toward zero
+])
+def test_rounding_modes_on_ties(rounding, expected):
+    out = quantize(TIES, (1, 4, 0), rounding=rounding)
+    assert np.array_equal(out, expected)
+
+
+def test_convergent_ties_on_fractional_grid():
+    # n = 2: the grid is 0.25, so 0.125 / 0.375 are ties
+    out = quantize(np.array([0.125, 0.375, -0.125, -0.375]), (1, 2, 2), rounding="convergent")
+    assert np.array_equal(out, [0.0, 0.5, 0.0, -0.5])
+
+
+def test_non_ties_agree_across_rounding_modes():
+    x = np.array([0.3, 0.7, -0.3, -0.7])
+    for rounding in ("nearest", "round", "convergent"):
+        assert np.array_equal(quantize(x, (1, 2, 0), rounding=rounding), [0, 1, 0, -1])
+
+
+@pytest.mark.parametrize("x,saturate,wrap", [
+    (7.0, 7, 7),
+    (8.0, 7, -8),
+    (9.0, 7, -7),
+    (-8.0, -8, -8),
+    (-9.0, -8, 7),
+    (23.0, 7, 7),
+])
+def test_signed_overflow(x, saturate, wrap):
+    prec = (1, 3, 0)  # range [-8, 7]
+    assert quantize(np.array([x]), prec, overflow="saturate")[0] == saturate
+    assert quantize(np.array([x]), prec, overflow="wrap")[0] == wrap
+
+
+@pytest.mark.parametrize("x,saturate,wrap", [
+    (15.0, 15, 15),
+    (16.0, 15, 0),
+    (-1.0, 0, 15),
+])
+def test_unsigned_overflow(x, saturate, wrap):
+    prec = (0, 4, 0)  # range [0, 15]
+    assert quantize(np.array([x]), prec, overflow="saturate")[0] == saturate
+    assert quantize(np.array([x]), prec, overflow="wrap")[0] == wrap
+
+
+def test_wrap_after_rounding_on_fractional_grid():
+    # s.m.n = 1.0.3: range [-1, 1 - 1/8]; 0.97 rounds to 1.0, which wraps to -1
+    assert quantize(np.array([0.97]), (1, 0, 3), overflow="wrap")[0] == -1.0
+    assert quantize(np.array([0.97]), (1, 0, 3), overflow="saturate")[0] == 0.875
+
+
+def test_complex_quantizes_each_part():
+    x = np.array([0.5 + 2.5j, 9.0 - 9.0j])
+    out = quantize(x, (1, 3, 0), rounding="convergent", overflow="wrap")
+    assert np.array_equal(out, [0 + 2j, -7 + 7j])
+
+
+def test_prec_dict_supplies_modes_and_arguments_override():
+    prec = {"s": 1, "m": 3, "n": 0, "round": "floor", "overflow": "wrap"}
+    assert quantize(np.array([8.9]), prec)[0] == -8
+    assert quantize(np.array([8.9]), prec, rounding="fix", overflow="saturate")[0] == 7
+
+
+def test_in_place_output():
+    x = np.array([0.26, -0.74])
+    out = quantize(x, (1, 1, 1), out=x)
+    assert out is x
+    assert np.array_equal(x, [0.5, -0.5])
+
+
+def test_empty_and_scalar_inputs():
+    assert quantize(np.zeros(0), (1, 3, 4)).size == 0
+    assert quantize(1.2, (1, 3, 1)) == 1.0
+
+
+def test_integer_input_returns_float64():
+    out = quantize(np.array([1, 200], dtype=np.int16), (1, 7, 0))
+    assert out.dtype == np.float64
+    assert np.array_equal(out, [1, 127])
+
+
+@pytest.mark.parametrize("kwargs", [{"rounding": "banker"}, {"overflow": "clip"}])
+def test_unknown_modes_rejected(kwargs):
+    with pytest.raises(ValueError):
+        quantize(np.zeros(2), (1, 3, 0), **kwargs)
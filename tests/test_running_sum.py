@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+import helper_funcs
+from helper_funcs import RunningSumFilter, stream_whole
+
+
+def reference_boxcar(x, w, stages, R, mode):
+    h = np.ones(1)
+    for _ in range(stages):
+        h = np.convolve(h, np.ones(w) / w)
+    return np.convolve(x, h, mode=mode)[::R]
+
+
+def run_blocks(filt, x, size):
+    parts = [filt.process(x[a:a + size]) for a in range(0, x.size, size)]
+    parts.append(filt.flush())
+    return np.concatenate(parts)
+
+
+@pytest.mark.parametrize("w", [1, 2, 5, 16])
+@pytest.mark.parametrize("stages,R", [(1, 1), (2, 1), (3, 4), (1, 5)])
+@pytest.mark.parametrize("mode", ["same", "full"])
+def test_matches_cascaded_boxcar_convolution(w, stages, R, mode):
+    x = np.random.default_rng(w * 10 + stages).standard_normal(300)
+    filt = RunningSumFilter(w, n_in=x.size, mode=mode, stages=stages, R=R)
+    y = stream_whole(filt, x)
+    ref = reference_boxcar(x, w, stages, R, mode)
+    assert y.size == filt.n_out == ref.size
+    assert np.allclose(y, ref)
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 299])
+def test_block_boundaries_do_not_change_the_output(size):
+    x = np.random.default_rng(size).standard_normal(300)
+    whole = stream_whole(RunningSumFilter(9, n_in=x.size, stages=2, R=3), x)
+    blocked = run_blocks(RunningSumFilter(9, n_in=x.size, stages=2, R=3), x, size)
+    assert np.allclose(blocked, whole)
+
+
+def test_cumulative_sum_restarts_inside_a_block(monkeypatch):
+    monkeypatch.setattr(helper_funcs._RunningSum, "SEGMENT", 16)
+    x = np.random.default_rng(1).standard_normal(200)
+    y = stream_whole(RunningSumFilter(7, n_in=x.size, stages=2), x)
+    assert np.allclose(y, reference_boxcar(x, 7, 2, 1, "same"))
+
+
+@pytest.mark.parametrize("n", [1, 2, 4])
+@pytest.mark.parametrize("mode", ["same", "full"])
+def test_input_shorter_than_window(n, mode):
+    x = np.arange(1.0, n + 1)
+    y = stream_whole(RunningSumFilter(6, n_in=n, mode=mode), x)
+    assert np.allclose(y, reference_boxcar(x, 6, 1, 1, mode))
+
+
+def test_empty_input_gives_no_output():
+    filt = RunningSumFilter(4, n_in=0)
+    assert filt.n_out == 0
+    assert stream_whole(filt, np.zeros(0)).size == 0
+
+
+def test_integer_input_is_exact():
+    x = np.full(1000, 2**40, dtype=np.int64)
+    y = stream_whole(RunningSumFilter(8, n_in=x.size, mode="full", stages=2), x)
+    assert np.array_equal(y[15:-15], np.full(y.size - 30, 2.0**40))
+
+
+def test_complex_input():
+    rng = np.random.default_rng(2)
+    x = rng.standard_normal(100) + 1j * rng.standard_normal(100)
+    y = stream_whole(RunningSumFilter(5, n_in=x.size, stages=2, R=2), x)
+    assert np.allclose(y, reference_boxcar(x, 5, 2, 2, "same"))
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError):
+        RunningSumFilter(3, mode="valid")